@@ -15,6 +15,9 @@ load_dotenv()
 from freeroad.infra.database import Base
 from freeroad.infra.models.user_model import UserModel
 from freeroad.infra.models.week_model import WeekModel
+from freeroad.infra.models.user_fuel_stats_model import UserFuelStatsModel
+from freeroad.infra.models.idempotency_key_model import IdempotencyKeyModel
+from freeroad.infra.models.week_tombstone_model import WeekTombstoneModel
 
 # Função para remover parâmetros SSL da URL e colocá-los em connect_args
 def parse_db_url(url):
@@ -0,0 +1,48 @@
+"""Indexes for per-user and global week listings
+
+Revision ID: 3b9f1c2a7d44
+Revises: d72149f16e50
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c2a7d44'
+down_revision: Union[str, Sequence[str], None] = 'd72149f16e50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação;
+    # evita bloquear escritas em weeks enquanto o índice é construído.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_weeks_user_id_created_at_id',
+            'weeks',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_weeks_created_at_id',
+            'weeks',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_weeks_created_at_id', table_name='weeks', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_weeks_user_id_created_at_id', table_name='weeks', postgresql_concurrently=True, if_exists=True)
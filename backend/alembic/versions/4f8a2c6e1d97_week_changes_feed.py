@@ -0,0 +1,50 @@
+"""Week changes feed: updated_at index and tombstones
+
+Revision ID: 4f8a2c6e1d97
+Revises: 9b6e4d1f3a85
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a2c6e1d97'
+down_revision: Union[str, Sequence[str], None] = '9b6e4d1f3a85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('week_tombstones',
+    sa.Column('id', sa.String(), nullable=False, comment='ID do registro removido'),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False, comment='Momento da remoção'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_week_tombstones_user_id_deleted_at_id', 'week_tombstones', ['user_id', 'deleted_at', 'id'], unique=False
+    )
+    # Mesmo cuidado de 3b9f1c2a7d44: sem bloquear escritas em weeks
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_weeks_user_id_updated_at_id',
+            'weeks',
+            ['user_id', 'updated_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_weeks_user_id_updated_at_id', table_name='weeks', postgresql_concurrently=True, if_exists=True)
+    op.drop_index('ix_week_tombstones_user_id_deleted_at_id', table_name='week_tombstones')
+    op.drop_table('week_tombstones')
@@ -0,0 +1,30 @@
+"""Version counter on user_fuel_stats for ETags
+
+Revision ID: 5e2a9d7c4b13
+Revises: 8c41e0d5b2f7
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9d7c4b13'
+down_revision: Union[str, Sequence[str], None] = '8c41e0d5b2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Começa em 1 para as linhas existentes: a versão 0 fica para "sem linha na rollup".
+    op.add_column('user_fuel_stats', sa.Column('versao', sa.Integer(), server_default='1', nullable=False, comment='Incrementada a cada escrita nos registros do usuário'))
+    op.alter_column('user_fuel_stats', 'versao', server_default='0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_fuel_stats', 'versao')
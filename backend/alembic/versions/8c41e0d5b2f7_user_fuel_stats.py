@@ -0,0 +1,61 @@
+"""Per-user fuel stats rollup
+
+Revision ID: 8c41e0d5b2f7
+Revises: 3b9f1c2a7d44
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e0d5b2f7'
+down_revision: Union[str, Sequence[str], None] = '3b9f1c2a7d44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_fuel_stats',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('registros', sa.Integer(), nullable=False, comment='Quantidade de registros'),
+    sa.Column('total_custo', sa.Numeric(precision=14, scale=2), nullable=False, comment='Soma dos custos'),
+    sa.Column('total_litros', sa.Numeric(precision=14, scale=3), nullable=False, comment='Soma dos litros'),
+    sa.Column('total_distancia', sa.Numeric(precision=14, scale=2), nullable=False, comment='Soma de km_final - km_atual dos registros fechados'),
+    sa.Column('eficiencia_registros', sa.Integer(), nullable=False, comment='Registros com eficiência calculada'),
+    sa.Column('eficiencia_soma', sa.Numeric(precision=14, scale=2), nullable=False, comment='Soma das eficiências'),
+    sa.Column('eficiencia_soma_quadrados', sa.Numeric(precision=20, scale=4), nullable=False, comment='Soma dos quadrados das eficiências'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # Backfill: mesma agregação de rebuild_fuel_stats, feita uma única vez aqui.
+    op.execute(
+        """
+        INSERT INTO user_fuel_stats (
+            user_id, registros, total_custo, total_litros, total_distancia,
+            eficiencia_registros, eficiencia_soma, eficiencia_soma_quadrados, updated_at
+        )
+        SELECT
+            user_id,
+            count(*),
+            coalesce(sum(custo), 0),
+            coalesce(sum(litros_abastecidos), 0),
+            coalesce(sum(CASE WHEN km_final > km_atual THEN km_final - km_atual ELSE 0 END), 0),
+            count(CASE WHEN eficiencia IS NOT NULL AND eficiencia <> 0 THEN 1 END),
+            coalesce(sum(CASE WHEN eficiencia IS NOT NULL AND eficiencia <> 0 THEN eficiencia ELSE 0 END), 0),
+            coalesce(sum(CASE WHEN eficiencia IS NOT NULL AND eficiencia <> 0 THEN eficiencia * eficiencia ELSE 0 END), 0),
+            now()
+        FROM weeks
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_fuel_stats')
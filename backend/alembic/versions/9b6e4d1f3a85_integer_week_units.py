@@ -0,0 +1,75 @@
+"""Integer units for weeks and user_fuel_stats
+
+Revision ID: 9b6e4d1f3a85
+Revises: a7d3f19c2e60
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b6e4d1f3a85'
+down_revision: Union[str, Sequence[str], None] = 'a7d3f19c2e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (tabela, coluna antiga, tipo antigo, coluna nova, tipo novo, escala, anulável, comentário novo, comentário antigo)
+# round() de numeric arredonda metade para longe do zero, como to_units.
+COLUMNS = [
+    ('weeks', 'km_atual', sa.Numeric(10, 2), 'km_atual_m', sa.BigInteger(), 1000, False,
+     'Quilometragem atual do veículo, em metros', 'Quilometragem atual do veículo'),
+    ('weeks', 'km_final', sa.Numeric(10, 2), 'km_final_m', sa.BigInteger(), 1000, False,
+     'Quilometragem final do veículo, em metros', 'Quilometragem final do veículo'),
+    ('weeks', 'custo', sa.Numeric(10, 2), 'custo_centavos', sa.BigInteger(), 100, False,
+     'Custo total do abastecimento, em centavos', 'Custo total do abastecimento'),
+    ('weeks', 'eficiencia', sa.Numeric(5, 2), 'eficiencia_centesimos', sa.BigInteger(), 100, True,
+     'Eficiência em centésimos de km/l', 'Eficiência em km/l'),
+    ('weeks', 'litros_abastecidos', sa.Numeric(8, 3), 'litros_ml', sa.BigInteger(), 1000, False,
+     'Quantidade abastecida, em mililitros', 'Quantidade de litros abastecidos'),
+    ('user_fuel_stats', 'total_custo', sa.Numeric(14, 2), 'total_custo_centavos', sa.BigInteger(), 100, False,
+     'Soma dos custos, em centavos', 'Soma dos custos'),
+    ('user_fuel_stats', 'total_litros', sa.Numeric(14, 3), 'total_litros_ml', sa.BigInteger(), 1000, False,
+     'Soma dos litros, em mililitros', 'Soma dos litros'),
+    ('user_fuel_stats', 'total_distancia', sa.Numeric(14, 2), 'total_distancia_m', sa.BigInteger(), 1000, False,
+     'Soma de km_final_m - km_atual_m dos registros fechados', 'Soma de km_final - km_atual dos registros fechados'),
+    ('user_fuel_stats', 'eficiencia_soma', sa.Numeric(14, 2), 'eficiencia_soma_centesimos', sa.BigInteger(), 100, False,
+     'Soma das eficiências, em centésimos de km/l', 'Soma das eficiências'),
+    ('user_fuel_stats', 'eficiencia_soma_quadrados', sa.Numeric(20, 4), 'eficiencia_soma_quadrados', sa.Numeric(38, 0), 10000, False,
+     'Soma dos quadrados das eficiências em centésimos', 'Soma dos quadrados das eficiências'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, old, old_type, new, new_type, scale, nullable, comment, old_comment in COLUMNS:
+        op.alter_column(
+            table, old,
+            type_=new_type,
+            existing_type=old_type,
+            existing_nullable=nullable,
+            comment=comment,
+            existing_comment=old_comment,
+            postgresql_using=f'round({old} * {scale})::{new_type.compile(dialect=op.get_bind().dialect)}',
+        )
+        if new != old:
+            op.alter_column(table, old, new_column_name=new)
+
+
+def downgrade() -> None:
+    """Downgrade schema. Falha se algum registro tiver eficiência acima de 999.99 km/l (não cabe em Numeric(5, 2))."""
+    for table, old, old_type, new, new_type, scale, nullable, comment, old_comment in reversed(COLUMNS):
+        if new != old:
+            op.alter_column(table, new, new_column_name=old)
+        op.alter_column(
+            table, old,
+            type_=old_type,
+            existing_type=new_type,
+            existing_nullable=nullable,
+            comment=old_comment,
+            existing_comment=comment,
+            postgresql_using=f'{old}::numeric / {scale}',
+        )
@@ -0,0 +1,39 @@
+"""Idempotency keys for POST /weeks/
+
+Revision ID: a7d3f19c2e60
+Revises: 5e2a9d7c4b13
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3f19c2e60'
+down_revision: Union[str, Sequence[str], None] = '5e2a9d7c4b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('idempotency_keys',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False, comment='Valor do header Idempotency-Key'),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False, comment='SHA-256 do corpo da requisição'),
+    sa.Column('week_id', sa.String(), nullable=False, comment='Registro criado pela requisição'),
+    sa.Column('status_code', sa.Integer(), nullable=True, comment='Status da resposta (nulo enquanto em andamento)'),
+    sa.Column('response_body', sa.LargeBinary(), nullable=True, comment='Corpo da resposta, reenviado nas repetições'),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False, comment='Depois disso a chave pode ser reutilizada'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('idempotency_keys')
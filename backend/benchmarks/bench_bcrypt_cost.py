@@ -0,0 +1,79 @@
+"""
+Latência do login para cada custo de bcrypt (BCRYPT_ROUNDS).
+
+Para cada custo registra um usuário novo e mede:
+  verify - apenas a verificação do hash (pwd_context.verify)
+  login  - POST /users/login de ponta a ponta
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_bcrypt_cost --min-rounds 8 --max-rounds 13 --iterations 10
+"""
+import argparse
+import asyncio
+import time
+
+from freeroad.api.deps import login_limiter
+from freeroad.api.security import pwd_context, set_bcrypt_rounds
+
+from benchmarks.common import (
+    BENCH_PASSWORD,
+    bench_client,
+    format_summary,
+    make_engine,
+    quiet,
+    reset_schema,
+    summarize,
+)
+
+
+async def main(min_rounds: int, max_rounds: int, iterations: int) -> None:
+    login_limiter.email_capacity = login_limiter.client_capacity = float("inf")
+    login_limiter.reset()
+    original_rounds = pwd_context.to_dict()["bcrypt__rounds"]
+
+    engine = make_engine()
+    await reset_schema(engine)
+    print(f"Custo atual configurado: {original_rounds}")
+    try:
+        async with bench_client(engine) as client:
+            for rounds in range(min_rounds, max_rounds + 1):
+                set_bcrypt_rounds(rounds)
+                email = f"bench_rounds_{rounds}@example.com"
+                hashed = pwd_context.hash(BENCH_PASSWORD)
+
+                verify_samples = []
+                for _ in range(iterations):
+                    start = time.perf_counter()
+                    pwd_context.verify(BENCH_PASSWORD, hashed)
+                    verify_samples.append(time.perf_counter() - start)
+
+                login_samples = []
+                with quiet():
+                    await client.post("/users/register", json={
+                        "name": "Bench User",
+                        "email": email,
+                        "password": BENCH_PASSWORD,
+                        "role": "user",
+                    })
+                    for _ in range(iterations):
+                        start = time.perf_counter()
+                        response = await client.post("/users/login", json={"email": email, "password": BENCH_PASSWORD})
+                        login_samples.append(time.perf_counter() - start)
+                        response.raise_for_status()
+
+                print(format_summary(f"rounds={rounds} verify", summarize(verify_samples)))
+                print(format_summary(f"rounds={rounds} login", summarize(login_samples)))
+    finally:
+        set_bcrypt_rounds(original_rounds)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-rounds", type=int, default=8)
+    parser.add_argument("--max-rounds", type=int, default=13)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.min_rounds, args.max_rounds, args.iterations))
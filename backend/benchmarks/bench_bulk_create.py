@@ -0,0 +1,55 @@
+"""
+Throughput de importação de registros (linhas/segundo): N chamadas a
+POST /weeks/ contra uma única chamada a POST /weeks/bulk com os mesmos itens.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_bulk_create --single 500 --bulk 1000 10000 50000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from benchmarks.common import bench_client, make_engine, quiet, register_and_login, reset_schema
+
+
+def make_items(n: int) -> List[Dict]:
+    return [
+        {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+        for i in range(n)
+    ]
+
+
+async def main(single: int, bulk_sizes: List[int]) -> None:
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        async with bench_client(engine) as client:
+            headers = await register_and_login(client)
+
+            with quiet():
+                start = time.perf_counter()
+                for item in make_items(single):
+                    (await client.post("/weeks/", json=item, headers=headers)).raise_for_status()
+                elapsed = time.perf_counter() - start
+            print(f"{'POST /weeks/ x' + str(single):<24} {single / elapsed:>10,.0f} linhas/s ({elapsed:.2f}s)")
+
+            for size in bulk_sizes:
+                items = make_items(size)
+                start = time.perf_counter()
+                response = await client.post("/weeks/bulk", json=items, headers=headers)
+                elapsed = time.perf_counter() - start
+                response.raise_for_status()
+                print(f"{'POST /weeks/bulk ' + str(size):<24} {size / elapsed:>10,.0f} linhas/s ({elapsed:.2f}s)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--single", type=int, default=500)
+    parser.add_argument("--bulk", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+    asyncio.run(main(args.single, args.bulk))
@@ -0,0 +1,95 @@
+"""
+Bytes trafegados e CPU por requisição das listagens principais
+(GET /weeks/user/{user_id} e GET /weeks/) sem compressão, com gzip e com
+brotli, para um usuário com N registros.
+
+A CPU é o tempo de processo (time.process_time) da requisição inteira em
+processo: consulta, serialização e compressão; "compressão" é o tempo só da
+compressão do mesmo corpo, medido à parte (a diferença entre as requisições
+fica dentro do ruído). O corpo é lido cru, sem a descompressão do cliente.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_compression --rows 100 1000 10000 --requests 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from benchmarks.common import bench_client, make_engine, quiet, register_and_login, reset_schema
+from freeroad.api.compression import CompressionMiddleware
+from freeroad.api.pagination import MAX_PAGE_LIMIT
+from freeroad.infra.settings import (
+    RESPONSE_COMPRESSION_BROTLI_QUALITY,
+    RESPONSE_COMPRESSION_GZIP_LEVEL,
+)
+
+ENCODINGS = ("identity", "gzip", "br")
+COMPRESSORS = CompressionMiddleware(
+    None, gzip_level=RESPONSE_COMPRESSION_GZIP_LEVEL, brotli_quality=RESPONSE_COMPRESSION_BROTLI_QUALITY
+).compressors
+
+
+def compression_ms(encoding: str, body: bytes, repeat: int = 5) -> float:
+    if encoding == "identity":
+        return 0.0
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        COMPRESSORS[encoding](body)
+        timings.append(time.process_time() - start)
+    return min(timings) * 1000
+
+
+async def main(rows: List[int], requests: int) -> None:
+    engine = make_engine()
+    try:
+        for size in rows:
+            await reset_schema(engine)
+            async with bench_client(engine) as client:
+                with quiet():
+                    headers = await register_and_login(client)
+                items = [
+                    {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+                    for i in range(size)
+                ]
+                (await client.post("/weeks/bulk", json=items, headers=headers)).raise_for_status()
+                user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+
+                for url, params in ((f"/weeks/user/{user_id}", {}), ("/weeks/", {"limit": min(size, MAX_PAGE_LIMIT)})):
+                    baseline, plain = None, b""
+                    for encoding in ENCODINGS:
+                        cpu, wall = [], []
+                        for _ in range(requests):
+                            cpu_start, wall_start = time.process_time(), time.perf_counter()
+                            with quiet():
+                                async with client.stream(
+                                    "GET", url, params=params, headers={**headers, "Accept-Encoding": encoding}
+                                ) as response:
+                                    body = b"".join([chunk async for chunk in response.aiter_raw()])
+                            cpu.append(time.process_time() - cpu_start)
+                            wall.append(time.perf_counter() - wall_start)
+                        assert response.headers.get("content-encoding", "identity") == encoding or len(body) < 1024
+                        cpu_ms = statistics.fmean(cpu) * 1000
+                        baseline = baseline or (len(body), cpu_ms)
+                        plain = plain or body
+                        print(
+                            f"{size:>6} registros {url.split('/')[2] or 'all':<6} {encoding:<8} "
+                            f"{len(body):>9} bytes ({len(body) / baseline[0]:6.1%})  "
+                            f"cpu={cpu_ms:7.2f}ms (+{cpu_ms - baseline[1]:5.2f})  "
+                            f"compressão={compression_ms(encoding, plain):6.2f}ms  "
+                            f"wall={statistics.fmean(wall) * 1000:7.2f}ms"
+                        )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests))
@@ -0,0 +1,70 @@
+"""
+Importação de CSV via POST /weeks/import/csv: linhas/segundo e pico de memória
+alocada (tracemalloc) para arquivos de tamanhos diferentes. O corpo é enviado
+em pedaços de 64KB, como faria um upload real, e nunca é montado inteiro.
+
+Cada tamanho é importado duas vezes: uma cronometrada e outra com tracemalloc
+ligado (que deixa o Python várias vezes mais lento).
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_csv_import --rows 10000 100000 500000
+"""
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import AsyncIterator, List
+
+from benchmarks.common import bench_client, make_engine, quiet, register_and_login, reset_schema
+
+HEADER = b"title,kmAtual,kmFinal,custo,litrosAbastecidos,created_at\n"
+
+
+async def csv_body(rows: int, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    buffer = bytearray(HEADER)
+    for i in range(rows):
+        buffer += f"Recibo {i},{1000 + i},{1400 + i},250.90,32.4,2025-01-01T00:00:00\n".encode()
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def main(sizes: List[int]) -> None:
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        async with bench_client(engine) as client:
+            headers = {**await register_and_login(client), "Content-Type": "text/csv"}
+            async def upload(rows: int) -> dict:
+                with quiet():
+                    response = await client.post("/weeks/import/csv", content=csv_body(rows), headers=headers, timeout=None)
+                return json.loads(response.text.splitlines()[-1])
+
+            for rows in sizes:
+                start = time.perf_counter()
+                summary = await upload(rows)
+                elapsed = time.perf_counter() - start
+
+                tracemalloc.start()
+                await upload(rows)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                print(
+                    f"{rows:>9,} linhas  {summary['created'] / elapsed:>9,.0f} linhas/s "
+                    f"({elapsed:.2f}s)  pico {peak / 1024 / 1024:6.1f} MiB"
+                )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 500000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
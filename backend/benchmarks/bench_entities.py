@@ -0,0 +1,213 @@
+"""
+Memória por objeto e custo de conversão das entidades Week e User.
+
+Compara as classes antigas (atributos em __dict__, numéricos de Week em str
+na criação e reconvertidos em cada camada) com as entidades atuais
+(__slots__, numéricos em float convertidos uma vez na borda):
+
+  - memória: bytes por instância medidos com tracemalloc;
+  - criação: validação + entidade + linha do INSERT + entidade lida de volta
+    + JSON da resposta, o caminho de POST /weeks/;
+  - listagem: linha do banco (Decimal) -> entidade -> JSON, por registro.
+
+Uso:
+    cd backend
+    python -m benchmarks.bench_entities --objects 100000 --requests 20000
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, List
+from uuid import uuid4
+
+from freeroad.api.routes.week_route import check_week_values, new_week
+from freeroad.api.schemas.week_schema import WeekCreate
+from freeroad.api.week_json import week_response_record
+from freeroad.domain.entities.user import User
+from freeroad.domain.entities.week import Week
+from freeroad.domain.value_objects.email_vo import Email
+from freeroad.domain.value_objects.password import Password
+from freeroad.infra.models.week_model import WeekModel
+
+HASH = "$2b$12$KIXQJ1xQ1xQ1xQ1xQ1xQ1u7d3l0W2d8l0W2d8l0W2d8l0W2d8l0W2"
+
+
+class LegacyWeek:
+    """Week antes dos slots: guarda o que recebe (str na criação, float na leitura)."""
+
+    def __init__(self, id, user_id, title, kmAtual, kmFinal, custo, eficiencia, litrosAbastecidos, created_at=None, updated_at=None):
+        self.id = id
+        self.user_id = user_id
+        self.title = title
+        self.kmAtual = kmAtual
+        self.kmFinal = kmFinal
+        self.custo = custo
+        self.eficiencia = eficiencia
+        self.litrosAbastecidos = litrosAbastecidos
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or datetime.now()
+
+
+class LegacyUser:
+    def __init__(self, id, name, email, password, role):
+        if role not in ["admin", "user"]:
+            raise ValueError("Role must be 'admin' or 'user'.")
+        self.id = id
+        self.name = name
+        self.email = email
+        self.password = password
+        self.role = role
+
+
+def _is_valid_numeric(value) -> bool:
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def legacy_check(data: WeekCreate):
+    values = [str(data.kmAtual), str(data.kmFinal if data.kmFinal is not None else 0.0), str(data.custo),
+              str(data.eficiencia if data.eficiencia is not None else 0.0), str(data.litrosAbastecidos)]
+    if not all(_is_valid_numeric(v) for v in values):
+        return "numero"
+    km_atual, km_final, custo, eficiencia, litros = (float(v) for v in values)
+    if min(km_atual, km_final, custo, eficiencia) < 0 or litros <= 0:
+        return "negativo"
+    if float(values[1]) > 0 and float(values[1]) < float(values[0]):
+        return "kmFinal"
+    return None
+
+
+def legacy_new_week(user_id: str, data: WeekCreate) -> LegacyWeek:
+    now = datetime.now()
+    return LegacyWeek(
+        id=str(uuid4()), user_id=user_id, title=data.title, kmAtual=str(data.kmAtual),
+        kmFinal=str(data.kmFinal if data.kmFinal is not None else 0.0), custo=str(data.custo),
+        eficiencia=str(data.eficiencia if data.eficiencia is not None else 0.0),
+        litrosAbastecidos=str(data.litrosAbastecidos), created_at=now, updated_at=now,
+    )
+
+
+def legacy_entity_to_row(week) -> dict:
+    return dict(
+        id=week.id, user_id=week.user_id, title=week.title,
+        km_atual=float(week.kmAtual), km_final=float(week.kmFinal) if week.kmFinal else 0.0, custo=float(week.custo),
+        eficiencia=float(week.eficiencia) if week.eficiencia and week.eficiencia != "0" else None,
+        litros_abastecidos=float(week.litrosAbastecidos), created_at=week.created_at, updated_at=week.updated_at,
+    )
+
+
+def legacy_row_to_entity(row) -> LegacyWeek:
+    return LegacyWeek(
+        id=row.id, user_id=row.user_id, title=row.title, kmAtual=float(row.km_atual), kmFinal=float(row.km_final),
+        custo=float(row.custo), eficiencia=float(row.eficiencia) if row.eficiencia is not None else 0.0,
+        litrosAbastecidos=float(row.litros_abastecidos), created_at=row.created_at, updated_at=row.updated_at,
+    )
+
+
+def legacy_record(week) -> dict:
+    return {
+        "title": week.title, "kmAtual": float(week.kmAtual), "litrosAbastecidos": float(week.litrosAbastecidos),
+        "custo": float(week.custo), "id": week.id, "user_id": week.user_id,
+        "kmFinal": float(week.kmFinal) if week.kmFinal is not None else None,
+        "eficiencia": float(week.eficiencia) if week.eficiencia is not None else None,
+    }
+
+
+def as_db_row(row: dict) -> SimpleNamespace:
+    """
+    O que volta do INSERT ... RETURNING: as colunas Numeric antigas chegam como
+    Decimal; as inteiras atuais, como int.
+    """
+    return SimpleNamespace(**{k: Decimal(str(v)) if isinstance(v, float) else v for k, v in row.items()})
+
+
+def legacy_create(data: WeekCreate) -> dict:
+    legacy_check(data)
+    row = as_db_row(legacy_entity_to_row(legacy_new_week("user-1", data)))
+    return legacy_record(legacy_row_to_entity(row))
+
+
+def typed_create(data: WeekCreate) -> dict:
+    check_week_values(data)
+    row = as_db_row(WeekModel.entity_to_row(new_week("user-1", data)))
+    return week_response_record(WeekModel.row_to_entity(row))
+
+
+def make_rows(n: int) -> List[SimpleNamespace]:
+    now = datetime.now()
+    return [
+        SimpleNamespace(
+            id=str(uuid4()), user_id="user-1", title=f"Abastecimento {i}",
+            km_atual=Decimal("1000.00") + i, km_final=Decimal("1400.50") + i, custo=Decimal("250.90"),
+            eficiencia=Decimal("12.35") if i % 4 else None, litros_abastecidos=Decimal("32.400"),
+            km_atual_m=1000000 + i * 1000, km_final_m=1400500 + i * 1000, custo_centavos=25090,
+            eficiencia_centesimos=1235 if i % 4 else None, litros_ml=32400,
+            created_at=now, updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def bytes_per_object(make: Callable[[int], object], n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # Desconta a própria lista (um ponteiro por item)
+    return (after - before) / n - 8
+
+
+def per_call_us(fn: Callable, items: list, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(items) * 1e6
+
+
+def main(objects: int, requests: int) -> None:
+    now = datetime.now()
+    created = WeekCreate(title="Recibo", kmAtual=1000.0, kmFinal=1400.5, custo=250.9, litrosAbastecidos=32.4)
+    email, password = Email.trusted("user@example.com"), Password(HASH, hashed=True)
+
+    print(f"memória por objeto ({objects} instâncias, inclui os valores de cada uma)")
+    memory = (
+        ("week antiga (str, criação)", lambda i: legacy_new_week("user-1", created)),
+        ("week antiga (float, leitura)", lambda i: LegacyWeek(str(i), "u", "t", 1000.0 + i, 1400.0 + i, 250.9, 12.35, 32.4, now, now)),
+        ("week atual", lambda i: Week(str(i), "u", "t", 1000.0 + i, 1400.0 + i, 250.9, 12.35, 32.4, now, now)),
+        ("user antigo", lambda i: LegacyUser(str(i), "Nome", email, password, "user")),
+        ("user atual", lambda i: User(str(i), "Nome", email, password, "user")),
+    )
+    for label, make in memory:
+        print(f"  {label:<30} {bytes_per_object(make, objects):8.0f} bytes")
+
+    payloads = [created] * requests
+    rows = make_rows(requests)
+    print(f"conversões por requisição/registro (melhor de 5 rodadas de {requests})")
+    timings = (
+        ("criação antiga", legacy_create, payloads),
+        ("criação atual", typed_create, payloads),
+        ("listagem antiga (por registro)", lambda row: legacy_record(legacy_row_to_entity(row)), rows),
+        ("listagem atual (por registro)", lambda row: week_response_record(WeekModel.row_to_entity(row)), rows),
+    )
+    for label, fn, items in timings:
+        fn(items[0])
+        print(f"  {label:<30} {per_call_us(fn, items):8.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.objects, args.requests)
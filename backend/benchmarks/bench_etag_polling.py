@@ -0,0 +1,51 @@
+"""
+Custo de um poll de GET /weeks/user/{user_id} com e sem If-None-Match, para
+um usuário com N registros: resposta completa (200) contra 304 Not Modified.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_etag_polling --rows 100 1000 10000 --polls 200
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.common import bench_client, format_summary, make_engine, register_and_login, reset_schema, summarize
+
+
+async def main(rows: List[int], polls: int) -> None:
+    engine = make_engine()
+    try:
+        for size in rows:
+            await reset_schema(engine)
+            async with bench_client(engine) as client:
+                headers = await register_and_login(client)
+                items = [
+                    {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+                    for i in range(size)
+                ]
+                (await client.post("/weeks/bulk", json=items, headers=headers)).raise_for_status()
+                user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+                url = f"/weeks/user/{user_id}"
+                etag = (await client.get(url, headers=headers)).headers["etag"]
+
+                for label, extra in (("200", {}), ("304", {"If-None-Match": etag})):
+                    samples = []
+                    for _ in range(polls):
+                        start = time.perf_counter()
+                        response = await client.get(url, headers={**headers, **extra})
+                        samples.append(time.perf_counter() - start)
+                        assert response.status_code == int(label)
+                    print(format_summary(f"{size:>6} registros {label}", summarize(samples)), f"{len(response.content):>9} bytes")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.polls))
@@ -0,0 +1,121 @@
+"""
+Tempo até o primeiro byte (TTFB), tempo total e pico de memória alocada da
+listagem completa (GET /weeks/user/{id}) contra o export em streaming
+(GET /weeks/export) para históricos de tamanhos diferentes.
+
+A aplicação roda num uvicorn real dentro do processo (o ASGITransport do httpx
+só devolve a resposta depois que ela termina, o que esconderia o TTFB). Cada
+URL é baixada duas vezes: uma cronometrada e outra com tracemalloc ligado.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_export --rows 10000 100000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from uuid import uuid4
+
+import uvicorn
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from freeroad.api import deps
+from freeroad.api.main import app
+from freeroad.domain.entities.week import Week
+from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
+
+from benchmarks.common import make_engine, quiet, register_and_login, reset_schema
+
+PORT = 8765
+
+
+async def seed(session_factory, user_id: str, rows: int) -> None:
+    start = datetime(2020, 1, 1)
+    async with session_factory() as session:
+        repo = SQLAlchemyWeekRepository(session)
+        for offset in range(0, rows, 50000):
+            await repo.create_many([
+                Week(
+                    id=str(uuid4()), user_id=user_id, title=f"Recibo {i}",
+                    kmAtual=1000.0 + i, kmFinal=1400.0 + i, custo=250.9, eficiencia=12.35,
+                    litrosAbastecidos=32.4, created_at=start + timedelta(minutes=i), updated_at=start,
+                )
+                for i in range(offset, min(rows, offset + 50000))
+            ])
+
+
+async def download(client: AsyncClient, url: str, headers: dict) -> Tuple[float, float, int]:
+    """Retorna (ttfb, total, bytes) de um GET consumido em streaming."""
+    start = time.perf_counter()
+    ttfb = None
+    size = 0
+    async with client.stream("GET", url, headers=headers, timeout=None) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_raw():
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+            size += len(chunk)
+    total = time.perf_counter() - start
+    return ttfb or total, total, size
+
+
+async def fetch(client: AsyncClient, url: str, headers: dict) -> Tuple[float, float, int, float]:
+    """Retorna (ttfb, total, bytes, pico MiB alocado no processo)."""
+    ttfb, total, size = await download(client, url, headers)
+    tracemalloc.start()
+    await download(client, url, headers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ttfb, total, size, peak / 1024 / 1024
+
+
+async def main(sizes: List[int]) -> None:
+    engine = make_engine()
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[deps.get_db] = override_get_db
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=PORT, log_level="warning"))
+    serve = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            await asyncio.sleep(0.05)
+        async with AsyncClient(base_url=f"http://127.0.0.1:{PORT}") as client:
+            for rows in sizes:
+                await reset_schema(engine)
+                with quiet():
+                    headers = await register_and_login(client)
+                    user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+                await seed(session_factory, user_id, rows)
+
+                print(f"{rows:,} registros")
+                for label, url in [
+                    ("GET /weeks/user/{id}", f"/weeks/user/{user_id}"),
+                    ("GET /weeks/export ndjson", "/weeks/export?format=ndjson"),
+                    ("GET /weeks/export csv", "/weeks/export?format=csv"),
+                ]:
+                    ttfb, total, size, peak = await fetch(client, url, headers)
+                    print(
+                        f"  {label:<26} ttfb={ttfb * 1000:8.1f}ms total={total:6.2f}s "
+                        f"{size / 1024 / 1024:7.1f} MiB  pico={peak:7.1f} MiB"
+                    )
+    finally:
+        server.should_exit = True
+        await serve
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -0,0 +1,62 @@
+"""
+Fechamento de vários registros de uma vez: N chamadas a
+PUT /weeks/{id}/final_km contra uma única chamada a PUT /weeks/final_km com
+os mesmos pares (week_id, final_km).
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_final_km_batch --sizes 10 100 1000
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from benchmarks.common import bench_client, make_engine, quiet, register_and_login, reset_schema
+
+
+async def main(sizes: List[int]) -> None:
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        async with bench_client(engine) as client:
+            headers = await register_and_login(client)
+
+            for size in sizes:
+                items = [
+                    {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+                    for i in range(2 * size)
+                ]
+                response = await client.post("/weeks/bulk", json=items, headers=headers)
+                response.raise_for_status()
+                ids = response.json()["ids"]
+                single_ids, batch_ids = ids[:size], ids[size:]
+
+                with quiet():
+                    start = time.perf_counter()
+                    for i, week_id in enumerate(single_ids):
+                        response = await client.put(f"/weeks/{week_id}/final_km", json={"final_km": 1400.0 + i}, headers=headers)
+                        response.raise_for_status()
+                    single = time.perf_counter() - start
+
+                pairs = [{"week_id": week_id, "final_km": 1400.0 + size + i} for i, week_id in enumerate(batch_ids)]
+                start = time.perf_counter()
+                response = await client.put("/weeks/final_km", json=pairs, headers=headers)
+                batch = time.perf_counter() - start
+                response.raise_for_status()
+                assert response.json()["updated"] == size
+
+                print(
+                    f"{size:>6} registros  individual {single * 1000:9.1f}ms ({size / single:8,.0f}/s)  "
+                    f"lote {batch * 1000:8.1f}ms ({size / batch:8,.0f}/s)  {single / batch:5.1f}x"
+                )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
@@ -0,0 +1,109 @@
+"""
+Throughput de conversão linha -> entidade (linhas/segundo) para User e Week.
+
+Compara o caminho antigo (revalidação do email, numéricos via str e
+reparse pelo Pydantic) com a hidratação confiável usada hoje.
+
+Uso:
+    cd backend
+    python -m benchmarks.bench_hydration --rows 100000
+"""
+import argparse
+import time
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Callable, List
+from uuid import uuid4
+
+from freeroad.api.schemas.week_schema import WeekResponse
+from freeroad.domain.entities.user import User
+from freeroad.domain.entities.week import Week
+from freeroad.domain.value_objects.email_vo import Email
+from freeroad.domain.value_objects.password import Password
+from freeroad.infra.models.week_model import WeekModel
+
+HASH = "$2b$12$KIXQJ1xQ1xQ1xQ1xQ1xQ1u7d3l0W2d8l0W2d8l0W2d8l0W2d8l0W2"
+
+
+def make_user_rows(n: int) -> List[SimpleNamespace]:
+    return [
+        SimpleNamespace(id=str(uuid4()), name=f"User {i}", email=f"user{i}@example.com", password=HASH, role="user")
+        for i in range(n)
+    ]
+
+
+def make_week_rows(n: int) -> List[SimpleNamespace]:
+    """Linhas com as colunas Numeric antigas (lidas por legacy_week) e as inteiras atuais."""
+    now = datetime.now()
+    return [
+        SimpleNamespace(
+            id=str(uuid4()),
+            user_id="user-1",
+            title=f"Abastecimento {i}",
+            km_atual=Decimal("1000.00") + i,
+            km_final=Decimal("1400.50") + i,
+            custo=Decimal("250.90"),
+            eficiencia=Decimal("12.35") if i % 4 else None,
+            litros_abastecidos=Decimal("32.400"),
+            km_atual_m=1000000 + i * 1000,
+            km_final_m=1400500 + i * 1000,
+            custo_centavos=25090,
+            eficiencia_centesimos=1235 if i % 4 else None,
+            litros_ml=32400,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def legacy_user(row) -> User:
+    return User(id=row.id, name=row.name, email=Email(row.email), password=Password(row.password, hashed=True), role=row.role)
+
+
+def trusted_user(row) -> User:
+    return User(id=row.id, name=row.name, email=Email.trusted(row.email), password=Password(row.password, hashed=True), role=row.role)
+
+
+def legacy_week(row) -> WeekResponse:
+    week = Week(
+        id=row.id,
+        user_id=row.user_id,
+        title=row.title,
+        kmAtual=str(row.km_atual),
+        kmFinal=str(row.km_final),
+        custo=str(row.custo),
+        eficiencia=str(row.eficiencia) if row.eficiencia is not None else "0",
+        litrosAbastecidos=str(row.litros_abastecidos),
+    )
+    return WeekResponse.model_validate(week)
+
+
+def trusted_week(row) -> WeekResponse:
+    return WeekResponse.model_validate(WeekModel.row_to_entity(row))
+
+
+def measure(label: str, convert: Callable, rows: list) -> None:
+    start = time.perf_counter()
+    for row in rows:
+        convert(row)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {len(rows) / elapsed:>12,.0f} linhas/s ({elapsed * 1000:.1f}ms)")
+
+
+def main(n: int) -> None:
+    user_rows = make_user_rows(n)
+    week_rows = make_week_rows(n)
+    print(f"{n} linhas")
+    measure("user legado", legacy_user, user_rows)
+    measure("user confiável", trusted_user, user_rows)
+    measure("week legado (+pydantic)", legacy_week, week_rows)
+    measure("week confiável (+pydantic)", trusted_week, week_rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.rows)
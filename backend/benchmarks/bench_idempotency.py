@@ -0,0 +1,52 @@
+"""
+Custo de POST /weeks/ com Idempotency-Key: criação sem chave, primeira
+requisição com chave (reserva + resposta guardada) e repetição (resposta
+guardada, sem validação nem acesso a weeks).
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_idempotency --requests 300
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import bench_client, format_summary, make_engine, quiet, register_and_login, reset_schema, summarize
+
+PAYLOAD = {"title": "Recibo", "kmAtual": 1000.0, "custo": 250.9, "litrosAbastecidos": 32.4}
+
+
+async def main(requests: int) -> None:
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        async with bench_client(engine) as client:
+            with quiet():
+                headers = await register_and_login(client)
+            cases = (
+                ("sem chave", lambda i: headers),
+                ("com chave (primeira)", lambda i: {**headers, "Idempotency-Key": f"key-{i}"}),
+                ("com chave (repetição)", lambda i: {**headers, "Idempotency-Key": f"key-{i}"}),
+            )
+            for label, make_headers in cases:
+                samples = []
+                for i in range(requests):
+                    start = time.perf_counter()
+                    with quiet():
+                        response = await client.post("/weeks/", json=PAYLOAD, headers=make_headers(i))
+                    samples.append(time.perf_counter() - start)
+                    assert response.status_code == 201
+                print(format_summary(label, summarize(samples)))
+            user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+            weeks = (await client.get(f"/weeks/user/{user_id}", headers=headers)).json()
+            print(f"registros criados: {len(weeks)} (esperado {2 * requests})")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,96 @@
+"""
+Latência de GET /weeks/ enquanto logins rodam em paralelo.
+
+Cenários:
+  idle      - apenas GET /weeks/
+  offloaded - logins reais via /users/login (bcrypt no pool de hashing)
+  blocking  - bcrypt executado diretamente no event loop (comportamento antigo)
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_login_concurrency --duration 5 --logins 8
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from freeroad.api.deps import login_limiter
+from freeroad.api.security import get_password_hash, verify_password
+
+from benchmarks.common import (
+    BENCH_EMAIL,
+    BENCH_PASSWORD,
+    bench_client,
+    format_summary,
+    make_engine,
+    quiet,
+    register_and_login,
+    reset_schema,
+    summarize,
+)
+
+
+async def probe_weeks(client, headers, stop: asyncio.Event, samples: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/weeks/", headers=headers)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+        await asyncio.sleep(0.005)
+
+
+async def login_worker(client, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        await client.post("/users/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD})
+
+
+async def blocking_worker(hashed: str, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        verify_password(BENCH_PASSWORD, hashed)
+        await asyncio.sleep(0)
+
+
+async def run_scenario(client, headers, scenario: str, duration: float, logins: int) -> List[float]:
+    stop = asyncio.Event()
+    samples: List[float] = []
+    tasks = [asyncio.create_task(probe_weeks(client, headers, stop, samples))]
+
+    if scenario == "offloaded":
+        tasks += [asyncio.create_task(login_worker(client, stop)) for _ in range(logins)]
+    elif scenario == "blocking":
+        hashed = get_password_hash(BENCH_PASSWORD)
+        tasks += [asyncio.create_task(blocking_worker(hashed, stop)) for _ in range(logins)]
+
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    return samples
+
+
+async def main(duration: float, logins: int) -> None:
+    # O benchmark mede o custo do bcrypt, não o controle de admissão:
+    # libera os baldes e deixa apenas o limite de verificações simultâneas.
+    login_limiter.email_capacity = login_limiter.client_capacity = float("inf")
+    login_limiter.reset()
+
+    engine = make_engine()
+    await reset_schema(engine)
+    print(f"GET /weeks/ com {logins} logins concorrentes, {duration}s por cenário")
+    async with bench_client(engine) as client:
+        with quiet():
+            headers = await register_and_login(client)
+        for scenario in ("idle", "offloaded", "blocking"):
+            with quiet():
+                samples = await run_scenario(client, headers, scenario, duration, logins)
+            print(format_summary(scenario, summarize(samples)))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--logins", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.duration, args.logins))
@@ -0,0 +1,71 @@
+"""
+Latência das leituras de registros com e sem o cache read-through:
+GET /weeks/{id} e GET /weeks/user/{user_id} (N registros), repetidos sem
+escritas no meio (melhor caso do cache, 1 miss e depois só acertos).
+
+O backend memcached só é medido com --memcached host:port.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_week_cache --rows 1000 --requests 300 --memcached localhost:11211
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from freeroad.api import deps
+from freeroad.infra.repositories.cached_week_repository import WeekCacheStats
+from freeroad.infra.week_cache import MemcachedWeekCache, MemoryWeekCache
+
+from benchmarks.common import bench_client, format_summary, make_engine, register_and_login, reset_schema, summarize
+
+
+async def measure(client, headers, url: str, requests: int) -> List[float]:
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return samples
+
+
+async def main(rows: int, requests: int, memcached: Optional[str]) -> None:
+    backends = [("sem cache", None), ("memory", MemoryWeekCache(maxsize=1024, ttl=300))]
+    if memcached:
+        host, port = memcached.split(":")
+        backends.append(("memcached", MemcachedWeekCache(host, int(port), ttl=300)))
+
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        async with bench_client(engine) as client:
+            headers = await register_and_login(client)
+            items = [
+                {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+                for i in range(rows)
+            ]
+            ids = (await client.post("/weeks/bulk", json=items, headers=headers)).json()["ids"]
+            user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+
+            for label, backend in backends:
+                deps.week_cache, deps.week_cache_stats = backend, WeekCacheStats()
+                for name, url in (("/weeks/{id}", f"/weeks/{ids[0]}"), (f"/weeks/user ({rows})", f"/weeks/user/{user_id}")):
+                    samples = await measure(client, headers, url, requests)
+                    print(format_summary(f"{label:<10} {name}", summarize(samples)))
+                if backend is not None:
+                    print(f"{'':<10} {deps.week_cache_stats.snapshot()}")
+    finally:
+        deps.week_cache = None
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--memcached", default=None, help="host:port de um memcached")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests, args.memcached))
@@ -0,0 +1,74 @@
+"""
+Sincronização de um cliente offline com N registros, depois de K alterações
+(metade com PUT final_km, metade removida): download completo de
+GET /weeks/user/{user_id} contra GET /weeks/changes?since=<cursor>.
+
+O cursor é montado para o instante logo após a carga, como o de um cliente
+que sincronizou depois da janela WEEK_CHANGES_SETTLE_SECONDS; assim a
+resposta traz só as K alterações.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_week_changes --rows 1000 10000 --changes 10 --polls 100
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+
+from benchmarks.common import (
+    bench_client, format_summary, make_engine, quiet, register_and_login, reset_schema, summarize,
+)
+from freeroad.api.pagination import MAX_PAGE_LIMIT, encode_changes_cursor
+
+
+async def main(rows: List[int], changes: int, polls: int) -> None:
+    engine = make_engine()
+    try:
+        for size in rows:
+            await reset_schema(engine)
+            async with bench_client(engine) as client:
+                headers = await register_and_login(client)
+                items = [
+                    {"title": f"Recibo {i}", "kmAtual": 1000.0 + i, "custo": 250.9, "litrosAbastecidos": 32.4}
+                    for i in range(size)
+                ]
+                (await client.post("/weeks/bulk", json=items, headers=headers)).raise_for_status()
+                user_id = (await client.get("/users/me", headers=headers)).json()["id"]
+                full_url = f"/weeks/user/{user_id}"
+                cursor = encode_changes_cursor((datetime.now(), ""), None)
+
+                weeks = (await client.get(full_url, headers=headers)).json()
+                with quiet():
+                    for i, week in enumerate(weeks[:changes]):
+                        if i % 2:
+                            await client.delete(f"/weeks/{week['id']}", headers=headers)
+                        else:
+                            final_km = {"final_km": week["kmAtual"] + 400}
+                            await client.put(f"/weeks/{week['id']}/final_km", json=final_km, headers=headers)
+
+                requests = (
+                    ("completo", full_url, {}),
+                    ("alterações", "/weeks/changes", {"since": cursor, "limit": MAX_PAGE_LIMIT}),
+                )
+                for label, url, params in requests:
+                    samples = []
+                    for _ in range(polls):
+                        start = time.perf_counter()
+                        response = await client.get(url, params=params, headers=headers)
+                        samples.append(time.perf_counter() - start)
+                        response.raise_for_status()
+                    print(format_summary(f"{size:>6} registros {label}", summarize(samples)), f"{len(response.content):>9} bytes")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--changes", type=int, default=10)
+    parser.add_argument("--polls", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.changes, args.polls))
@@ -0,0 +1,77 @@
+"""
+Serialização de listas de registros (List[WeekResponse]) em bytes JSON, a
+partir de entidades como as devolvidas pelo repositório SQL.
+
+Caminhos comparados:
+  - legado: validação do response_model, dump para dict, json.dumps
+    (FastAPI < 0.120 com JSONResponse);
+  - pydantic: validação do response_model e dump_json (FastAPI atual);
+  - orjson: WeekListResponse, sem validação.
+
+Uso:
+    cd backend
+    python -m benchmarks.bench_week_json --rows 1000 10000 100000
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Callable, List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from freeroad.api.schemas.week_schema import WeekResponse
+from freeroad.api.week_json import WeekListResponse
+from freeroad.domain.entities.week import Week
+
+ADAPTER = TypeAdapter(List[WeekResponse])
+
+
+def make_weeks(n: int) -> List[Week]:
+    now = datetime.now()
+    return [
+        Week(str(uuid4()), "user-1", f"Abastecimento {i}", 1000.0 + i, 1400.5 + i, 250.9, 12.35, 32.4, now, now)
+        for i in range(n)
+    ]
+
+
+def legacy(weeks: List[Week]) -> bytes:
+    content = ADAPTER.dump_python(ADAPTER.validate_python(weeks, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def pydantic_json(weeks: List[Week]) -> bytes:
+    return ADAPTER.dump_json(ADAPTER.validate_python(weeks, from_attributes=True))
+
+
+def fast(weeks: List[Week]) -> bytes:
+    return WeekListResponse(weeks).body
+
+
+def best_of(fn: Callable[[List[Week]], bytes], weeks: List[Week], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(weeks)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    for size in sizes:
+        weeks = make_weeks(size)
+        assert json.loads(fast(weeks)) == json.loads(legacy(weeks))
+        results = [(name, best_of(fn, weeks, repeat)) for name, fn in (("legado", legacy), ("pydantic", pydantic_json), ("orjson", fast))]
+        baseline = results[0][1]
+        print(f"{size:>7} registros  " + "  ".join(
+            f"{name} {elapsed * 1000:8.1f}ms ({baseline / elapsed:4.1f}x)" for name, elapsed in results
+        ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
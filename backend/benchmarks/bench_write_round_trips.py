@@ -0,0 +1,127 @@
+"""
+Idas ao banco e latência das escritas de registros: caminhos ORM anteriores
+(add + commit + refresh; SELECT + delete + commit) contra os atuais com
+INSERT/DELETE ... RETURNING do SQLAlchemyWeekRepository.
+
+As idas ao banco são contadas com eventos do engine (BEGIN, cada comando,
+COMMIT/ROLLBACK). Localmente cada ida custa pouco; no Neon cada uma paga a
+latência de rede, então a contagem é o número que importa.
+
+Uso:
+    cd backend
+    BENCH_DATABASE_URL=postgresql+asyncpg://... \\
+        python -m benchmarks.bench_write_round_trips --iterations 500
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from freeroad.domain.entities.week import Week
+from freeroad.infra.models.user_model import UserModel
+from freeroad.infra.models.week_model import WeekModel
+from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
+from freeroad.infra.repositories.sqlalchemy.user_fuel_stats import apply_fuel_stats, model_contribution
+
+from benchmarks.common import format_summary, make_engine, reset_schema, summarize
+
+USER_ID = "bench-user"
+
+
+def make_week() -> Week:
+    now = datetime.now()
+    return Week(
+        id=str(uuid4()), user_id=USER_ID, title="Recibo", kmAtual=1000.0, kmFinal=0.0,
+        custo=250.9, eficiencia=0.0, litrosAbastecidos=32.4, created_at=now, updated_at=now,
+    )
+
+
+async def orm_create(session: AsyncSession, week: Week) -> Week:
+    """Caminho anterior de create: add, flush, upsert da rollup, commit e refresh."""
+    week_model = WeekModel.from_entity(week)
+    session.add(week_model)
+    await session.flush()
+    await apply_fuel_stats(session, week_model.user_id, model_contribution(week_model))
+    await session.commit()
+    await session.refresh(week_model)
+    return week_model.to_entity()
+
+
+async def orm_delete(session: AsyncSession, week_id: str) -> None:
+    """Caminho anterior de delete: SELECT, delete do ORM, upsert da rollup e commit."""
+    result = await session.execute(select(WeekModel).where(WeekModel.id == week_id))
+    week_model = result.scalar_one_or_none()
+    if week_model:
+        await session.delete(week_model)
+        await apply_fuel_stats(session, week_model.user_id, model_contribution(week_model, sign=-1))
+        await session.commit()
+
+
+async def measure(
+    engine, session_factory, label: str, iterations: int,
+    create: Callable[[AsyncSession, Week], Awaitable], delete: Callable[[AsyncSession, str], Awaitable],
+) -> None:
+    round_trips: List[int] = []
+
+    def count(*_):
+        round_trips[-1] += 1
+
+    listeners = [("before_cursor_execute", count), ("begin", count), ("commit", count), ("rollback", count)]
+    for name, fn in listeners:
+        event.listen(engine.sync_engine, name, fn)
+
+    create_samples, delete_samples, create_trips, delete_trips = [], [], [], []
+    try:
+        for _ in range(iterations):
+            week = make_week()
+            async with session_factory() as session:
+                round_trips.append(0)
+                start = time.perf_counter()
+                await create(session, week)
+                create_samples.append(time.perf_counter() - start)
+                create_trips.append(round_trips[-1])
+
+            async with session_factory() as session:
+                round_trips.append(0)
+                start = time.perf_counter()
+                await delete(session, week.id)
+                delete_samples.append(time.perf_counter() - start)
+                delete_trips.append(round_trips[-1])
+    finally:
+        for name, fn in listeners:
+            event.remove(engine.sync_engine, name, fn)
+
+    print(format_summary(f"{label} create", summarize(create_samples)), f"idas={max(create_trips)}")
+    print(format_summary(f"{label} delete", summarize(delete_samples)), f"idas={max(delete_trips)}")
+
+
+async def main(iterations: int) -> None:
+    engine = make_engine()
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        await reset_schema(engine)
+        async with session_factory() as session:
+            session.add(UserModel(id=USER_ID, name="Bench", email="bench@example.com", password="x", role="user"))
+            await session.commit()
+
+        print(f"{engine.dialect.name}, {iterations} iterações")
+        await measure(engine, session_factory, "ORM", iterations, orm_create, orm_delete)
+        await measure(
+            engine, session_factory, "RETURNING", iterations,
+            lambda session, week: SQLAlchemyWeekRepository(session).create(week),
+            lambda session, week_id: SQLAlchemyWeekRepository(session).delete(week_id),
+        )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,105 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Os benchmarks rodam a aplicação em processo (httpx + ASGITransport) contra o
+Postgres de BENCH_DATABASE_URL (postgresql+asyncpg), sem depender do Neon.
+Os repositórios usam recursos do Postgres (CTEs com INSERT/UPDATE/DELETE,
+ON CONFLICT), então não há banco local alternativo.
+"""
+import io
+import os
+import statistics
+from contextlib import asynccontextmanager, redirect_stdout
+from typing import AsyncIterator, Dict, List, Sequence
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from freeroad.api import deps
+from freeroad.api.main import app
+from freeroad.infra.database import Base
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "BenchPass@123"
+
+
+def bench_database_url() -> str:
+    url = os.getenv("BENCH_DATABASE_URL", "")
+    if not url.startswith("postgresql"):
+        raise SystemExit("Defina BENCH_DATABASE_URL com uma URL postgresql+asyncpg.")
+    return url
+
+
+def make_engine() -> AsyncEngine:
+    return create_async_engine(bench_database_url(), echo=False)
+
+
+async def reset_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+@asynccontextmanager
+async def bench_client(engine: AsyncEngine) -> AsyncIterator[AsyncClient]:
+    """Cliente HTTP em processo com o banco de benchmark injetado."""
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[deps.get_db] = override_get_db
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+async def register_and_login(client: AsyncClient, email: str = BENCH_EMAIL, password: str = BENCH_PASSWORD) -> Dict[str, str]:
+    """Registra o usuário de benchmark e retorna os headers de autenticação."""
+    await client.post("/users/register", json={
+        "name": "Bench User",
+        "email": email,
+        "password": password,
+        "role": "user",
+    })
+    response = await client.post("/users/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def quiet():
+    """Silencia os prints de depuração das rotas durante a medição."""
+    return redirect_stdout(io.StringIO())
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Resumo de latências em milissegundos."""
+    ms = [s * 1000 for s in samples]
+    return {
+        "n": len(ms),
+        "mean": statistics.fmean(ms) if ms else 0.0,
+        "p50": percentile(ms, 50),
+        "p95": percentile(ms, 95),
+        "p99": percentile(ms, 99),
+        "max": max(ms) if ms else 0.0,
+    }
+
+
+def format_summary(label: str, summary: Dict[str, float]) -> str:
+    return (
+        f"{label:<32} n={summary['n']:<5} mean={summary['mean']:8.2f}ms "
+        f"p50={summary['p50']:8.2f}ms p95={summary['p95']:8.2f}ms "
+        f"p99={summary['p99']:8.2f}ms max={summary['max']:8.2f}ms"
+    )
@@ -1,22 +1,9 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
-# Configurações do JWT
-SECRET_KEY = "supersecretkeychangeisso"  # em produção, carregar do .env
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 1 dia
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
+from freeroad.api.security import pwd_context, verify_password, get_password_hash  # noqa: F401
+from freeroad.infra.settings import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -35,3 +22,51 @@ def decode_access_token(token: str):
         return payload
     except JWTError:
         return None
+
+
+class Principal:
+    """
+    Usuário autenticado reconstruído a partir das claims do token.
+
+    Contém apenas os dados públicos do usuário, suficientes para as rotas
+    que precisam saber *quem* fez a requisição sem consultar o banco.
+    """
+
+    def __init__(self, id: str, name: str, email: str, role: str):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.role = role
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> Optional["Principal"]:
+        user_id = claims.get("sub")
+        if not user_id:
+            return None
+        return cls(
+            id=user_id,
+            name=claims.get("name", ""),
+            email=claims.get("email", ""),
+            role=claims.get("role", "user"),
+        )
+
+
+def create_user_token(user) -> str:
+    """
+    Emite um token de acesso assinado para o usuário.
+
+    Args:
+        user: Entidade User autenticada.
+
+    Returns:
+        str: Token JWT com as claims do usuário e data de expiração.
+    """
+    return create_access_token(
+        data={
+            "sub": user.id,
+            "name": user.name,
+            "email": str(user.email.value),
+            "role": user.role,
+        },
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
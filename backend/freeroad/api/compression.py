@@ -0,0 +1,116 @@
+import gzip
+from typing import Callable, Dict, Optional
+
+import anyio.to_thread
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Tipos que vale comprimir (o resto já é comprimido ou é binário)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Escolhe "br" ou "gzip" pelo Accept-Encoding (com pesos q); em caso de
+    empate prefere br. None se o cliente não aceita nenhum dos dois.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        key, _, value = params.partition("=")
+        if key.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    chosen, chosen_weight = None, 0.0
+    for encoding in ("br", "gzip"):
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > chosen_weight:
+            chosen, chosen_weight = encoding, weight
+    return chosen
+
+
+class CompressionMiddleware:
+    """
+    Comprime com brotli ou gzip, conforme o Accept-Encoding, respostas
+    completas de tipos textuais a partir de `minimum_size` bytes.
+
+    Atua depois da serialização, sobre o corpo pronto. Respostas em streaming
+    (o primeiro pedaço chega com more_body, como em /weeks/export e no
+    progresso de /weeks/import/csv) passam intactas: comprimir exigiria
+    acumular pedaços e atrasaria o que o cliente já poderia receber.
+    Corpos acima de `thread_minimum_size` são comprimidos fora do event loop.
+
+    Os ETags da API são fracos, então continuam válidos para qualquer codificação.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        thread_minimum_size: int = 256 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_minimum_size = thread_minimum_size
+        self.compressors: Dict[str, Callable[[bytes], bytes]] = {
+            "br": lambda body: brotli.compress(body, quality=brotli_quality),
+            "gzip": lambda body: gzip.compress(body, compresslevel=gzip_level, mtime=0),
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            assert start is not None, "http.response.start deve vir antes do corpo"
+            if message["type"] != "http.response.body" or message.get("more_body", False):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            if (
+                len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and media_type.startswith(COMPRESSIBLE_TYPES)
+            ):
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is not None:
+                    compressed = await self._compress(encoding, body)
+                    if len(compressed) < len(body):
+                        headers["Content-Encoding"] = encoding
+                        headers["Content-Length"] = str(len(compressed))
+                        message = {**message, "body": compressed}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compress(self, encoding: str, body: bytes) -> bytes:
+        compress = self.compressors[encoding]
+        if len(body) >= self.thread_minimum_size:
+            return await anyio.to_thread.run_sync(compress, body)
+        return compress(body)
@@ -0,0 +1,128 @@
+import codecs
+import csv
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+# Colunas aceitas no cabeçalho do CSV -> campo de WeekCreate.
+# Aceita os nomes da API (camelCase) e os das colunas do banco (snake_case).
+CSV_COLUMNS = {
+    "title": "title",
+    "kmatual": "kmAtual",
+    "km_atual": "kmAtual",
+    "kmfinal": "kmFinal",
+    "km_final": "kmFinal",
+    "custo": "custo",
+    "litrosabastecidos": "litrosAbastecidos",
+    "litros_abastecidos": "litrosAbastecidos",
+    "eficiencia": "eficiencia",
+    "created_at": "created_at",
+    "data": "created_at",
+}
+
+# Um registro maior que isso indica arquivo corrompido (ex.: aspas sem fechamento)
+MAX_RECORD_CHARS = 64 * 1024
+
+
+class CsvImportError(ValueError):
+    """Erro que impede continuar a leitura do arquivo."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(message)
+        self.line = line
+
+
+async def iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, List[str]]]:
+    """
+    Lê um CSV (UTF-8, com ou sem BOM) a partir de pedaços de bytes e produz
+    (linha inicial, campos) de cada registro assim que ele termina de chegar.
+
+    Só o registro em andamento fica em memória. Um registro pode ocupar várias
+    linhas quando tem campos entre aspas; ele está completo quando a
+    quantidade de aspas acumulada é par (aspas escapadas "" contam duas).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    pending = ""
+    line = 0
+    record_line = 1
+
+    async def records(text: str, final: bool):
+        nonlocal buffer, pending, line, record_line
+        buffer += text
+        # Só linhas terminadas em \n (ou \r\n) estão completas; o resto espera o próximo pedaço
+        cut = len(buffer) if final else buffer.rfind("\n") + 1
+        complete, buffer = buffer[:cut], buffer[cut:]
+        if len(buffer) > MAX_RECORD_CHARS:
+            raise CsvImportError(line + 1, "Linha muito longa")
+        raws = complete.split("\n")
+        # O pedaço vazio depois do último \n não é uma linha; as linhas em branco
+        # contam na numeração e, dentro de aspas, fazem parte do campo
+        if raws[-1] == "":
+            raws.pop()
+        for raw in raws:
+            raw += "\n"
+            line += 1
+            if not pending:
+                record_line = line
+            pending += raw
+            if pending.count('"') % 2:
+                if len(pending) > MAX_RECORD_CHARS:
+                    raise CsvImportError(record_line, "Registro muito longo ou aspas sem fechamento")
+                continue
+            record, pending = pending, ""
+            if record.strip():
+                yield record_line, next(csv.reader([record]))
+
+    try:
+        async for chunk in chunks:
+            async for item in records(decoder.decode(chunk), final=False):
+                yield item
+        async for item in records(decoder.decode(b"", final=True), final=True):
+            yield item
+    except UnicodeDecodeError:
+        raise CsvImportError(line + 1, "Arquivo deve estar codificado em UTF-8")
+
+    if pending:
+        raise CsvImportError(record_line, "Aspas sem fechamento no fim do arquivo")
+
+
+def map_header(header: List[str]) -> List[Optional[str]]:
+    """
+    Converte o cabeçalho em nomes de campos; colunas desconhecidas viram None
+    e são ignoradas. Levanta CsvImportError se faltar coluna obrigatória.
+    """
+    fields = [CSV_COLUMNS.get(name.strip().lower()) for name in header]
+    missing = [name for name in ("title", "kmAtual", "custo", "litrosAbastecidos") if name not in fields]
+    if missing:
+        raise CsvImportError(1, f"Colunas obrigatórias ausentes: {', '.join(missing)}")
+    return fields
+
+
+def record_to_item(fields: List[Optional[str]], values: List[str]) -> Dict[str, str]:
+    """Monta o dicionário do registro, omitindo células vazias e colunas ignoradas."""
+    return {
+        field: value.strip()
+        for field, value in zip(fields, values)
+        if field is not None and value.strip() != ""
+    }
+
+
+class ImportProgressResponse(StreamingResponse):
+    """
+    StreamingResponse para rotas que continuam lendo o corpo da requisição
+    enquanto respondem (o gerador consome request.stream()).
+
+    Em servidores com ASGI spec < 2.4 o StreamingResponse padrão escuta
+    `receive` em paralelo para detectar desconexão, o que consumiria os
+    pedaços do corpo antes do gerador. Aqui a desconexão aparece como
+    ClientDisconnect na própria leitura do corpo.
+    """
+
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
@@ -3,10 +3,12 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 # from freeroad.infra.database import SessionLocal
 from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
+from freeroad.infra.repositories.cached_week_repository import CachedWeekRepository, WeekCacheStats
 from freeroad.infra.repositories.sqlalchemy.sqlalchemy_user_repository import SQLAlchemyUserRepository
+from freeroad.infra.repositories.sqlalchemy.sqlalchemy_idempotency_repository import SQLAlchemyIdempotencyRepository
 from freeroad.infra.repositories.in_memory_user_repository import InMemoryUserRepository
 from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
-from typing import Generator
+from typing import Generator, Optional
 
 
 # Instâncias em memória para simulação
@@ -18,8 +20,56 @@ security = HTTPBearer()
 from sqlalchemy.ext.asyncio import AsyncSession
 from freeroad.infra.database import async_session
 from freeroad.domain.entities.user import User
+from freeroad.api.auth import Principal, decode_access_token
+from freeroad.infra.cache import TTLCache
+from freeroad.api.login_limiter import LoginLimiter
+from freeroad.domain.repositories.week_repository import WeekRepository
+from freeroad.infra.week_cache import MemcachedWeekCache, MemoryWeekCache, WeekCacheBackend
+from freeroad.infra.settings import (
+    PRINCIPAL_CACHE_MAXSIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+    LOGIN_EMAIL_BURST,
+    LOGIN_EMAIL_PER_MINUTE,
+    LOGIN_CLIENT_BURST,
+    LOGIN_CLIENT_PER_MINUTE,
+    LOGIN_MAX_CONCURRENT_VERIFICATIONS,
+    WEEK_CACHE_BACKEND,
+    WEEK_CACHE_MAXSIZE,
+    WEEK_CACHE_MEMCACHED_HOST,
+    WEEK_CACHE_MEMCACHED_PORT,
+    WEEK_CACHE_TTL_SECONDS,
+)
 from collections.abc import AsyncGenerator
 
+# Cache de usuários autenticados, compartilhado por todas as rotas
+principal_cache = TTLCache(maxsize=PRINCIPAL_CACHE_MAXSIZE, ttl=PRINCIPAL_CACHE_TTL_SECONDS)
+
+# Controle de admissão do login, compartilhado pelo processo
+login_limiter = LoginLimiter(
+    email_capacity=LOGIN_EMAIL_BURST,
+    email_rate=LOGIN_EMAIL_PER_MINUTE / 60,
+    client_capacity=LOGIN_CLIENT_BURST,
+    client_rate=LOGIN_CLIENT_PER_MINUTE / 60,
+    max_concurrent=LOGIN_MAX_CONCURRENT_VERIFICATIONS,
+)
+
+
+
+def make_week_cache(backend: str) -> Optional[WeekCacheBackend]:
+    """Cria o backend do cache de registros configurado em WEEK_CACHE_BACKEND."""
+    if not backend:
+        return None
+    if backend == "memory":
+        return MemoryWeekCache(maxsize=WEEK_CACHE_MAXSIZE, ttl=WEEK_CACHE_TTL_SECONDS)
+    if backend == "memcached":
+        return MemcachedWeekCache(WEEK_CACHE_MEMCACHED_HOST, WEEK_CACHE_MEMCACHED_PORT, ttl=WEEK_CACHE_TTL_SECONDS)
+    raise ValueError(f"WEEK_CACHE_BACKEND inválido: {backend!r} (use memory ou memcached)")
+
+
+# Cache read-through dos registros (None se desligado) e seus contadores
+week_cache = make_week_cache(WEEK_CACHE_BACKEND)
+week_cache_stats = WeekCacheStats()
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
@@ -30,8 +80,15 @@ def get_week_repository() -> InMemoryWeekRepository:
     return week_repo
 
 # Use o repositório SQLAlchemy se precisar dele
-def get_sqlalchemy_week_repository(db: AsyncSession = Depends(get_db)) -> SQLAlchemyWeekRepository:
-    return SQLAlchemyWeekRepository(session=db)
+def get_sqlalchemy_week_repository(db: AsyncSession = Depends(get_db)) -> WeekRepository:
+    repository = SQLAlchemyWeekRepository(session=db)
+    if week_cache is None:
+        return repository
+    return CachedWeekRepository(repository, week_cache, week_cache_stats)
+
+# Chaves de idempotência; na mesma sessão do repositório de registros da requisição
+def get_idempotency_repository(db: AsyncSession = Depends(get_db)) -> SQLAlchemyIdempotencyRepository:
+    return SQLAlchemyIdempotencyRepository(session=db)
 
 # Função para obter o repositório de usuário
 def get_user_repository() -> InMemoryUserRepository:
@@ -41,10 +98,31 @@ def get_user_repository() -> InMemoryUserRepository:
 def get_sqlalchemy_user_repository(db: AsyncSession = Depends(get_db)) -> SQLAlchemyUserRepository:
     return SQLAlchemyUserRepository(session=db)
 
-# Função para obter o usuário atual
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    token = credentials.credentials
-    user = await user_repo.get_current_user()  # Adicione o await para resolver a coroutine
-    if not user or user.id != token:
+# Função para obter o usuário autenticado a partir do token (sem acesso ao banco)
+async def get_current_user_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Principal:
+    payload = decode_access_token(credentials.credentials)
+    principal = Principal.from_claims(payload) if payload else None
+    if not principal:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Usuário não autenticado.")
+    return principal
+
+# Função para obter o usuário atual completo (consulta o banco apenas em caso de cache miss)
+async def get_current_user(
+    principal: Principal = Depends(get_current_user_token),
+    user_repo: SQLAlchemyUserRepository = Depends(get_sqlalchemy_user_repository),
+) -> User:
+    user = principal_cache.get(principal.id)
+    if user is not None:
+        return user
+
+    user = await user_repo.get_by_id(principal.id)
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Usuário não autenticado.")
-    return user
\ No newline at end of file
+    principal_cache.set(principal.id, user)
+    return user
+
+# Remove o usuário do cache; chamar sempre que um usuário for criado, alterado ou removido
+def invalidate_cached_user(user_id: str) -> None:
+    principal_cache.invalidate(user_id)
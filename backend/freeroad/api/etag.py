@@ -0,0 +1,36 @@
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# Os clientes guardam a resposta, mas devem revalidar a cada uso (If-None-Match)
+CACHE_CONTROL = "private, no-cache"
+
+
+def version_etag(user_id: str, version: int) -> str:
+    """
+    ETag fraco a partir da versão dos registros do usuário. Fraco porque o
+    mesmo estado pode ser serializado de formas equivalentes (ex.: compressão).
+    """
+    return f'W/"{user_id}.{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparação fraca do If-None-Match (lista de tags ou *) com o ETag atual."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Retorna um 304 se o cliente já tem a versão `etag`; caso contrário
+    adiciona o ETag à resposta que a rota vai montar e retorna None.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,64 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+
+from freeroad.domain.entities.week import Week
+
+# Colunas exportadas, na ordem do CSV. Os nomes são os mesmos aceitos por
+# POST /weeks/import/csv, então um export pode ser reimportado.
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "title",
+    "kmAtual",
+    "kmFinal",
+    "custo",
+    "eficiencia",
+    "litrosAbastecidos",
+    "created_at",
+    "updated_at",
+)
+
+
+def week_to_record(week: Week) -> Dict[str, object]:
+    """Registro exportado de uma entidade (datas em ISO 8601)."""
+    return {
+        "id": week.id,
+        "user_id": week.user_id,
+        "title": week.title,
+        "kmAtual": week.kmAtual,
+        "kmFinal": week.kmFinal,
+        "custo": week.custo,
+        "eficiencia": week.eficiencia,
+        "litrosAbastecidos": week.litrosAbastecidos,
+        "created_at": week.created_at.isoformat(),
+        "updated_at": week.updated_at.isoformat(),
+    }
+
+
+async def ndjson_chunks(batches: AsyncIterator[List[Week]]) -> AsyncIterator[str]:
+    """Um objeto JSON por linha; um pedaço da resposta por lote do banco."""
+    async for weeks in batches:
+        yield "".join(json.dumps(week_to_record(week), ensure_ascii=False) + "\n" for week in weeks)
+
+
+async def csv_chunks(batches: AsyncIterator[List[Week]]) -> AsyncIterator[str]:
+    """Cabeçalho no primeiro pedaço (enviado antes da primeira consulta) e um pedaço por lote."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for weeks in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(week_to_record(week) for week in weeks)
+        yield buffer.getvalue()
+
+
+# formato -> (media type, gerador dos pedaços da resposta)
+EXPORT_FORMATS: Dict[str, Tuple[str, Callable[[AsyncIterator[List[Week]]], AsyncIterator[str]]]] = {
+    "ndjson": ("application/x-ndjson", ndjson_chunks),
+    "csv": ("text/csv; charset=utf-8", csv_chunks),
+}
@@ -0,0 +1,26 @@
+import hashlib
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+# Presente nas respostas reenviadas a partir de uma chave já usada
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def request_fingerprint(payload: BaseModel) -> str:
+    """
+    SHA-256 do corpo já validado, com chaves ordenadas: a mesma requisição
+    gera o mesmo valor independente da formatação do JSON enviado.
+    """
+    return hashlib.sha256(orjson.dumps(payload.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def replayed_response(status_code: int, body: bytes) -> Response:
+    """Resposta guardada de uma chave concluída, sem reprocessar a requisição."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+    )
@@ -0,0 +1,142 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from freeroad.infra.cache import TTLCache
+
+
+class LoginRateLimited(Exception):
+    """Tentativa de login recusada pelo controle de admissão."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Balde de tokens clássico: até `capacity` tentativas em rajada,
+    reabastecido continuamente a `rate` tokens por segundo.
+    """
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def retry_after(self) -> float:
+        """Segundos até haver um token disponível."""
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class LoginLimiter:
+    """
+    Controle de admissão para /users/login.
+
+    Cada tentativa consome um token do balde do email e um do balde do cliente
+    (IP). Além disso, limita o número de verificações bcrypt simultâneas.
+    As recusas acontecem antes de qualquer hash, portanto são baratas.
+    """
+
+    def __init__(
+        self,
+        email_capacity: float = 5,
+        email_rate: float = 5 / 60,
+        client_capacity: float = 20,
+        client_rate: float = 1.0,
+        max_concurrent: int = 8,
+        max_tracked: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.email_capacity = email_capacity
+        self.email_rate = email_rate
+        self.client_capacity = client_capacity
+        self.client_rate = client_rate
+        self.max_concurrent = max_concurrent
+        self._clock = clock
+
+        # Um balde ocioso por capacity/rate segundos está cheio de novo,
+        # então pode ser descartado sem mudar o comportamento.
+        self._email_buckets = TTLCache(maxsize=max_tracked, ttl=email_capacity / email_rate, clock=clock)
+        self._client_buckets = TTLCache(maxsize=max_tracked, ttl=client_capacity / client_rate, clock=clock)
+
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected_email = 0
+        self.rejected_client = 0
+        self.rejected_concurrency = 0
+
+    def _bucket(self, buckets: TTLCache, key: str, capacity: float, rate: float, now: float) -> TokenBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(capacity, rate, now)
+        else:
+            bucket.refill(now)
+        return bucket
+
+    def check(self, email: str, client: str) -> None:
+        """
+        Consome um token do email e do cliente ou levanta LoginRateLimited.
+        """
+        now = self._clock()
+        email_key = email.strip().lower()
+        client_bucket = self._bucket(self._client_buckets, client, self.client_capacity, self.client_rate, now)
+        email_bucket = self._bucket(self._email_buckets, email_key, self.email_capacity, self.email_rate, now)
+
+        if client_bucket.tokens < 1:
+            self.rejected_client += 1
+            self._client_buckets.set(client, client_bucket)
+            raise LoginRateLimited("client", client_bucket.retry_after())
+        if email_bucket.tokens < 1:
+            self.rejected_email += 1
+            self._email_buckets.set(email_key, email_bucket)
+            raise LoginRateLimited("email", email_bucket.retry_after())
+
+        client_bucket.tokens -= 1
+        email_bucket.tokens -= 1
+        self._client_buckets.set(client, client_bucket)
+        self._email_buckets.set(email_key, email_bucket)
+
+    @contextmanager
+    def verification_slot(self) -> Iterator[None]:
+        """
+        Reserva uma vaga de verificação de senha ou levanta LoginRateLimited
+        imediatamente se todas estiverem ocupadas.
+        """
+        if self.in_flight >= self.max_concurrent:
+            self.rejected_concurrency += 1
+            raise LoginRateLimited("concurrency", 1.0)
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def reset(self) -> None:
+        """Esquece todos os baldes (os contadores são mantidos)."""
+        self._email_buckets.clear()
+        self._client_buckets.clear()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Retorna os contadores do limitador."""
+        return {
+            "admitted": self.admitted,
+            "rejected_email": self.rejected_email,
+            "rejected_client": self.rejected_client,
+            "rejected_concurrency": self.rejected_concurrency,
+            "in_flight": self.in_flight,
+            "max_concurrent": self.max_concurrent,
+            "tracked_emails": len(self._email_buckets),
+            "tracked_clients": len(self._client_buckets),
+        }
@@ -3,7 +3,14 @@ from fastapi import FastAPI, HTTPException
 from freeroad.api.routes import user_route, week_route
 from freeroad.api.openapi_tags import openapi_tags
 from freeroad.infra.repositories.in_memory_user_repository import InMemoryUserRepository
-from freeroad.api.deps import get_user_repository
+from freeroad.api import deps
+from freeroad.api.compression import CompressionMiddleware
+from freeroad.api.deps import get_user_repository, principal_cache, login_limiter
+from freeroad.infra.settings import (
+    RESPONSE_COMPRESSION_BROTLI_QUALITY,
+    RESPONSE_COMPRESSION_GZIP_LEVEL,
+    RESPONSE_COMPRESSION_MIN_SIZE,
+)
 import os
 import sys
 from urllib.parse import urlparse, ParseResult
@@ -65,6 +72,34 @@ async def debug_environment():
     }
 
 
+@app.get("/debug/auth-cache", tags=["Debug"])
+async def debug_auth_cache():
+    """Contadores do cache de usuários autenticados"""
+    return principal_cache.stats()
+
+
+@app.get("/debug/login-limiter", tags=["Debug"])
+async def debug_login_limiter():
+    """Contadores do controle de admissão do login"""
+    return login_limiter.stats()
+
+
+@app.get("/debug/week-cache", tags=["Debug"])
+async def debug_week_cache():
+    """Acertos, invalidações e idade das entradas servidas pelo cache de registros"""
+    if deps.week_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **deps.week_cache_stats.snapshot(), "backend": deps.week_cache.stats()}
+
+
+# Compressão negociada das respostas já serializadas (streaming passa direto)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=RESPONSE_COMPRESSION_MIN_SIZE,
+    gzip_level=RESPONSE_COMPRESSION_GZIP_LEVEL,
+    brotli_quality=RESPONSE_COMPRESSION_BROTLI_QUALITY,
+)
+
 # Configuração do CORS - Importante: isso deve vir ANTES da inclusão dos routers
 # para garantir que os cabeçalhos CORS sejam aplicados a todas as rotas
 app.add_middleware(
@@ -0,0 +1,88 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from freeroad.domain.entities.week import Week
+from freeroad.domain.repositories.week_repository import WeekKey
+from freeroad.domain.value_objects.week_change import WeekChange
+
+# Header com o cursor da próxima página (ausente na última página)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _encode(values: List[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def encode_cursor(week: Week) -> str:
+    """Gera um cursor opaco a partir da chave (created_at, id) do registro."""
+    return _encode([week.created_at.isoformat(), week.id])
+
+
+def decode_cursor(cursor: str) -> WeekKey:
+    """Converte o cursor opaco de volta para a chave (created_at, id)."""
+    try:
+        created_at, week_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), str(week_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Cursor de paginação inválido.") from e
+
+
+def encode_changes_cursor(key: WeekKey, floor: Optional[datetime]) -> str:
+    """
+    Cursor do feed de alterações: a chave (changed_at, id) da última alteração
+    recebida e, no meio de uma sincronização com várias páginas, o piso dela
+    (ver next_changes_cursor).
+    """
+    return _encode([key[0].isoformat(), key[1], floor.isoformat() if floor else None])
+
+
+def decode_changes_cursor(cursor: str) -> Tuple[WeekKey, Optional[datetime]]:
+    """Converte o cursor do feed de volta para (chave, piso)."""
+    try:
+        changed_at, week_id, floor = _decode(cursor)
+        return (datetime.fromisoformat(changed_at), str(week_id)), datetime.fromisoformat(floor) if floor else None
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Cursor de sincronização inválido.") from e
+
+
+def next_changes_cursor(changes: List[WeekChange], has_more: bool, floor: datetime) -> str:
+    """
+    Cursor da próxima requisição ao feed de alterações.
+
+    `floor` é o instante "assentado" (agora menos WEEK_CHANGES_SETTLE_SECONDS)
+    da primeira página da sincronização: updated_at é definido antes do commit,
+    então uma escrita com carimbo anterior ainda pode estar em uma transação
+    aberta. Enquanto há mais páginas, o cursor avança pela última alteração
+    enviada e leva o piso junto; na última página volta para o piso, e as
+    alterações posteriores a ele são enviadas de novo na sincronização
+    seguinte. Reaplicar uma alteração já recebida é inofensivo.
+    """
+    if has_more:
+        return encode_changes_cursor(changes[-1].key, floor)
+    return encode_changes_cursor((floor, ""), None)
+
+
+def split_page(weeks: List[Week], limit: Optional[int]) -> Tuple[List[Week], Optional[str]]:
+    """
+    Recebe até `limit + 1` registros e separa a página do cursor seguinte.
+    O registro extra só indica que existe uma próxima página.
+    """
+    if limit is None or len(weeks) <= limit:
+        return weeks, None
+    page = weeks[:limit]
+    return page, encode_cursor(page[-1])
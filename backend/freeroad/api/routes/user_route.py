@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 # in_memory e sqlalchemy
 # |
 from freeroad.api.deps import user_repo
 from freeroad.api.deps import get_sqlalchemy_user_repository
+from freeroad.api.deps import get_current_user, invalidate_cached_user
+from freeroad.api.deps import login_limiter
+from freeroad.api.login_limiter import LoginRateLimited
+from freeroad.api.auth import create_user_token
 # |
 # 
 from freeroad.usecases.user.register_user import RegisterUserUseCase
@@ -15,6 +19,7 @@ from freeroad.domain.value_objects.email_vo import Email
 from freeroad.domain.value_objects.password import Password
 from freeroad.domain.value_objects.password import PasswordValidationError
 
+import math
 import uuid
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi import Depends
@@ -30,32 +35,6 @@ router = APIRouter()
 
 security = HTTPBearer()
 
-async def get_current_user_token(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_repo=Depends(get_sqlalchemy_user_repository)
-):
-    token = credentials.credentials
-    print(f"Token verification: {token}")
-    
-    # Verificar caso especial para o token de teste
-    if token == "fcafee34-c13d-4053-a014-71b6169a4be6":
-        print("Using test token in helper function")
-        user = await user_repo.get_by_email(Email("usuario@teste.com.br"))
-        if user:
-            return user
-    
-    # Fluxo normal - verificar pelo ID do usuário
-    try:
-        user = await user_repo.get_by_id(token)
-        print(f"Found user by token: {user}")
-        if user:
-            return user
-            
-        raise HTTPException(status_code=401, detail="Usuário não autenticado.")
-    except Exception as e:
-        print(f"Authentication error: {e}")
-        raise HTTPException(status_code=401, detail="Usuário não autenticado.")
-
 # ----------------------
 # Login
 # ----------------------
@@ -63,31 +42,44 @@ async def get_current_user_token(
 @router.post("/login")
 async def login_user(
     data: LoginUserInput,
+    request: Request,
     user_repo=Depends(get_sqlalchemy_user_repository)  # Usando o repositório SQLAlchemy
 ):
     print(f"Login attempt for email: {data.email}")
-    
-    # Verificar caso especial para o usuário de teste
-    if data.email == "usuario@teste.com.br" and data.password == "testePass@123":
-        print("Using test user login")
-        # Tenta buscar o usuário de teste
-        user = await user_repo.get_by_email(Email(data.email))
-        if user:
-            print(f"Test user found: {user.id}")
-            await user_repo.set_current_user(user)
-            return {"access_token": "fcafee34-c13d-4053-a014-71b6169a4be6", "token_type": "bearer"}
-        else:
-            print("Test user not found in database")
-    
-    # Fluxo normal para outros usuários
-    user = await user_repo.get_by_email(Email(data.email))
-    if not user or not user.password.verify(data.password):
+
+    # Controle de admissão: recusa rápida antes de qualquer consulta ou hash
+    client_id = request.client.host if request.client else "unknown"
+    try:
+        login_limiter.check(data.email, client_id)
+        with login_limiter.verification_slot():
+            user = await user_repo.get_by_email(Email(data.email))
+            valid, rehashed = (
+                await user.password.verify_and_update_async(data.password)
+                if user is not None
+                else (False, None)
+            )
+    except LoginRateLimited as e:
+        print(f"Login rejected ({e.reason}) for email: {data.email}")
+        raise HTTPException(
+            status_code=429,
+            detail="Muitas tentativas de login. Tente novamente mais tarde.",
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+
+    if not valid:
         print("Invalid credentials")
         raise HTTPException(status_code=401, detail="Credenciais inválidas.")
     
     print(f"User authenticated: {user.id}")
+
+    # Migra gradualmente hashes gerados com outro custo de bcrypt
+    if rehashed:
+        await user_repo.update_password(user.id, rehashed)
+        user.password = rehashed
+        invalidate_cached_user(user.id)
+
     await user_repo.set_current_user(user)
-    return {"access_token": user.id, "token_type": "bearer"}
+    return {"access_token": create_user_token(user), "token_type": "bearer"}
 
 # ----------------------
 # Get Current User
@@ -100,46 +92,14 @@ async def login_user(
     description="Retorna os dados do usuário atual.",
 )
 async def get_current_user_route(
-    user_repo=Depends(get_sqlalchemy_user_repository),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user: User = Depends(get_current_user),
 ):
-    print("Endpoint /me called")
-    token = credentials.credentials
-    print(f"Token received: {token}")
-    
-    # Primeiro, tenta validar o token exato que você mencionou para o usuário de teste
-    if token == "fcafee34-c13d-4053-a014-71b6169a4be6":
-        print("Using test token")
-        # Busca o usuário pelo email de teste
-        user = await user_repo.get_by_email(Email("usuario@teste.com.br"))
-        if user:
-            return {
-                "id": user.id,
-                "name": user.name,
-                "email": str(user.email.value),
-                "role": user.role,
-            }
-    
-    # Caso não seja o token de teste, tenta o fluxo normal
-    try:
-        # Tenta buscar o usuário pelo token como ID
-        user = await user_repo.get_by_id(token)
-        print(f"User retrieved by ID: {user}")
-        
-        if user:
-            return {
-                "id": user.id,
-                "name": user.name,
-                "email": str(user.email.value),
-                "role": user.role,
-            }
-        
-        # Se não encontrar pelo ID, levanta uma exceção
-        print("Authentication failed - user not found")
-        raise HTTPException(status_code=401, detail="Usuário não autenticado.")
-    except Exception as e:
-        print(f"Error in authentication: {e}")
-        raise HTTPException(status_code=401, detail="Erro de autenticação.")
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": str(user.email.value),
+        "role": user.role,
+    }
 
 # ----------------------
 # Register
@@ -166,11 +126,12 @@ async def register_user(
             id=str(uuid.uuid4()),
             name=data.name,
             email=Email(data.email),
-            password=Password(data.password),  # Validação ocorre aqui
+            password=await Password.create(data.password),  # Validação ocorre aqui
             role=data.role,
         )
         usecase = RegisterUserUseCase(user_repo)
         result = await usecase.execute(user_obj)
+        invalidate_cached_user(result.id)
         return RegisterUserResponse(
             message="User registered successfully",
             user=UserOutput(
@@ -1,78 +1,170 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response, status
+from typing import List, Literal, NamedTuple, Optional, Dict, Any, Tuple
 from uuid import uuid4
-from datetime import datetime
+import json
+import math
+from datetime import datetime, timedelta
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
 from freeroad.domain.entities.week import Week
-from freeroad.api.deps import get_week_repository, get_user_repository
+from freeroad.domain.repositories.week_repository import InvalidFinalKmError, WeekKey
+from freeroad.api.pagination import (
+    NEXT_CURSOR_HEADER,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    InvalidCursorError,
+    decode_changes_cursor,
+    decode_cursor,
+    next_changes_cursor,
+    split_page,
+)
+from freeroad.api.csv_import import (
+    CsvImportError,
+    ImportProgressResponse,
+    iter_csv_records,
+    map_header,
+    record_to_item,
+)
+from freeroad.api.export import EXPORT_FORMATS
+from freeroad.api.etag import conditional_response, version_etag
+from freeroad.api.week_json import WeekChangesResponse, WeekItemResponse, WeekListResponse
+from freeroad.api.idempotency import IDEMPOTENCY_KEY_HEADER, replayed_response, request_fingerprint
+from freeroad.api.deps import get_week_repository, get_user_repository, get_idempotency_repository
 from freeroad.api.deps import get_sqlalchemy_week_repository
-from freeroad.api.deps import get_sqlalchemy_user_repository
-from freeroad.domain.value_objects.email_vo import Email
+from freeroad.api.deps import get_current_user_token
 from freeroad.usecases.week.get_all import GetAllWeeksUseCase
 from freeroad.usecases.week.get_by_id import GetWeekByIdUseCase
 from freeroad.usecases.week.get_by_user_id import GetWeeksByUserIdUseCase
 from freeroad.usecases.week.create_week import CreateWeekUseCase
+from freeroad.usecases.week.create_weeks_bulk import CreateWeeksBulkUseCase
 from freeroad.usecases.week.delete_week import DeleteWeekUseCase
+from freeroad.usecases.week.export_weeks import ExportWeeksUseCase
 from freeroad.usecases.week.add_final_km import AddFinalKmUseCase
+from freeroad.usecases.week.add_final_km_batch import AddFinalKmBatchUseCase
+from freeroad.usecases.week.calculate_average_efficiency import CalculateAverageEfficiencyUseCase
+from freeroad.usecases.week.get_fuel_series import GetFuelSeriesUseCase
+from freeroad.usecases.week.get_changes import GetWeekChangesUseCase
 
 # Import schemas if you have them
 from freeroad.api.schemas.week_schema import (
     WeekCreate, 
     WeekResponse, 
     WeekUpdate,
-    WeekFinalKm
+    WeekFinalKm,
+    WeekFinalKmItem,
+    WeekFinalKmBatchResult,
+    WeekAnalytics,
+    WeekSeriesPoint,
+    WeekBulkResult,
+    WeekChangesPage,
+)
+from freeroad.infra.settings import (
+    IDEMPOTENCY_KEY_TTL_SECONDS,
+    IDEMPOTENCY_WAIT_SECONDS,
+    WEEK_BULK_MAX_ITEMS,
+    WEEK_CHANGES_SETTLE_SECONDS,
+    WEEK_EXPORT_BATCH_SIZE,
+    WEEK_FINAL_KM_BATCH_MAX_ITEMS,
+    WEEK_IMPORT_CHUNK_SIZE,
+    WEEK_TOMBSTONE_RETENTION_DAYS,
+)
+from freeroad.infra.models.week_model import (
+    CUSTO_SCALE, EFICIENCIA_SCALE, KM_SCALE, LITROS_SCALE, MAX_UNITS, fits_units,
 )
 
 router = APIRouter()
 
 security = HTTPBearer()
 
-async def get_current_user_token(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_repo=Depends(get_sqlalchemy_user_repository)
-):
-    token = credentials.credentials
-    print(f"Token verification: {token}")
-    
-    # Verificar caso especial para o token de teste
-    if token == "fcafee34-c13d-4053-a014-71b6169a4be6":
-        print("Using test token in helper function")
-        user = await user_repo.get_by_email(Email("usuario@teste.com.br"))
-        if user:
-            return user
-        user = await user_repo.get_by_email(Email("usuario@teste.com.br"))
-        if user:
-            return user
-    
-    # Fluxo normal - verificar pelo ID do usuário
+def resolve_page_params(limit: Optional[int], cursor: Optional[str]) -> Tuple[Optional[int], Optional[WeekKey]]:
+    """
+    Valida os parâmetros de paginação e retorna (limit, chave keyset do cursor).
+    Sem cursor nem limit, a listagem continua retornando todos os registros.
+    """
+    if cursor is None:
+        return limit, None
     try:
-        user = await user_repo.get_by_id(token)
-        print(f"Found user by token: {user}")
-        if user:
-            return user
-            
-        raise HTTPException(status_code=401, detail="Usuário não autenticado.")
-    except Exception as e:
-        print(f"Authentication error: {e}")
-        raise HTTPException(status_code=401, detail="Usuário não autenticado.")
+        return limit or DEFAULT_PAGE_LIMIT, decode_cursor(cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+async def check_not_modified(request: Request, response: Response, week_repo, user_id: str) -> Optional[Response]:
+    """
+    Valida o If-None-Match contra a versão dos registros do usuário.
+
+    A versão é lida antes dos registros: se uma escrita acontecer entre as
+    duas leituras, o ETag enviado é o anterior e o cliente apenas recebe os
+    dados de novo na próxima consulta, nunca um 304 indevido.
+    """
+    etag = version_etag(user_id, await week_repo.get_version(user_id))
+    return conditional_response(request, response, etag)
+
+
+async def idempotent_replay(
+    idempotency_repo, week_repo, user_id: str, key: str, fingerprint: str
+) -> Optional[Response]:
+    """
+    Resposta de uma requisição anterior com a mesma Idempotency-Key, ou None
+    se a chave ainda não foi usada. Se a original ainda está em andamento,
+    espera por ela (até IDEMPOTENCY_WAIT_SECONDS) em vez de criar outro registro.
+    """
+    record = await idempotency_repo.wait(user_id, key, IDEMPOTENCY_WAIT_SECONDS)
+    if record is None:
+        return None
+    if record.fingerprint != fingerprint:
+        return JSONResponse(
+            status_code=422,  # constante renomeada entre versões do Starlette
+            content=error_response(
+                status_code=422,
+                message=f"{IDEMPOTENCY_KEY_HEADER} já usada com outro corpo de requisição"
+            )
+        )
+    if record.status_code is None:
+        # O registro foi gravado (a chave só existe após o commit da criação),
+        # mas a resposta não foi guardada: ex.: processo encerrado no meio
+        week = await week_repo.get_by_id(record.week_id)
+        if week is None:
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content=error_response(
+                    status_code=409,
+                    message=f"Registro criado com esta {IDEMPOTENCY_KEY_HEADER} não existe mais"
+                )
+            )
+        created = WeekItemResponse(week, status_code=status.HTTP_201_CREATED)
+        body = bytes(created.body)
+        await idempotency_repo.complete(user_id, key, created.status_code, body)
+        return replayed_response(created.status_code, body)
+    return replayed_response(record.status_code, record.response_body)
+
 
 # Todas as rotas protegidas abaixo:
 @router.get("/", response_model=List[WeekResponse])
 async def get_all_weeks(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Tamanho da página"),
+    cursor: Optional[str] = Query(None, description=f"Cursor opaco recebido no header {NEXT_CURSOR_HEADER}"),
     week_repo=Depends(get_sqlalchemy_week_repository),
     user=Depends(get_current_user_token)
 ):
     """
-    Retorna todos os registros de abastecimento.
+    Retorna os registros de abastecimento, do mais recente para o mais antigo.
+
+    Com `limit`, retorna uma página; o cursor da próxima página vem no header
+    `X-Next-Cursor` e deve ser enviado em `cursor` na requisição seguinte.
     """
+    limit, after = resolve_page_params(limit, cursor)
     try:
         usecase = GetAllWeeksUseCase(week_repo)
-        weeks = await usecase.execute()
+        weeks = await usecase.execute(limit=limit + 1 if limit else None, after=after)
+        weeks, next_cursor = split_page(weeks, limit)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         print(f"Debug: Found {len(weeks) if weeks else 0} weeks")
-        print(f"Debug: Week types: {[type(w) for w in weeks] if weeks else []}")
-        return weeks
+        return WeekListResponse(weeks, headers=response.headers)
     except Exception as e:
         import traceback
         print(f"Error in get_all_weeks: {str(e)}")
@@ -80,6 +172,139 @@ async def get_all_weeks(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/analytics",
+    response_model=WeekAnalytics,
+    summary="Indicadores de consumo de combustível",
+    description="Eficiência média, custo total, distância total e litros totais de um usuário, calculados no banco.",
+    responses={304: {"description": "Registros não mudaram desde o ETag enviado em If-None-Match"}},
+)
+async def get_week_analytics(
+    request: Request,
+    response: Response,
+    user_id: Optional[str] = Query(None, description="ID do usuário (padrão: usuário autenticado)"),
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Retorna os indicadores de consumo do usuário em uma única consulta agregada.
+
+    Responde com `ETag`; com `If-None-Match` igual, retorna 304 sem corpo.
+    """
+    owner = user_id or user.id
+    not_modified = await check_not_modified(request, response, week_repo, owner)
+    if not_modified:
+        return not_modified
+    usecase = CalculateAverageEfficiencyUseCase(week_repo)
+    return await usecase.execute(owner)
+
+
+@router.get(
+    "/series",
+    response_model=List[WeekSeriesPoint],
+    summary="Série de consumo por semana ou mês",
+    description="Custo, litros, distância e eficiência média por período, agrupados no banco com date_trunc.",
+    responses={304: {"description": "Registros não mudaram desde o ETag enviado em If-None-Match"}},
+)
+async def get_week_series(
+    request: Request,
+    response: Response,
+    period: Literal["week", "month"] = Query("month", description="Agrupamento: week (segunda-feira) ou month"),
+    start: Optional[datetime] = Query(None, description="Considera registros criados a partir desta data"),
+    end: Optional[datetime] = Query(None, description="Considera registros criados antes desta data"),
+    user_id: Optional[str] = Query(None, description="ID do usuário (padrão: usuário autenticado)"),
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Retorna um ponto por período com registros, do mais antigo para o mais recente.
+
+    Responde com `ETag`; com `If-None-Match` igual, retorna 304 sem corpo.
+    """
+    owner = user_id or user.id
+    not_modified = await check_not_modified(request, response, week_repo, owner)
+    if not_modified:
+        return not_modified
+    usecase = GetFuelSeriesUseCase(week_repo)
+    return await usecase.execute(owner, period, start, end)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Exportar o histórico de um usuário",
+    description="Todos os registros do usuário, do mais antigo ao mais recente, em NDJSON ou CSV.",
+)
+async def export_weeks(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Formato: ndjson (um JSON por linha) ou csv"),
+    user_id: Optional[str] = Query(None, description="ID do usuário (padrão: usuário autenticado)"),
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Exporta o histórico em streaming: os registros são lidos por um cursor no
+    servidor, em lotes de WEEK_EXPORT_BATCH_SIZE, e cada lote é enviado assim
+    que chega. O tempo até o primeiro byte e a memória não dependem do total.
+    """
+    media_type, chunks = EXPORT_FORMATS[format]
+    owner = user_id or user.id
+    batches = ExportWeeksUseCase(week_repo).execute(owner, WEEK_EXPORT_BATCH_SIZE)
+    return StreamingResponse(
+        chunks(batches),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="weeks-{owner}.{format}"'},
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=WeekChangesPage,
+    summary="Alterações desde a última sincronização",
+    description="Registros criados ou alterados e registros removidos desde o cursor, para clientes offline.",
+    responses={410: {"description": "Cursor mais antigo que a retenção das remoções: sincronizar do zero"}},
+)
+async def get_week_changes(
+    since: Optional[str] = Query(None, description="Cursor recebido na resposta anterior (ausente na primeira sincronização)"),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Quantidade máxima de alterações"),
+    user_id: Optional[str] = Query(None, description="ID do usuário (padrão: usuário autenticado)"),
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Retorna as alterações nos registros do usuário em ordem de (changed_at, id),
+    lidas pelo índice (user_id, updated_at, id) e pelas remoções registradas.
+
+    Sem `since`, retorna todos os registros atuais (primeira sincronização).
+    Enquanto `has_more` for true, requisite de novo com o `cursor` recebido;
+    depois, guarde o cursor para a próxima sincronização. Alterações dos
+    últimos segundos podem ser enviadas de novo: aplique-as por `id`.
+
+    Se o cursor for mais antigo que WEEK_TOMBSTONE_RETENTION_DAYS, as remoções
+    já foram descartadas e a resposta é 410: descarte os dados locais e
+    sincronize sem `since`.
+    """
+    now = datetime.now()
+    after, floor = None, None
+    if since is not None:
+        try:
+            after, floor = decode_changes_cursor(since)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if (floor or after[0]) < now - timedelta(days=WEEK_TOMBSTONE_RETENTION_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Cursor expirado: sincronize novamente sem since"
+            )
+
+    owner = user_id or user.id
+    changes = await GetWeekChangesUseCase(week_repo).execute(owner, after=after, limit=limit + 1)
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    # Primeira página da sincronização: o piso é o instante assentado de agora
+    floor = floor or now - timedelta(seconds=WEEK_CHANGES_SETTLE_SECONDS)
+    return WeekChangesResponse((changes, next_changes_cursor(changes, has_more, floor), has_more))
+
+
 @router.get("/{week_id}", response_model=WeekResponse)
 async def get_week_by_id(
     week_id: str,
@@ -99,18 +324,38 @@ async def get_week_by_id(
     return week
 
 
-@router.get("/user/{user_id}", response_model=List[WeekResponse])
+@router.get(
+    "/user/{user_id}",
+    response_model=List[WeekResponse],
+    responses={304: {"description": "Registros não mudaram desde o ETag enviado em If-None-Match"}},
+)
 async def get_weeks_by_user_id(
     user_id: str,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Tamanho da página"),
+    cursor: Optional[str] = Query(None, description=f"Cursor opaco recebido no header {NEXT_CURSOR_HEADER}"),
     week_repo=Depends(get_sqlalchemy_week_repository),
     user=Depends(get_current_user_token)
 ):
     """
-    Retorna todos os registros de abastecimento de um usuário específico.
+    Retorna os registros de abastecimento de um usuário, do mais recente para o mais antigo.
+
+    Suporta a mesma paginação por cursor de `GET /weeks/`.
+
+    Responde com `ETag` (versão dos registros do usuário). Com `If-None-Match`
+    igual, retorna 304 sem consultar nem serializar os registros.
     """
+    limit, after = resolve_page_params(limit, cursor)
+    not_modified = await check_not_modified(request, response, week_repo, user_id)
+    if not_modified:
+        return not_modified
     usecase = GetWeeksByUserIdUseCase(week_repo)
-    weeks = await usecase.execute(user_id)
-    return weeks
+    weeks = await usecase.execute(user_id, limit=limit + 1 if limit else None, after=after)
+    weeks, next_cursor = split_page(weeks, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return WeekListResponse(weeks, headers=response.headers)
 
 
 @router.post(
@@ -118,16 +363,29 @@ async def get_weeks_by_user_id(
     response_model=WeekResponse, 
     status_code=status.HTTP_201_CREATED,
     summary="Criar um novo registro de abastecimento",
-    description="Cria um novo registro de abastecimento para o usuário autenticado.",
+    description=(
+        "Cria um novo registro de abastecimento para o usuário autenticado. "
+        "Com o header Idempotency-Key, repetições da mesma requisição (mesma chave e corpo) "
+        "recebem a resposta original, com o header Idempotent-Replayed, sem criar outro registro."
+    ),
     responses={
         400: {"description": "Erro de validação", "model": Dict[str, Any]},
         401: {"description": "Não autenticado", "model": Dict[str, Any]},
+        409: {"description": "Registro da Idempotency-Key não existe mais", "model": Dict[str, Any]},
+        422: {"description": "Corpo inválido ou Idempotency-Key já usada com outro corpo", "model": Dict[str, Any]},
         500: {"description": "Erro interno do servidor", "model": Dict[str, Any]}
     }
 )
 async def create_week(
     week_data: WeekCreate,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        max_length=255,
+        description="Chave escolhida pelo cliente; repetições com a mesma chave recebem a resposta original",
+    ),
     week_repo=Depends(get_sqlalchemy_week_repository),
+    idempotency_repo=Depends(get_idempotency_repository),
     user=Depends(get_current_user_token)  # Obter o usuário autenticado
 ):
     try:
@@ -143,149 +401,49 @@ async def create_week(
                     message="Usuário não autenticado ou ID de usuário inválido"
                 )
             )
-        
-        # Validar e converter os campos numéricos
-        try:
-            # Conversão e validação de kmAtual
-            km_atual_str = str(week_data.kmAtual)
-            if not is_valid_numeric(km_atual_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="kmAtual",
-                        message=f"Quilometragem atual deve ser um número válido, recebido: {km_atual_str}"
-                    )
-                )
-            
-            # Conversão e validação de kmFinal
-            km_final = week_data.kmFinal if hasattr(week_data, "kmFinal") and week_data.kmFinal is not None else 0.0
-            km_final_str = str(km_final)
-            if not is_valid_numeric(km_final_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="kmFinal",
-                        message=f"Quilometragem final deve ser um número válido, recebido: {km_final_str}"
-                    )
-                )
-            
-            # Conversão e validação de custo
-            custo_str = str(week_data.custo)
-            if not is_valid_numeric(custo_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="custo",
-                        message=f"Custo deve ser um número válido, recebido: {custo_str}"
-                    )
-                )
-            
-            # Conversão e validação de eficiencia
-            eficiencia = week_data.eficiencia if week_data.eficiencia is not None else 0.0
-            eficiencia_str = str(eficiencia)
-            if not is_valid_numeric(eficiencia_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="eficiencia",
-                        message=f"Eficiência deve ser um número válido, recebido: {eficiencia_str}"
-                    )
-                )
-            
-            # Conversão e validação de litrosAbastecidos
-            litros_str = str(week_data.litrosAbastecidos)
-            if not is_valid_numeric(litros_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="litrosAbastecidos",
-                        message=f"Litros abastecidos deve ser um número válido, recebido: {litros_str}"
-                    )
-                )
-                
-            # Verificar valores negativos
-            if float(km_atual_str) < 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="kmAtual",
-                        message="Quilometragem atual não pode ser negativa"
-                    )
-                )
-                
-            if float(km_final_str) < 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="kmFinal",
-                        message="Quilometragem final não pode ser negativa"
-                    )
-                )
-                
-            if float(custo_str) < 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="custo",
-                        message="Custo não pode ser negativo"
-                    )
-                )
-                
-            if float(eficiencia_str) < 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="eficiencia",
-                        message="Eficiência não pode ser negativa"
-                    )
-                )
-                
-            if float(litros_str) <= 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="litrosAbastecidos",
-                        message="Litros abastecidos deve ser maior que zero"
-                    )
-                )
-                
-            # Verificar se km_final é maior que km_atual quando ambos são fornecidos
-            if float(km_final_str) > 0 and float(km_final_str) < float(km_atual_str):
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="kmFinal",
-                        message="Quilometragem final deve ser maior ou igual à quilometragem atual"
-                    )
-                )
-            
-        except ValueError as ve:
+
+        # Repetição de uma requisição já processada: reenvia a resposta sem validar nem gravar
+        # Só é usada junto com a chave
+        fingerprint = request_fingerprint(week_data) if idempotency_key else ""
+        if idempotency_key:
+            replay = await idempotent_replay(idempotency_repo, week_repo, user.id, idempotency_key, fingerprint)
+            if replay is not None:
+                return replay
+
+        # Validar os campos numéricos
+        invalid = check_week_values(week_data)
+        if invalid:
+            field, message = invalid
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                content=error_response(
-                    status_code=400,
-                    message=str(ve)
-                )
+                content=validation_error_response(field=field, message=message)
             )
         
         # Usar o ID do usuário autenticado
-        week = Week(
-            id=str(uuid4()),
-            user_id=user.id,  # Usar o ID do usuário autenticado
-            title=week_data.title,
-            kmAtual=km_atual_str,
-            kmFinal=km_final_str,
-            custo=custo_str,
-            eficiencia=eficiencia_str,
-            litrosAbastecidos=litros_str,
-            created_at=datetime.now(),  # Use datetime object
-            updated_at=datetime.now(),  # Use datetime object
-        )
+        week = new_week(user.id, week_data)
+        # A chave é gravada no mesmo commit do registro; se outra requisição com
+        # a mesma chave chegou antes, a resposta é a dela
+        if idempotency_key and not await idempotency_repo.claim(
+            user.id, idempotency_key, fingerprint, week.id, IDEMPOTENCY_KEY_TTL_SECONDS
+        ):
+            replay = await idempotent_replay(idempotency_repo, week_repo, user.id, idempotency_key, fingerprint)
+            if replay is not None:
+                return replay
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content=error_response(
+                    status_code=409,
+                    message=f"Conflito na {IDEMPOTENCY_KEY_HEADER}, tente novamente"
+                )
+            )
         usecase = CreateWeekUseCase(week_repo)
         created_week = await usecase.execute(week)
         if created_week:
             print(f"Week created successfully: {created_week.id}")
-            return created_week
+            response = WeekItemResponse(created_week, status_code=status.HTTP_201_CREATED)
+            if idempotency_key:
+                await idempotency_repo.complete(user.id, idempotency_key, response.status_code, response.body)
+            return response
         else:
             print("Week creation failed: returned None")
             return JSONResponse(
@@ -317,13 +475,274 @@ async def create_week(
             )
         )
 
-# Função auxiliar para validar se uma string é um número válido
-def is_valid_numeric(value_str):
+@router.post(
+    "/bulk",
+    response_model=WeekBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    summary="Criar registros de abastecimento em lote",
+    description=f"Valida e cria até {WEEK_BULK_MAX_ITEMS} registros para o usuário autenticado em uma única transação.",
+    responses={
+        400: {"description": "Nenhum item válido", "model": Dict[str, Any]},
+        401: {"description": "Não autenticado", "model": Dict[str, Any]},
+        413: {"description": "Lote acima do limite", "model": Dict[str, Any]},
+    }
+)
+async def create_weeks_bulk(
+    items: List[Dict[str, Any]] = Body(..., description="Registros no mesmo formato de POST /weeks/"),
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Cria vários registros de uma vez.
+
+    Cada item passa pelas mesmas validações de `POST /weeks/`. Os itens válidos
+    são inseridos juntos (INSERTs multi-row, um commit); os inválidos são
+    devolvidos em `errors` com a posição na lista.
+    """
+    if len(items) > WEEK_BULK_MAX_ITEMS:
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content=error_response(
+                status_code=413,
+                message=f"Envie no máximo {WEEK_BULK_MAX_ITEMS} registros por requisição",
+                details={"received": len(items)}
+            )
+        )
+
+    weeks: List[Week] = []
+    errors: List[Dict[str, Any]] = []
+    for index, item in enumerate(items):
+        parsed = parse_week_item(user.id, item)
+        if parsed.week is None:
+            errors.append({"index": index, "field": parsed.field, "error": parsed.error})
+        else:
+            weeks.append(parsed.week)
+
+    if not weeks:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=error_response(
+                status_code=400,
+                message="Nenhum registro válido no lote",
+                details={"errors": errors}
+            )
+        )
+
+    usecase = CreateWeeksBulkUseCase(week_repo)
+    created = await usecase.execute(weeks)
+    return {"created": created, "ids": [week.id for week in weeks], "errors": errors}
+
+
+@router.post(
+    "/import/csv",
+    response_class=ImportProgressResponse,
+    summary="Importar registros de abastecimento de um CSV",
+    description=(
+        "Recebe o CSV no corpo (text/csv, UTF-8, com cabeçalho) e responde em NDJSON "
+        "com o andamento da importação."
+    ),
+)
+async def import_weeks_csv(
+    request: Request,
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Importa um CSV com as colunas title, kmAtual, custo, litrosAbastecidos e,
+    opcionalmente, kmFinal, eficiencia e created_at (ISO 8601).
+
+    O corpo é lido aos pedaços e cada linha passa pelas mesmas validações de
+    `POST /weeks/`. As válidas são gravadas a cada WEEK_IMPORT_CHUNK_SIZE
+    registros (um commit por bloco), então a memória não cresce com o arquivo.
+    A resposta é uma linha JSON por evento:
+
+    - `{"event": "error", "line": ..., "field": ..., "error": ...}` por linha recusada
+    - `{"event": "progress", "processed": ..., "created": ..., "errors": ...}` por bloco gravado
+    - `{"event": "summary", ..., "aborted": ...}` no fim
+    """
+    usecase = CreateWeeksBulkUseCase(week_repo)
+
+    def event(name: str, **data: Any) -> str:
+        return json.dumps({"event": name, **data}, ensure_ascii=False) + "\n"
+
+    async def run_import():
+        processed = created = errors = 0
+        aborted = False
+        fields = None
+        batch: List[Week] = []
+
+        try:
+            async for line, values in iter_csv_records(request.stream()):
+                if fields is None:
+                    fields = map_header(values)
+                    continue
+
+                processed += 1
+                item = record_to_item(fields, values)
+                created_at = item.pop("created_at", None)
+                parsed = parse_week_item(user.id, item)
+                week = parsed.week
+                if week and created_at:
+                    # Só created_at vem do arquivo: updated_at fica com o momento
+                    # da importação para que os registros apareçam em /weeks/changes
+                    try:
+                        week.created_at = datetime.fromisoformat(created_at)
+                    except ValueError:
+                        parsed = ParsedWeekItem(None, "created_at", f"Data inválida: {created_at}")
+                    else:
+                        if week.created_at.tzinfo is not None:
+                            week.created_at = week.created_at.astimezone().replace(tzinfo=None)
+
+                if parsed.week is None:
+                    errors += 1
+                    yield event("error", line=line, field=parsed.field, error=parsed.error)
+                    continue
+
+                batch.append(parsed.week)
+                if len(batch) >= WEEK_IMPORT_CHUNK_SIZE:
+                    created += await usecase.execute(batch)
+                    batch = []
+                    yield event("progress", processed=processed, created=created, errors=errors)
+
+            if fields is None:
+                raise CsvImportError(1, "Arquivo vazio")
+            if batch:
+                created += await usecase.execute(batch)
+                batch = []
+        except CsvImportError as e:
+            aborted = True
+            yield event("error", line=e.line, field=None, error=str(e))
+        except Exception as e:
+            import traceback
+            print(f"Error importing weeks: {str(e)}")
+            traceback.print_exc()
+            aborted = True
+            yield event("error", line=None, field=None, error=f"Erro ao gravar registros: {str(e)}")
+
+        yield event("summary", processed=processed, created=created, errors=errors, aborted=aborted)
+
+    return ImportProgressResponse(run_import())
+
+
+def check_week_values(week_data: WeekCreate) -> Optional[Tuple[str, str]]:
+    """
+    Aplica as regras de negócio dos campos numéricos de um registro.
+
+    Os campos já chegam como float (convertidos pelo schema); aqui só se
+    recusam valores não finitos (nan, inf), as regras de faixa e valores que
+    não cabem nas colunas inteiras.
+
+    Returns:
+        (campo, mensagem) da primeira regra violada, ou None se o registro é válido
+    """
+    km_atual = week_data.kmAtual
+    km_final = week_data.kmFinal if week_data.kmFinal is not None else 0.0
+    custo = week_data.custo
+    eficiencia = week_data.eficiencia if week_data.eficiencia is not None else 0.0
+    litros = week_data.litrosAbastecidos
+
+    if not math.isfinite(km_atual):
+        return "kmAtual", f"Quilometragem atual deve ser um número válido, recebido: {km_atual}"
+    if not math.isfinite(km_final):
+        return "kmFinal", f"Quilometragem final deve ser um número válido, recebido: {km_final}"
+    if not math.isfinite(custo):
+        return "custo", f"Custo deve ser um número válido, recebido: {custo}"
+    if not math.isfinite(eficiencia):
+        return "eficiencia", f"Eficiência deve ser um número válido, recebido: {eficiencia}"
+    if not math.isfinite(litros):
+        return "litrosAbastecidos", f"Litros abastecidos deve ser um número válido, recebido: {litros}"
+
+    # Verificar valores negativos
+    if km_atual < 0:
+        return "kmAtual", "Quilometragem atual não pode ser negativa"
+    if km_final < 0:
+        return "kmFinal", "Quilometragem final não pode ser negativa"
+    if custo < 0:
+        return "custo", "Custo não pode ser negativo"
+    if eficiencia < 0:
+        return "eficiencia", "Eficiência não pode ser negativa"
+    if litros <= 0:
+        return "litrosAbastecidos", "Litros abastecidos deve ser maior que zero"
+
+    # Limites das colunas inteiras: acima deles o INSERT falharia para o lote inteiro
+    for field, label, value, scale in (
+        ("kmAtual", "Quilometragem atual", km_atual, KM_SCALE),
+        ("kmFinal", "Quilometragem final", km_final, KM_SCALE),
+        ("custo", "Custo", custo, CUSTO_SCALE),
+        ("eficiencia", "Eficiência", eficiencia, EFICIENCIA_SCALE),
+        ("litrosAbastecidos", "Litros abastecidos", litros, LITROS_SCALE),
+    ):
+        if not fits_units(value, scale):
+            return field, f"{label} deve ser no máximo {MAX_UNITS // scale}"
+
+    # Verificar se km_final é maior que km_atual quando ambos são fornecidos
+    if km_final > 0 and km_final < km_atual:
+        return "kmFinal", "Quilometragem final deve ser maior ou igual à quilometragem atual"
+
+    return None
+
+
+def check_final_km(final_km: float) -> Optional[str]:
+    """
+    Regras da quilometragem final recebida por PUT /weeks/{id}/final_km e
+    PUT /weeks/final_km, antes de ir ao banco (nan, inf ou valores acima da
+    coluna falhariam na conversão para metros).
+
+    Returns:
+        Mensagem da primeira regra violada, ou None se o valor é válido
+    """
+    if not math.isfinite(final_km):
+        return f"Quilometragem final deve ser um número válido, recebido: {final_km}"
+    if final_km < 0:
+        return "Quilometragem final não pode ser negativa"
+    if not fits_units(final_km, KM_SCALE):
+        return f"Quilometragem final deve ser no máximo {MAX_UNITS // KM_SCALE}"
+    return None
+
+
+class ParsedWeekItem(NamedTuple):
+    """Resultado de parse_week_item: o registro, ou o campo (se houver) e a mensagem do erro."""
+    week: Optional[Week]
+    field: Optional[str] = None
+    error: Optional[str] = None
+
+
+def parse_week_item(user_id: str, item: Any) -> ParsedWeekItem:
+    """
+    Valida um item de importação (schema de POST /weeks/ + check_week_values).
+
+    Returns:
+        ParsedWeekItem com o registro se válido, ou com week None, campo e mensagem se inválido
+    """
+    if not isinstance(item, dict):
+        return ParsedWeekItem(None, None, "Item deve ser um objeto JSON")
     try:
-        float(value_str)
-        return True
-    except (ValueError, TypeError):
-        return False
+        week_data = WeekCreate(**item)
+    except ValidationError as e:
+        first = e.errors()[0]
+        return ParsedWeekItem(None, str(first["loc"][0]) if first["loc"] else None, first["msg"])
+
+    invalid = check_week_values(week_data)
+    if invalid:
+        return ParsedWeekItem(None, *invalid)
+    return ParsedWeekItem(new_week(user_id, week_data))
+
+
+def new_week(user_id: str, week_data: WeekCreate) -> Week:
+    """Cria a entidade de um registro já validado por check_week_values."""
+    now = datetime.now()
+    return Week(
+        id=str(uuid4()),
+        user_id=user_id,
+        title=week_data.title,
+        kmAtual=week_data.kmAtual,
+        kmFinal=week_data.kmFinal,
+        custo=week_data.custo,
+        eficiencia=week_data.eficiencia,
+        litrosAbastecidos=week_data.litrosAbastecidos,
+        created_at=now,
+        updated_at=now,
+    )
 
 
 @router.delete("/{week_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -383,68 +802,29 @@ async def add_final_km(
                 )
             )
             
-        if data.final_km < 0:
+        invalid = check_final_km(data.final_km)
+        if invalid:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                content=validation_error_response(
-                    field="final_km",
-                    message="Quilometragem final não pode ser negativa"
-                )
+                content=validation_error_response(field="final_km", message=invalid)
             )
             
-        # Verificar se o registro existe
-        week = await week_repo.get_by_id(week_id)
-        if not week:
+        # Uma única ida ao banco: o repositório decide entre 404, 400 e sucesso
+        usecase = AddFinalKmUseCase(week_repo)
+        try:
+            updated_week = await usecase.execute(week_id, data.final_km)
+        except InvalidFinalKmError as e:
             return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content=error_response(
-                    status_code=404,
-                    message="Registro não encontrado",
-                    details={"week_id": week_id}
-                )
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content=validation_error_response(field=e.field, message=e.message)
             )
-            
-        # Converter kmAtual para comparação
-        try:
-            km_atual = float(week.kmAtual)
-            if data.final_km < km_atual:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="final_km",
-                        message=f"Quilometragem final ({data.final_km}) deve ser maior ou igual à quilometragem atual ({km_atual})"
-                    )
-                )
-                
-            # Verificar se há litros abastecidos registrados
-            litros = float(week.litrosAbastecidos)
-            if litros <= 0:
-                return JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content=validation_error_response(
-                        field="litrosAbastecidos",
-                        message="Não é possível calcular a eficiência: litros abastecidos deve ser maior que zero"
-                    )
-                )
-                
-            # Verificar se houve deslocamento
-            if data.final_km == km_atual:
-                print("Aviso: Quilometragem final igual à atual. A eficiência será zero.")
-            
-        except ValueError as ve:
-            print(f"Erro ao converter valores: {str(ve)}")
-            # Continuar e deixar o repository lidar com isso
-            
-        # Chamar o caso de uso para atualizar kmFinal e calcular eficiência
-        usecase = AddFinalKmUseCase(week_repo)
-        updated_week = await usecase.execute(week_id, data.final_km)
         
         if not updated_week:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content=error_response(
                     status_code=404,
-                    message="Falha ao atualizar o registro",
+                    message="Registro não encontrado",
                     details={"week_id": week_id}
                 )
             )
@@ -464,19 +844,82 @@ async def add_final_km(
         print(f"Erro ao atualizar quilometragem final: {str(e)}")
         traceback.print_exc()
         
-        # Mensagem de erro mais detalhada e específica para o problema de tipos
-        error_msg = str(e)
-        if "unsupported operand type" in error_msg and ("float" in error_msg or "Decimal" in error_msg):
-            error_msg = "Erro ao calcular eficiência: incompatibilidade de tipos numéricos. Reporte este erro ao administrador do sistema."
-            
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content=error_response(
                 status_code=500,
-                message=error_msg
+                message=str(e)
             )
         )
 
+@router.put(
+    "/final_km",
+    response_model=WeekFinalKmBatchResult,
+    summary="Atualizar a quilometragem final de vários registros",
+    description=(
+        f"Aplica até {WEEK_FINAL_KM_BATCH_MAX_ITEMS} pares (week_id, final_km) em um único comando "
+        "e retorna o resultado de cada item."
+    ),
+    responses={
+        401: {"description": "Não autenticado", "model": Dict[str, Any]},
+        413: {"description": "Lote acima do limite", "model": Dict[str, Any]},
+    }
+)
+async def add_final_km_batch(
+    items: List[WeekFinalKmItem],
+    week_repo=Depends(get_sqlalchemy_week_repository),
+    user=Depends(get_current_user_token)
+):
+    """
+    Versão em lote de `PUT /weeks/{week_id}/final_km`, para fechar vários
+    registros de uma vez (ex.: sincronização do app).
+
+    Cada item é validado como na rota individual e recebe um resultado
+    `updated`, `not_found` ou `invalid`. Os itens válidos são aplicados juntos,
+    com a eficiência recalculada no banco; um item recusado não impede os demais.
+    Um mesmo `week_id` só pode aparecer uma vez por lote.
+    """
+    if len(items) > WEEK_FINAL_KM_BATCH_MAX_ITEMS:
+        return JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content=error_response(
+                status_code=413,
+                message=f"Envie no máximo {WEEK_FINAL_KM_BATCH_MAX_ITEMS} registros por requisição",
+                details={"received": len(items)}
+            )
+        )
+
+    results: List[Dict[str, Any]] = []
+    final_kms: Dict[str, float] = {}
+    for index, item in enumerate(items):
+        outcome: Dict[str, Any] = {"index": index, "week_id": item.week_id}
+        invalid = check_final_km(item.final_km)
+        if invalid:
+            outcome.update(status="invalid", field="final_km", error=invalid)
+        elif item.week_id in final_kms:
+            outcome.update(status="invalid", field="week_id", error="Registro repetido no lote")
+        else:
+            final_kms[item.week_id] = item.final_km
+        results.append(outcome)
+
+    usecase = AddFinalKmBatchUseCase(week_repo)
+    applied = await usecase.execute(final_kms) if final_kms else {}
+
+    updated = 0
+    for outcome in results:
+        if "status" in outcome:
+            continue
+        result = applied[outcome["week_id"]]
+        if result.error is not None:
+            outcome.update(status="invalid", field=result.error.field, error=result.error.message)
+        elif result.week is None:
+            outcome.update(status="not_found", error="Registro não encontrado")
+        else:
+            outcome.update(status="updated", week=result.week)
+            updated += 1
+    return {"updated": updated, "results": results}
+
+
 # Funções auxiliares para tratamento de erros em formato padronizado
 def error_response(status_code: int, message: str, details: Any = None) -> Dict[str, Any]:
     """
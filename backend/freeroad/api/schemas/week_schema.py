@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 
@@ -24,11 +24,30 @@ class WeekUpdate(WeekBase):
     eficiencia: Optional[float] = Field(None, description="Eficiência em km/l (calculada automaticamente)")
 
 
+class WeekBulkError(BaseModel):
+    """Erro de validação de um item de POST /weeks/bulk."""
+    index: int = Field(..., description="Posição do item na lista enviada")
+    field: Optional[str] = Field(None, description="Campo inválido")
+    error: str = Field(..., description="Mensagem de erro")
+
+
+class WeekBulkResult(BaseModel):
+    """Resultado de uma criação em lote."""
+    created: int = Field(..., description="Quantidade de registros criados")
+    ids: List[str] = Field(..., description="IDs criados, na ordem dos itens válidos")
+    errors: List[WeekBulkError] = Field(default_factory=list, description="Itens recusados")
+
+
 class WeekFinalKm(BaseModel):
     """Schema para adicionar apenas a quilometragem final."""
     final_km: float
 
 
+class WeekFinalKmItem(WeekFinalKm):
+    """Item de PUT /weeks/final_km."""
+    week_id: str = Field(..., description="ID do registro a ser atualizado")
+
+
 class WeekResponse(WeekBase):
     """Schema para resposta com dados completos de um registro."""
     id: str = Field(..., description="ID único do registro")
@@ -41,9 +60,56 @@ class WeekResponse(WeekBase):
         from_attributes = True
 
 
+class WeekFinalKmOutcome(BaseModel):
+    """Resultado de um item de PUT /weeks/final_km."""
+    index: int = Field(..., description="Posição do item na lista enviada")
+    week_id: str = Field(..., description="ID do registro")
+    status: Literal["updated", "not_found", "invalid"] = Field(..., description="Resultado do item")
+    field: Optional[str] = Field(None, description="Campo inválido")
+    error: Optional[str] = Field(None, description="Mensagem de erro")
+    week: Optional[WeekResponse] = Field(None, description="Registro atualizado")
+
+
+class WeekFinalKmBatchResult(BaseModel):
+    """Resultado de uma atualização de quilometragem final em lote."""
+    updated: int = Field(..., description="Quantidade de registros atualizados")
+    results: List[WeekFinalKmOutcome] = Field(..., description="Um resultado por item, na ordem enviada")
+
+
 class WeekAnalytics(BaseModel):
     """Schema para análise de dados de combustível."""
     media_eficiencia: Optional[float] = Field(None, description="Eficiência média em km/l")
     total_custo: float = Field(..., description="Custo total com combustível")
     total_distancia: float = Field(..., description="Distância total percorrida")
-    total_litros: float = Field(..., description="Total de litros abastecidos")
\ No newline at end of file
+    total_litros: float = Field(..., description="Total de litros abastecidos")
+    variancia_eficiencia: Optional[float] = Field(None, description="Variância da eficiência em (km/l)²")
+
+    class Config:
+        from_attributes = True
+
+class WeekSeriesPoint(BaseModel):
+    """Schema para um período da série de consumo de combustível."""
+    periodo: datetime = Field(..., description="Início do período (segunda-feira ou dia 1, 00:00)")
+    registros: int = Field(..., description="Quantidade de registros no período")
+    media_eficiencia: Optional[float] = Field(None, description="Eficiência média em km/l no período")
+    total_custo: float = Field(..., description="Custo total com combustível no período")
+    total_distancia: float = Field(..., description="Distância percorrida no período")
+    total_litros: float = Field(..., description="Litros abastecidos no período")
+
+    class Config:
+        from_attributes = True
+
+
+class WeekChangeItem(BaseModel):
+    """Item do feed de alterações: registro criado/alterado ou removido."""
+    id: str = Field(..., description="ID do registro")
+    changed_at: datetime = Field(..., description="updated_at do registro ou momento da remoção")
+    deleted: bool = Field(..., description="True se o registro foi removido")
+    week: Optional[WeekResponse] = Field(None, description="Registro atual (ausente quando removido)")
+
+
+class WeekChangesPage(BaseModel):
+    """Página de GET /weeks/changes."""
+    changes: List[WeekChangeItem] = Field(..., description="Alterações em ordem de (changed_at, id)")
+    cursor: str = Field(..., description="Enviar em `since` na próxima requisição")
+    has_more: bool = Field(..., description="True se há mais alterações: requisitar de novo imediatamente")
@@ -0,0 +1,74 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import orjson
+from fastapi import Response
+
+from freeroad.domain.entities.week import Week
+from freeroad.domain.value_objects.week_change import WeekChange
+
+
+def week_response_record(week: Week) -> Dict[str, Any]:
+    """
+    Mesmo objeto que WeekResponse produziria (campos e ordem), montado direto
+    da entidade, sem validação do pydantic; os números já são float.
+    """
+    return {
+        "title": week.title,
+        "kmAtual": week.kmAtual,
+        "litrosAbastecidos": week.litrosAbastecidos,
+        "custo": week.custo,
+        "id": week.id,
+        "user_id": week.user_id,
+        "kmFinal": week.kmFinal,
+        "eficiencia": week.eficiencia,
+    }
+
+
+class WeekListResponse(Response):
+    """
+    Resposta de List[WeekResponse] serializada com orjson.
+
+    Quando a rota retorna um Response, o FastAPI não valida nem serializa pelo
+    response_model (que continua documentando o schema no OpenAPI). Os
+    registros vêm do repositório, já validados na escrita. Headers definidos
+    no `response` injetado na rota não são copiados automaticamente: passe-os
+    em `headers`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Iterable[Week]) -> bytes:
+        return orjson.dumps([week_response_record(week) for week in content])
+
+
+class WeekItemResponse(Response):
+    """Resposta de um WeekResponse serializada com orjson (ver WeekListResponse)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Week) -> bytes:
+        return orjson.dumps(week_response_record(content))
+
+
+def week_change_record(change: WeekChange) -> Dict[str, Any]:
+    """Mesmo objeto que WeekChangeItem produziria."""
+    return {
+        "id": change.id,
+        "changed_at": change.changed_at,
+        "deleted": change.deleted,
+        "week": None if change.week is None else week_response_record(change.week),
+    }
+
+
+class WeekChangesResponse(Response):
+    """Resposta de WeekChangesPage serializada com orjson (ver WeekListResponse)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Tuple[List[WeekChange], str, bool]) -> bytes:
+        changes, cursor, has_more = content
+        return orjson.dumps({
+            "changes": [week_change_record(change) for change in changes],
+            "cursor": cursor,
+            "has_more": has_more,
+        })
@@ -3,6 +3,15 @@ from freeroad.domain.value_objects.password import Password
 
 
 class User:
+    # Instâncias ficam no cache de usuários autenticados (uma por usuário ativo)
+    __slots__ = ("id", "name", "email", "password", "role")
+
+    id: str
+    name: str
+    email: Email
+    password: Password
+    role: str
+
     def __init__(self, id: str, name: str, email: Email, password: Password, role: str):
         if role not in ["admin", "user"]:
             raise ValueError("Role must be 'admin' or 'user'.")
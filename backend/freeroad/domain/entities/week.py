@@ -1,27 +1,69 @@
 from datetime import datetime
-from typing import Optional
+from decimal import Decimal
+from typing import Optional, Union
+
+# Formatos aceitos na borda (texto da API/CSV, Decimal do banco, números)
+Number = Union[float, int, str, Decimal]
+
 
 class Week:
+    """
+    Registro de abastecimento.
+
+    Os campos numéricos são sempre float: a conversão de texto ou Decimal
+    acontece uma única vez, aqui no construtor, e o resto do código (rotas,
+    repositórios, serialização) opera sobre números sem reconverter.
+    kmFinal e eficiencia valem 0.0 enquanto não foram calculados.
+
+    Usa __slots__ porque listagens e exportações criam milhares de instâncias
+    por requisição; atribuições diretas aos campos devem usar float.
+    """
+
+    __slots__ = (
+        "id",
+        "user_id",
+        "title",
+        "kmAtual",
+        "kmFinal",
+        "custo",
+        "eficiencia",
+        "litrosAbastecidos",
+        "created_at",
+        "updated_at",
+    )
+
+    id: str
+    user_id: str
+    title: str
+    kmAtual: float
+    kmFinal: float
+    custo: float
+    eficiencia: float
+    litrosAbastecidos: float
+    created_at: datetime
+    updated_at: datetime
+
     def __init__(
         self,
         id: str,
         user_id: str,
         title: str,
-        kmAtual: str,
-        kmFinal: str,
-        custo: str,
-        eficiencia: str,
-        litrosAbastecidos: str,
+        kmAtual: Number,
+        kmFinal: Optional[Number],
+        custo: Number,
+        eficiencia: Optional[Number],
+        litrosAbastecidos: Number,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
         self.id = id
         self.user_id = user_id
         self.title = title
-        self.kmAtual = kmAtual
-        self.kmFinal = kmFinal
-        self.custo = custo
-        self.eficiencia = eficiencia
-        self.litrosAbastecidos = litrosAbastecidos
+        self.kmAtual = float(kmAtual)
+        # Ausentes (None ou "") valem 0.0: ainda não calculados
+        self.kmFinal = float(kmFinal) if kmFinal else 0.0
+        self.custo = float(custo)
+        self.eficiencia = float(eficiencia) if eficiencia else 0.0
+        self.litrosAbastecidos = float(litrosAbastecidos)
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
@@ -1,25 +1,139 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from freeroad.domain.entities.week import Week
-from typing import Optional, List
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+from freeroad.domain.value_objects.fuel_series import FuelSeriesPoint
+from freeroad.domain.value_objects.week_change import WeekChange
+from typing import AsyncIterator, Dict, NamedTuple, Optional, List, Tuple
+
+# Chave de paginação keyset: (created_at, id) do último registro da página anterior
+WeekKey = Tuple[datetime, str]
+
+
+class InvalidFinalKmError(ValueError):
+    """A quilometragem final não pode ser aplicada ao registro (erro de validação)."""
+
+    def __init__(self, field: str, message: str):
+        super().__init__(message)
+        self.field = field
+        self.message = message
+
+    @classmethod
+    def check(cls, final_km: float, km_atual: float, litros: float) -> Optional["InvalidFinalKmError"]:
+        """Retorna o erro das regras de add_final_km, ou None se final_km pode ser aplicado."""
+        if final_km < km_atual:
+            return cls(
+                "final_km",
+                f"Quilometragem final ({final_km}) deve ser maior ou igual à quilometragem atual ({km_atual})",
+            )
+        if litros <= 0:
+            return cls(
+                "litrosAbastecidos",
+                "Não é possível calcular a eficiência: litros abastecidos deve ser maior que zero",
+            )
+        return None
+
+
+class FinalKmResult(NamedTuple):
+    """
+    Resultado de add_final_km_many para um registro: o registro atualizado
+    (`week`) ou o erro que impediu a atualização (`error`); ambos None se o
+    registro não existe.
+    """
+    week_id: str
+    week: Optional[Week] = None
+    error: Optional[InvalidFinalKmError] = None
 
 
 class WeekRepository(ABC):
+    """
+    Os métodos de listagem retornam os registros do mais recente para o mais
+    antigo, ordenados por (created_at, id). Com `after`, retornam apenas os
+    registros posteriores a essa chave nessa ordem; com `limit`, no máximo
+    `limit` registros.
+    """
+
     @abstractmethod
-    async def get_all(self) -> List[Week]: ...
+    async def get_all(self, limit: Optional[int] = None, after: Optional[WeekKey] = None) -> List[Week]: ...
 
     @abstractmethod
     async def get_by_id(self, week_id: str) -> Optional[Week]: ...
 
     @abstractmethod
-    async def get_by_user_id(self, user_id: str) -> List[Week]: ...
+    async def get_by_user_id(
+        self, user_id: str, limit: Optional[int] = None, after: Optional[WeekKey] = None
+    ) -> List[Week]: ...
     
+    @abstractmethod
+    def stream_by_user_id(self, user_id: str, batch_size: int = 1000) -> AsyncIterator[List[Week]]:
+        """
+        Percorre todos os registros do usuário, do mais antigo para o mais
+        recente, em lotes de até `batch_size`, sem carregar tudo de uma vez.
+        """
+
+    @abstractmethod
+    async def get_changes(
+        self, user_id: str, after: Optional[WeekKey] = None, limit: Optional[int] = None
+    ) -> List[WeekChange]:
+        """
+        Feed de alterações do usuário: registros criados ou alterados e
+        remoções, do mais antigo para o mais recente por (changed_at, id).
+        Com `after`, apenas as alterações posteriores a essa chave; com
+        `limit`, no máximo `limit` alterações.
+        """
+
     @abstractmethod
     async def create(self, week: Week) -> Optional[Week]: ...
 
     @abstractmethod
-    async def delete(self, week_id: str) -> None: ...
+    async def create_many(self, weeks: List[Week]) -> int:
+        """Insere todos os registros em uma única transação; retorna quantos foram criados."""
+
+    @abstractmethod
+    async def delete(self, week_id: str) -> Optional[Week]:
+        """
+        Remove o registro e o retorna, ou retorna None se ele não existia.
+        A remoção aparece em get_changes.
+        """
     
     @abstractmethod
-    async def add_final_km(self, week_id: str, final_km: float) -> Optional[Week]: ...
+    async def add_final_km(self, week_id: str, final_km: float) -> Optional[Week]:
+        """
+        Grava a quilometragem final e recalcula a eficiência (km/l) quando houve
+        deslocamento. Retorna None se o registro não existe e levanta
+        InvalidFinalKmError se final_km < kmAtual ou se não há litros abastecidos.
+        """
+
+    @abstractmethod
+    async def add_final_km_many(
+        self, final_kms: Dict[str, float]
+    ) -> Dict[str, FinalKmResult]:
+        """
+        add_final_km para vários registros ({week_id: final_km}) em uma única
+        transação. Retorna um FinalKmResult por id; um registro recusado não
+        impede a atualização dos demais.
+        """
 
-    
\ No newline at end of file
+    @abstractmethod
+    async def get_version(self, user_id: str) -> int:
+        """
+        Versão dos registros do usuário: cresce a cada escrita que os altera e
+        nunca se repete. 0 se o usuário nunca teve registros.
+        """
+
+    @abstractmethod
+    async def get_analytics(self, user_id: str) -> FuelAnalytics: ...
+
+    @abstractmethod
+    async def get_series(
+        self,
+        user_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[FuelSeriesPoint]:
+        """
+        Indicadores do usuário agrupados por período ("week" ou "month") de
+        created_at, do mais antigo para o mais recente. Períodos sem registros
+        não aparecem. `start` (inclusivo) e `end` (exclusivo) limitam created_at.
+        """
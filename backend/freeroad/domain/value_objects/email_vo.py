@@ -2,11 +2,23 @@ import re
 
 
 class Email:
+    __slots__ = ("_value",)
+
     def __init__(self, value: str):
         if not self._is_valid(value):
             raise ValueError("Invalid email address.")
         self._value = value
 
+    @classmethod
+    def trusted(cls, value: str) -> "Email":
+        """
+        Cria o Email sem revalidar. Use apenas para valores que já foram
+        validados antes de serem persistidos (ex.: linhas lidas do banco).
+        """
+        email = cls.__new__(cls)
+        email._value = value
+        return email
+
     def _is_valid(self, email: str) -> bool:
         pattern = r"^[\w\.-]+@[\w\.-]+\.\w+$"
         return re.match(pattern, email) is not None
@@ -0,0 +1,39 @@
+from typing import Optional
+
+
+class FuelAnalytics:
+    """
+    Indicadores de consumo de combustível de um usuário.
+
+    Regras (iguais em todas as implementações do repositório):
+      - media_eficiencia: média das eficiências calculadas (ignora nulas e zero);
+        None se não houver nenhuma.
+      - total_distancia: soma de kmFinal - kmAtual apenas dos registros já
+        fechados (kmFinal > kmAtual).
+      - total_custo / total_litros: soma de todos os registros.
+      - variancia_eficiencia: variância populacional das mesmas eficiências
+        usadas na média; None se não houver nenhuma.
+
+    Os valores são arredondados na mesma escala das colunas do banco, para que
+    resultados calculados em SQL (Decimal) e em memória (float) sejam idênticos.
+    """
+
+    def __init__(
+        self,
+        media_eficiencia: Optional[float],
+        total_custo: float,
+        total_distancia: float,
+        total_litros: float,
+        variancia_eficiencia: Optional[float] = None,
+    ):
+        self.media_eficiencia = round(float(media_eficiencia), 2) if media_eficiencia is not None else None
+        self.total_custo = round(float(total_custo or 0), 2)
+        self.total_distancia = round(float(total_distancia or 0), 2)
+        self.total_litros = round(float(total_litros or 0), 3)
+        self.variancia_eficiencia = round(float(variancia_eficiencia), 4) if variancia_eficiencia is not None else None
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FuelAnalytics) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return f"FuelAnalytics({vars(self)})"
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+# Períodos aceitos, com a mesma semântica do date_trunc do Postgres:
+# "week" começa na segunda-feira 00:00 e "month" no dia 1 00:00.
+SERIES_PERIODS = ("week", "month")
+
+
+class FuelSeriesPoint:
+    """
+    Indicadores de consumo de um período (semana ou mês) da série de um usuário.
+
+    Segue as mesmas regras de FuelAnalytics, aplicadas apenas aos registros
+    criados dentro do período, e o mesmo arredondamento por coluna.
+    """
+
+    def __init__(
+        self,
+        periodo: datetime,
+        registros: int,
+        media_eficiencia: Optional[float],
+        total_custo: float,
+        total_distancia: float,
+        total_litros: float,
+    ):
+        self.periodo = periodo
+        self.registros = int(registros)
+        self.media_eficiencia = round(float(media_eficiencia), 2) if media_eficiencia is not None else None
+        self.total_custo = round(float(total_custo or 0), 2)
+        self.total_distancia = round(float(total_distancia or 0), 2)
+        self.total_litros = round(float(total_litros or 0), 3)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FuelSeriesPoint) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return f"FuelSeriesPoint({vars(self)})"
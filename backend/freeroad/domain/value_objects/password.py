@@ -1,5 +1,12 @@
 import re
-from freeroad.api.security import get_password_hash, verify_password
+from typing import Optional, Tuple
+from freeroad.api.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+    verify_and_update_password_async,
+)
 
 
 class PasswordValidationError(Exception):
@@ -7,6 +14,8 @@ class PasswordValidationError(Exception):
 
 
 class Password:
+    __slots__ = ("_hashed",)
+
     def __init__(self, plain_password: str, hashed: bool = False):
         if not hashed:
             self.validate(plain_password)
@@ -14,7 +23,19 @@ class Password:
         else:
             self._hashed = plain_password
 
-    def validate(self, password: str):
+    @classmethod
+    async def create(cls, plain_password: str) -> "Password":
+        """
+        Valida e gera o hash da senha fora do event loop.
+
+        Use este construtor em código assíncrono (rotas), pois o bcrypt é lento.
+        """
+        cls.validate(plain_password)
+        hashed = await get_password_hash_async(plain_password)
+        return cls(hashed, hashed=True)
+
+    @staticmethod
+    def validate(password: str):
         if len(password) < 8:
             raise PasswordValidationError("A senha deve ter no mínimo 8 caracteres.")
         if not re.search(r"[A-Z]", password):
@@ -35,6 +56,18 @@ class Password:
     def verify(self, plain_password: str) -> bool:
         return verify_password(plain_password, self._hashed)
 
+    async def verify_async(self, plain_password: str) -> bool:
+        """Verifica a senha fora do event loop."""
+        return await verify_password_async(plain_password, self._hashed)
+
+    async def verify_and_update_async(self, plain_password: str) -> Tuple[bool, Optional["Password"]]:
+        """
+        Verifica a senha fora do event loop e, se o hash usar um custo
+        desatualizado, retorna também a senha com o hash refeito.
+        """
+        valid, new_hash = await verify_and_update_password_async(plain_password, self._hashed)
+        return valid, Password(new_hash, hashed=True) if new_hash else None
+
     def __eq__(self, other) -> bool:
         return isinstance(other, Password) and self._hashed == other._hashed
 
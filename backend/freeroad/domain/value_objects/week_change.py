@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from freeroad.domain.entities.week import Week
+
+
+class WeekChange:
+    """
+    Item do feed de alterações de um usuário: o registro criado ou alterado
+    (`week`) ou a remoção do registro `id` (`week` None).
+
+    `changed_at` é o updated_at do registro ou o momento da remoção; o feed é
+    ordenado por (changed_at, id).
+    """
+
+    __slots__ = ("id", "changed_at", "week")
+
+    def __init__(self, id: str, changed_at: datetime, week: Optional[Week] = None):
+        self.id = id
+        self.changed_at = changed_at
+        self.week = week
+
+    @classmethod
+    def updated(cls, week: Week) -> "WeekChange":
+        return cls(week.id, week.updated_at, week)
+
+    @property
+    def deleted(self) -> bool:
+        return self.week is None
+
+    @property
+    def key(self) -> Tuple[datetime, str]:
+        return self.changed_at, self.id
+
+    def __repr__(self) -> str:
+        return f"WeekChange(id={self.id!r}, changed_at={self.changed_at!r}, deleted={self.deleted})"
@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, ForeignKey, Integer, LargeBinary, DateTime
+from freeroad.infra.database import Base
+from datetime import datetime
+
+
+class IdempotencyKeyModel(Base):
+    """
+    Resultado de uma requisição com Idempotency-Key (POST /weeks/), por usuário.
+
+    A linha é inserida na mesma transação do registro criado, então existe se
+    e somente se a criação foi gravada. A resposta é preenchida logo depois
+    do commit; até lá `status_code` fica nulo ("em andamento").
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True, comment="Valor do header Idempotency-Key")
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False, comment="SHA-256 do corpo da requisição")
+    week_id: Mapped[str] = mapped_column(String, nullable=False, comment="Registro criado pela requisição")
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True, comment="Status da resposta (nulo enquanto em andamento)")
+    response_body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, comment="Corpo da resposta, reenviado nas repetições")
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, comment="Depois disso a chave pode ser reutilizada")
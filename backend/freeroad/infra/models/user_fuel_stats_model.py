@@ -0,0 +1,28 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, ForeignKey, BigInteger, Integer, Numeric, DateTime
+from freeroad.infra.database import Base
+from datetime import datetime
+from decimal import Decimal
+
+
+class UserFuelStatsModel(Base):
+    """
+    Totais de consumo por usuário, mantidos incrementalmente pelas escritas
+    do SQLAlchemyWeekRepository (na mesma transação). Somas e soma dos
+    quadrados das eficiências permitem obter média e variância sem reler weeks.
+    Os totais ficam nas mesmas unidades inteiras das colunas de weeks.
+    `versao` cresce a cada escrita e serve de validador (ETag) das leituras.
+    """
+
+    __tablename__ = "user_fuel_stats"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    registros: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Quantidade de registros")
+    total_custo_centavos: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Soma dos custos, em centavos")
+    total_litros_ml: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Soma dos litros, em mililitros")
+    total_distancia_m: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Soma de km_final_m - km_atual_m dos registros fechados")
+    eficiencia_registros: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="Registros com eficiência calculada")
+    eficiencia_soma_centesimos: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="Soma das eficiências, em centésimos de km/l")
+    eficiencia_soma_quadrados: Mapped[Decimal] = mapped_column(Numeric(38, 0), nullable=False, default=0, comment="Soma dos quadrados das eficiências em centésimos")
+    versao: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0", comment="Incrementada a cada escrita nos registros do usuário")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -21,11 +21,14 @@ class UserModel(Base):
     def to_entity(self) -> User:
         """
         Converte o modelo SQLAlchemy para uma entidade de domínio.
+
+        Os dados vieram do banco e já foram validados na escrita,
+        por isso o email não é revalidado.
         """
         return User(
             id=self.id,
             name=self.name,
-            email=Email(self.email),
+            email=Email.trusted(self.email),
             password=Password(self.password, hashed=True),
             role=self.role,
         )
@@ -1,10 +1,44 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, ForeignKey, Numeric, DateTime
+from sqlalchemy import String, ForeignKey, BigInteger, DateTime, Index
 from freeroad.infra.database import Base
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 from uuid import uuid4
 from freeroad.domain.entities.week import Week
 
+# Escalas das colunas inteiras (ver migração 9b6e4d1f3a85): o hodômetro fica em
+# metros, os litros em mililitros, o custo em centavos e a eficiência em
+# centésimos de km/l. Metros por mililitro é o mesmo que km por litro.
+KM_SCALE = 1000
+LITROS_SCALE = 1000
+CUSTO_SCALE = 100
+EFICIENCIA_SCALE = 100
+
+# Maior valor aceito em uma coluna escalada. Cabe com folga em BIGINT, então
+# as somas da rollup e o 200 * distância de add_final_km também não estouram.
+MAX_UNITS = 10**12
+
+
+def to_units(value: float, scale: int) -> int:
+    """
+    Converte um valor da entidade para inteiro na escala da coluna,
+    arredondando metade para cima como as antigas colunas Numeric.
+
+    O produto em float já dá o inteiro certo, exceto quando o valor tem mais
+    casas que a escala e cai perto da metade (12.345 * 100 = 1234.4999...):
+    nesse caso o arredondamento é refeito sobre o decimal que o float representa.
+    """
+    units = value * scale
+    rounded = round(units)
+    if abs(abs(units - rounded) - 0.5) > 1e-9 * max(1.0, abs(units)):
+        return rounded
+    return int((Decimal(repr(value)) * scale).to_integral_value(ROUND_HALF_UP))
+
+
+def fits_units(value: float, scale: int) -> bool:
+    """Se um valor finito e não negativo cabe na coluna de escala `scale` (até MAX_UNITS)."""
+    return value * scale <= MAX_UNITS
+
 
 class WeekModel(Base):
     __tablename__ = "weeks"
@@ -12,11 +46,11 @@ class WeekModel(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    km_atual: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False, comment="Quilometragem atual do veículo")
-    km_final: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False, comment="Quilometragem final do veículo")
-    custo: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False, comment="Custo total do abastecimento")
-    eficiencia: Mapped[float | None] = mapped_column(Numeric(5, 2), nullable=True, comment="Eficiência em km/l")
-    litros_abastecidos: Mapped[float] = mapped_column(Numeric(8, 3), nullable=False, comment="Quantidade de litros abastecidos")
+    km_atual_m: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Quilometragem atual do veículo, em metros")
+    km_final_m: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Quilometragem final do veículo, em metros")
+    custo_centavos: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Custo total do abastecimento, em centavos")
+    eficiencia_centesimos: Mapped[int | None] = mapped_column(BigInteger, nullable=True, comment="Eficiência em centésimos de km/l")
+    litros_ml: Mapped[int] = mapped_column(BigInteger, nullable=False, comment="Quantidade abastecida, em mililitros")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
     
@@ -25,27 +59,58 @@ class WeekModel(Base):
 
     def to_entity(self) -> Week:
         """Converte o modelo para uma entidade de domínio"""
+        return WeekModel.row_to_entity(self)
+
+    @staticmethod
+    def row_to_entity(row) -> Week:
+        """
+        Hidratação confiável de uma linha lida do banco (modelo ORM ou Row do core).
+
+        Os valores já foram validados na escrita, então não há revalidação.
+        A divisão de inteiros é arredondada corretamente, então cada campo é
+        exatamente o float do valor decimal gravado (eficiência nula vira 0.0).
+        """
+        eficiencia = row.eficiencia_centesimos
         return Week(
-            id=self.id,
-            user_id=self.user_id,
-            title=self.title,
-            kmAtual=str(self.km_atual),
-            kmFinal=str(self.km_final),
-            custo=str(self.custo),
-            eficiencia=str(self.eficiencia) if self.eficiencia is not None else "0",
-            litrosAbastecidos=str(self.litros_abastecidos),
+            id=row.id,
+            user_id=row.user_id,
+            title=row.title,
+            kmAtual=row.km_atual_m / KM_SCALE,
+            kmFinal=row.km_final_m / KM_SCALE,
+            custo=row.custo_centavos / CUSTO_SCALE,
+            eficiencia=eficiencia / EFICIENCIA_SCALE if eficiencia else None,
+            litrosAbastecidos=row.litros_ml / LITROS_SCALE,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
     
     @classmethod
     def from_entity(cls, week: Week) -> "WeekModel":
         """Cria um modelo a partir de uma entidade de domínio"""
-        return cls(
+        return cls(**cls.entity_to_row(week))
+
+    @staticmethod
+    def entity_to_row(week: Week) -> dict:
+        """Valores das colunas de uma entidade, para o ORM ou para INSERTs em lote."""
+        return dict(
             id=week.id,
             user_id=week.user_id,
             title=week.title,
-            km_atual=float(week.kmAtual),
-            km_final=float(week.kmFinal) if week.kmFinal else 0.0,
-            custo=float(week.custo),
-            eficiencia=float(week.eficiencia) if week.eficiencia and week.eficiencia != "0" else None,
-            litros_abastecidos=float(week.litrosAbastecidos),
-        )
\ No newline at end of file
+            km_atual_m=to_units(week.kmAtual, KM_SCALE),
+            km_final_m=to_units(week.kmFinal, KM_SCALE),
+            custo_centavos=to_units(week.custo, CUSTO_SCALE),
+            eficiencia_centesimos=to_units(week.eficiencia, EFICIENCIA_SCALE) if week.eficiencia else None,
+            litros_ml=to_units(week.litrosAbastecidos, LITROS_SCALE),
+            created_at=week.created_at,
+            updated_at=week.updated_at,
+        )
+
+
+# Índices alinhados às consultas do repositório (ver migração 3b9f1c2a7d44):
+# listagem por usuário e listagem geral, ambas ordenadas por (created_at, id) desc
+# com paginação keyset. O primeiro também cobre o join/cascade users -> weeks.
+Index("ix_weeks_user_id_created_at_id", WeekModel.user_id, WeekModel.created_at.desc(), WeekModel.id.desc())
+Index("ix_weeks_created_at_id", WeekModel.created_at.desc(), WeekModel.id.desc())
+# Feed de alterações (GET /weeks/changes): registros do usuário com
+# (updated_at, id) posteriores ao cursor, em ordem crescente (migração 4f8a2c6e1d97)
+Index("ix_weeks_user_id_updated_at_id", WeekModel.user_id, WeekModel.updated_at, WeekModel.id)
@@ -0,0 +1,24 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, ForeignKey, DateTime, Index
+from freeroad.infra.database import Base
+from datetime import datetime
+
+
+class WeekTombstoneModel(Base):
+    """
+    Registro removido, mantido para o feed de alterações (GET /weeks/changes):
+    clientes que sincronizam de forma incremental só ficam sabendo de uma
+    remoção por aqui. Linhas mais antigas que WEEK_TOMBSTONE_RETENTION_DAYS
+    podem ser apagadas (freeroad.infra.purge_week_tombstones); cursores dessa
+    idade deixam de ser aceitos.
+    """
+
+    __tablename__ = "week_tombstones"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, comment="ID do registro removido")
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now, comment="Momento da remoção")
+
+
+# Feed de alterações por usuário, em ordem (deleted_at, id) com paginação keyset
+Index("ix_week_tombstones_user_id_deleted_at_id", WeekTombstoneModel.user_id, WeekTombstoneModel.deleted_at, WeekTombstoneModel.id)
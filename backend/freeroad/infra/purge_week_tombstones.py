@@ -0,0 +1,39 @@
+"""
+Apaga os registros de remoção (week_tombstones) mais antigos que
+WEEK_TOMBSTONE_RETENTION_DAYS. GET /weeks/changes já recusa (410) cursores
+dessa idade, então nenhum cliente depende deles.
+
+Rode periodicamente (ex.: cron diário).
+
+Uso:
+    cd backend
+    python -m freeroad.infra.purge_week_tombstones
+    python -m freeroad.infra.purge_week_tombstones --days 60
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+
+from freeroad.infra.database import async_session, engine
+from freeroad.infra.models.user_model import UserModel  # noqa: F401 (registra o mapper de WeekModel.user)
+from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
+from freeroad.infra.settings import WEEK_TOMBSTONE_RETENTION_DAYS
+
+
+async def main(days: float) -> None:
+    try:
+        async with async_session() as session:
+            rows = await SQLAlchemyWeekRepository(session).purge_tombstones(datetime.now() - timedelta(days=days))
+        print(f"week_tombstones: {rows} remoção(ões) apagada(s).")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--days", type=float, default=WEEK_TOMBSTONE_RETENTION_DAYS,
+        help="Retenção em dias (padrão: WEEK_TOMBSTONE_RETENTION_DAYS)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.days))
@@ -0,0 +1,34 @@
+"""
+Recalcula a tabela user_fuel_stats a partir de weeks.
+
+Use após importações feitas fora do repositório, correções manuais em weeks
+ou para conferir a rollup incremental.
+
+Uso:
+    cd backend
+    python -m freeroad.infra.rebuild_fuel_stats            # todos os usuários
+    python -m freeroad.infra.rebuild_fuel_stats --user-id <id>
+"""
+import argparse
+import asyncio
+from typing import Optional
+
+from freeroad.infra.database import async_session, engine
+from freeroad.infra.models.user_model import UserModel  # noqa: F401 (registra o mapper de WeekModel.user)
+from freeroad.infra.repositories.sqlalchemy.user_fuel_stats import rebuild_fuel_stats
+
+
+async def main(user_id: Optional[str]) -> None:
+    try:
+        async with async_session() as session:
+            rows = await rebuild_fuel_stats(session, user_id)
+        print(f"user_fuel_stats recalculada: {rows} usuário(s).")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", default=None, help="Recalcula apenas este usuário")
+    args = parser.parse_args()
+    asyncio.run(main(args.user_id))
@@ -0,0 +1,203 @@
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from freeroad.domain.entities.week import Week
+from freeroad.domain.repositories.week_repository import FinalKmResult, WeekKey, WeekRepository
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+from freeroad.domain.value_objects.fuel_series import FuelSeriesPoint
+from freeroad.domain.value_objects.week_change import WeekChange
+from freeroad.infra.week_cache import WeekCacheBackend
+
+# Contadores de geração: as chaves das entradas incluem a geração atual, e uma
+# escrita invalida incrementando o contador (as entradas antigas ficam
+# inalcançáveis e expiram sozinhas). Funciona igual nos dois backends, sem
+# precisar listar ou apagar chaves.
+_ALL_GENERATION = "gen:all"
+
+
+def _user_generation(user_id: str) -> str:
+    return f"gen:user:{user_id}"
+
+
+def _week_generation(week_id: str) -> str:
+    return f"gen:week:{week_id}"
+
+
+def _page_key(limit: Optional[int], after: Optional[WeekKey]) -> str:
+    return f"{limit}:{after[0].isoformat()}|{after[1]}" if after else f"{limit}:-"
+
+
+class WeekCacheStats:
+    """
+    Contadores do CachedWeekRepository. Como o repositório é criado a cada
+    requisição, a mesma instância deve ser compartilhada pelo processo.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.age_total = 0.0
+        self.age_max = 0.0
+
+    def record_hit(self, age: float) -> None:
+        self.hits += 1
+        self.age_total += age
+        self.age_max = max(self.age_max, age)
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            # Idade das entradas servidas: limite superior do atraso em relação ao banco
+            "mean_hit_age_seconds": self.age_total / self.hits if self.hits else 0.0,
+            "max_hit_age_seconds": self.age_max,
+        }
+
+
+class CachedWeekRepository(WeekRepository):
+    """
+    Cache read-through de get_by_id, get_by_user_id e get_all sobre outro
+    WeekRepository. create, create_many, delete, add_final_km e
+    add_final_km_many invalidam, depois de gravar, as consultas afetadas:
+    o registro, as listagens do usuário e as listagens gerais.
+
+    A geração é lida antes da consulta ao banco e incrementada depois do
+    commit, então uma leitura concorrente com uma escrita só pode guardar o
+    resultado antigo sob uma geração que já foi descartada. Escritas que não
+    passam por este repositório (outro processo com backend em memória, SQL
+    manual) só aparecem quando a entrada expira: o atraso máximo é o TTL do
+    backend, e a idade das entradas servidas aparece em WeekCacheStats.
+    """
+
+    def __init__(
+        self,
+        inner: WeekRepository,
+        backend: WeekCacheBackend,
+        stats: Optional[WeekCacheStats] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.inner = inner
+        self.backend = backend
+        self.stats = stats or WeekCacheStats()
+        self._clock = clock
+
+    async def _generation(self, key: str) -> int:
+        generation = await self.backend.get(key)
+        if generation is None:
+            # Começa no relógio em ns, e não em 0, para que um contador expirado
+            # ou removido por LRU nunca volte a um valor já usado
+            generation = time.time_ns()
+            if not await self.backend.add(key, generation):
+                generation = await self.backend.get(key) or generation
+        return generation
+
+    async def _bump(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            if await self.backend.incr(key) is None:
+                await self.backend.set(key, time.time_ns())
+            self.stats.invalidations += 1
+
+    async def _read_through(self, generation_key: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        entry_key = f"{key}@{await self._generation(generation_key)}"
+        entry = await self.backend.get(entry_key)
+        if entry is not None:
+            stored_at, value = entry
+            self.stats.record_hit(self._clock() - stored_at)
+            return value
+
+        self.stats.misses += 1
+        value = await load()
+        if value is not None:
+            await self.backend.set(entry_key, (self._clock(), value))
+        return value
+
+    async def _written(self, weeks: Iterable[Week]) -> None:
+        """Invalida o que depende dos registros gravados."""
+        keys = {_ALL_GENERATION}
+        for week in weeks:
+            keys.add(_user_generation(week.user_id))
+            keys.add(_week_generation(week.id))
+        await self._bump(sorted(keys))
+
+    async def get_all(self, limit: Optional[int] = None, after: Optional[WeekKey] = None) -> List[Week]:
+        return await self._read_through(
+            _ALL_GENERATION, f"weeks:all:{_page_key(limit, after)}", lambda: self.inner.get_all(limit, after)
+        )
+
+    async def get_by_id(self, week_id: str) -> Optional[Week]:
+        return await self._read_through(
+            _week_generation(week_id), f"week:{week_id}", lambda: self.inner.get_by_id(week_id)
+        )
+
+    async def get_by_user_id(
+        self, user_id: str, limit: Optional[int] = None, after: Optional[WeekKey] = None
+    ) -> List[Week]:
+        return await self._read_through(
+            _user_generation(user_id),
+            f"weeks:user:{user_id}:{_page_key(limit, after)}",
+            lambda: self.inner.get_by_user_id(user_id, limit, after),
+        )
+
+    def stream_by_user_id(self, user_id: str, batch_size: int = 1000) -> AsyncIterator[List[Week]]:
+        return self.inner.stream_by_user_id(user_id, batch_size)
+
+    async def get_changes(
+        self, user_id: str, after: Optional[WeekKey] = None, limit: Optional[int] = None
+    ) -> List[WeekChange]:
+        # Sempre do banco: o feed é consultado para saber o que mudou
+        return await self.inner.get_changes(user_id, after, limit)
+
+    async def create(self, week: Week) -> Optional[Week]:
+        created = await self.inner.create(week)
+        await self._written([created or week])
+        return created
+
+    async def create_many(self, weeks: List[Week]) -> int:
+        created = await self.inner.create_many(weeks)
+        # Registros novos não têm entrada própria; basta invalidar as listagens
+        await self._bump(sorted({_ALL_GENERATION, *(_user_generation(w.user_id) for w in weeks)}))
+        return created
+
+    async def delete(self, week_id: str) -> Optional[Week]:
+        deleted = await self.inner.delete(week_id)
+        if deleted:
+            await self._written([deleted])
+        return deleted
+
+    async def add_final_km(self, week_id: str, final_km: float) -> Optional[Week]:
+        updated = await self.inner.add_final_km(week_id, final_km)
+        if updated:
+            await self._written([updated])
+        return updated
+
+    async def add_final_km_many(
+        self, final_kms: Dict[str, float]
+    ) -> Dict[str, FinalKmResult]:
+        results = await self.inner.add_final_km_many(final_kms)
+        updated = [result.week for result in results.values() if result.week is not None]
+        if updated:
+            await self._written(updated)
+        return results
+
+    async def get_version(self, user_id: str) -> int:
+        return await self.inner.get_version(user_id)
+
+    async def get_analytics(self, user_id: str) -> FuelAnalytics:
+        return await self.inner.get_analytics(user_id)
+
+    async def get_series(
+        self,
+        user_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[FuelSeriesPoint]:
+        return await self.inner.get_series(user_id, period, start, end)
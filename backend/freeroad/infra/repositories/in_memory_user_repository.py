@@ -26,6 +26,11 @@ class InMemoryUserRepository(UserRepository):
     async def set_current_user(self, user: Optional[User]) -> None:
         self.current_user = user
 
+    async def update_password(self, user_id: str, password: Password) -> None:
+        user = self.users.get(user_id)
+        if user:
+            user.password = password
+
     async def get_by_email(self, email: Email) -> Optional[User]:
         """
         Busca um usuário pelo email.
@@ -1,51 +1,133 @@
-from typing import List, Optional, Dict
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Tuple
 from uuid import uuid4
+import numpy as np
 from freeroad.domain.entities.week import Week
-from freeroad.domain.repositories.week_repository import WeekRepository
+from freeroad.domain.repositories.week_repository import FinalKmResult, InvalidFinalKmError, WeekRepository, WeekKey
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+from freeroad.domain.value_objects.fuel_series import SERIES_PERIODS, FuelSeriesPoint
+from freeroad.domain.value_objects.week_change import WeekChange
+
+def _floats(weeks: List[Week], attribute: str) -> np.ndarray:
+    """Extrai um campo numérico de todos os registros para um array float64."""
+    return np.fromiter((getattr(w, attribute) for w in weeks), dtype=np.float64, count=len(weeks))
+
+
+def _period_starts(created_at: np.ndarray, period: str) -> np.ndarray:
+    """
+    Início do período de cada data (mesma semântica do date_trunc do Postgres):
+    segunda-feira 00:00 para "week" e dia 1 00:00 para "month".
+    """
+    days = created_at.astype("datetime64[D]")
+    if period == "month":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    # O dia 0 (1970-01-01) foi uma quinta-feira: (dia + 3) % 7 é a distância até a segunda.
+    ordinal = days.astype(np.int64)
+    return (ordinal - (ordinal + 3) % 7).astype("datetime64[D]")
+
 
 class InMemoryWeekRepository(WeekRepository):
     def __init__(self):
         self.weeks: Dict[str, Week] = {}
+        self.versions: Dict[str, int] = {}
+        # Remoções por id, para get_changes
+        self.tombstones: Dict[str, Tuple[str, datetime]] = {}
 
-    async def get_all(self) -> List[Week]:
-        return list(self.weeks.values())
+    def _bump(self, user_id: str) -> None:
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+
+    def _page(self, weeks: Iterable[Week], limit: Optional[int], after: Optional[WeekKey]) -> List[Week]:
+        """Mesma ordenação e filtro keyset do repositório SQLAlchemy."""
+        ordered = sorted(weeks, key=lambda w: (w.created_at, w.id), reverse=True)
+        if after is not None:
+            ordered = [w for w in ordered if (w.created_at, w.id) < after]
+        return ordered[:limit] if limit is not None else ordered
+
+    async def get_all(self, limit: Optional[int] = None, after: Optional[WeekKey] = None) -> List[Week]:
+        return self._page(self.weeks.values(), limit, after)
 
     async def get_by_id(self, week_id: str) -> Optional[Week]:
         return self.weeks.get(week_id)
 
-    async def get_by_user_id(self, user_id: str) -> List[Week]:
-        return [week for week in self.weeks.values() if week.user_id == user_id]
+    async def get_by_user_id(
+        self, user_id: str, limit: Optional[int] = None, after: Optional[WeekKey] = None
+    ) -> List[Week]:
+        weeks = (week for week in self.weeks.values() if week.user_id == user_id)
+        return self._page(weeks, limit, after)
+
+    async def stream_by_user_id(self, user_id: str, batch_size: int = 1000) -> AsyncIterator[List[Week]]:
+        weeks = list(reversed(await self.get_by_user_id(user_id)))
+        for start in range(0, len(weeks), batch_size):
+            yield weeks[start:start + batch_size]
+
+    async def get_changes(
+        self, user_id: str, after: Optional[WeekKey] = None, limit: Optional[int] = None
+    ) -> List[WeekChange]:
+        changes = [WeekChange.updated(week) for week in self.weeks.values() if week.user_id == user_id]
+        changes += [
+            WeekChange(week_id, deleted_at)
+            for week_id, (owner, deleted_at) in self.tombstones.items()
+            if owner == user_id
+        ]
+        changes.sort(key=lambda change: change.key)
+        if after is not None:
+            changes = [change for change in changes if change.key > after]
+        return changes[:limit] if limit is not None else changes
 
     async def create(self, week: Week) -> Optional[Week]:
         if not week.id:
             week.id = str(uuid4())
         self.weeks[week.id] = week
+        self._bump(week.user_id)
         return week
 
-    async def delete(self, week_id: str) -> None:
-        if week_id in self.weeks:
-            del self.weeks[week_id]
+    async def create_many(self, weeks: List[Week]) -> int:
+        for week in weeks:
+            await self.create(week)
+        return len(weeks)
+
+    async def delete(self, week_id: str) -> Optional[Week]:
+        week = self.weeks.pop(week_id, None)
+        if week:
+            self.tombstones[week_id] = (week.user_id, datetime.now())
+            self._bump(week.user_id)
+        return week
 
     async def add_final_km(self, week_id: str, final_km: float) -> Optional[Week]:
         week = await self.get_by_id(week_id)
         if not week:
             return None
 
-        # Convertendo para float para cálculos
-        km_atual = float(week.kmAtual)
-        litros = float(week.litrosAbastecidos)
+        error = InvalidFinalKmError.check(final_km, week.kmAtual, week.litrosAbastecidos)
+        if error:
+            raise error
 
         # Atualizando valores
-        week.kmFinal = str(final_km)
+        week.kmFinal = float(final_km)
+        week.updated_at = datetime.now()
 
-        # Calculando eficiência se possível
-        if litros > 0:
-            distancia = final_km - km_atual
-            eficiencia = distancia / litros
-            week.eficiencia = str(round(eficiencia, 2))
+        # Calculando eficiência se houve deslocamento
+        distancia = week.kmFinal - week.kmAtual
+        if distancia > 0:
+            week.eficiencia = round(distancia / week.litrosAbastecidos, 2)
 
+        self._bump(week.user_id)
         return week
 
+    async def add_final_km_many(
+        self, final_kms: Dict[str, float]
+    ) -> Dict[str, FinalKmResult]:
+        results: Dict[str, FinalKmResult] = {}
+        for week_id, final_km in final_kms.items():
+            try:
+                results[week_id] = FinalKmResult(week_id, week=await self.add_final_km(week_id, final_km))
+            except InvalidFinalKmError as error:
+                results[week_id] = FinalKmResult(week_id, error=error)
+        return results
+
+    async def get_version(self, user_id: str) -> int:
+        return self.versions.get(user_id, 0)
+
     async def calculate_average_efficiency(self, user_id: str) -> Optional[float]:
         """
         Calcula a eficiência média de combustível para um usuário.
@@ -57,18 +139,82 @@ class InMemoryWeekRepository(WeekRepository):
             float: Eficiência média, ou None se não houver registros
         """
         weeks = await self.get_by_user_id(user_id)
-        valid_efficiencies = []
-        
-        for week in weeks:
-            if week.eficiencia and week.eficiencia != "0":
-                try:
-                    efficiency = float(week.eficiencia)
-                    valid_efficiencies.append(efficiency)
-                except ValueError:
-                    # Ignorar valores inválidos
-                    pass
+        valid_efficiencies = [week.eficiencia for week in weeks if week.eficiencia]
         
         if not valid_efficiencies:
             return None
             
-        return sum(valid_efficiencies) / len(valid_efficiencies)
\ No newline at end of file
+        return sum(valid_efficiencies) / len(valid_efficiencies)
+
+    async def get_analytics(self, user_id: str) -> FuelAnalytics:
+        """
+        Mesmos indicadores do repositório SQLAlchemy, calculados de forma
+        vetorizada com NumPy sobre os registros do usuário.
+        """
+        weeks = [week for week in self.weeks.values() if week.user_id == user_id]
+        if not weeks:
+            return FuelAnalytics(media_eficiencia=None, total_custo=0, total_distancia=0, total_litros=0)
+
+        custo = _floats(weeks, "custo")
+        eficiencia = _floats(weeks, "eficiencia")
+        litros = _floats(weeks, "litrosAbastecidos")
+
+        distancia = _floats(weeks, "kmFinal") - _floats(weeks, "kmAtual")
+        computed = eficiencia[eficiencia != 0]
+        return FuelAnalytics(
+            media_eficiencia=float(computed.mean()) if computed.size else None,
+            total_custo=float(custo.sum()),
+            total_distancia=float(distancia[distancia > 0].sum()),
+            total_litros=float(litros.sum()),
+            variancia_eficiencia=float(computed.var()) if computed.size else None,
+        )
+
+    async def get_series(
+        self,
+        user_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[FuelSeriesPoint]:
+        """
+        Mesma série do repositório SQLAlchemy: os registros são agrupados por
+        período com np.unique e somados com np.bincount, sem laço por período.
+        """
+        if period not in SERIES_PERIODS:
+            raise ValueError(f"Período inválido: {period}")
+
+        weeks = [
+            week for week in self.weeks.values()
+            if week.user_id == user_id
+            and (start is None or week.created_at >= start)
+            and (end is None or week.created_at < end)
+        ]
+        if not weeks:
+            return []
+
+        created_at = np.array([w.created_at for w in weeks], dtype="datetime64[us]")
+        periods, index = np.unique(_period_starts(created_at, period), return_inverse=True)
+        size = periods.size
+
+        eficiencia = _floats(weeks, "eficiencia")
+        distancia = _floats(weeks, "kmFinal") - _floats(weeks, "kmAtual")
+        computed = eficiencia != 0
+
+        registros = np.bincount(index, minlength=size)
+        total_custo = np.bincount(index, weights=_floats(weeks, "custo"), minlength=size)
+        total_litros = np.bincount(index, weights=_floats(weeks, "litrosAbastecidos"), minlength=size)
+        total_distancia = np.bincount(index, weights=np.where(distancia > 0, distancia, 0.0), minlength=size)
+        eficiencia_registros = np.bincount(index[computed], minlength=size)
+        eficiencia_soma = np.bincount(index[computed], weights=eficiencia[computed], minlength=size)
+
+        return [
+            FuelSeriesPoint(
+                periodo=periodo,
+                registros=registros[i],
+                media_eficiencia=eficiencia_soma[i] / eficiencia_registros[i] if eficiencia_registros[i] else None,
+                total_custo=total_custo[i],
+                total_distancia=total_distancia[i],
+                total_litros=total_litros[i],
+            )
+            for i, periodo in enumerate(periods.astype("datetime64[us]").tolist())
+        ]
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from freeroad.infra.models.idempotency_key_model import IdempotencyKeyModel
+
+_table = IdempotencyKeyModel.__table__
+
+
+class SQLAlchemyIdempotencyRepository:
+    """
+    Chaves de idempotência de POST /weeks/.
+
+    claim() insere a chave sem commit: ela é gravada pelo commit da própria
+    criação do registro. No Postgres, um claim concorrente da mesma chave
+    espera no índice único até a transação original terminar, e então
+    encontra a chave (commit) ou a obtém (rollback).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, user_id: str, key: str) -> Optional[Any]:
+        """Linha da chave (core, sempre relida do banco) ou None se não existe ou expirou."""
+        result = await self.session.execute(
+            select(_table).where(
+                _table.c.user_id == user_id, _table.c.key == key, _table.c.expires_at > datetime.now()
+            )
+        )
+        return result.first()
+
+    async def claim(self, user_id: str, key: str, fingerprint: str, week_id: str, ttl: float) -> bool:
+        """
+        Reserva a chave para a criação de `week_id`. Retorna False se outra
+        requisição já a gravou; nesse caso a transação é encerrada aqui.
+        """
+        now = datetime.now()
+        # Chaves expiradas do usuário saem aqui, pela chave primária, sem rotina de limpeza
+        await self.session.execute(delete(_table).where(_table.c.user_id == user_id, _table.c.expires_at <= now))
+        statement = (
+            postgresql.insert(_table)
+            .values(
+                user_id=user_id,
+                key=key,
+                fingerprint=fingerprint,
+                week_id=week_id,
+                created_at=now,
+                expires_at=now + timedelta(seconds=ttl),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "key"])
+            .returning(_table.c.key)
+        )
+        if (await self.session.execute(statement)).first() is not None:
+            return True
+        await self.session.commit()
+        return False
+
+    async def complete(self, user_id: str, key: str, status_code: int, body: bytes) -> None:
+        """Guarda a resposta enviada, que passa a ser reenviada nas repetições."""
+        await self.session.execute(
+            update(_table)
+            .where(_table.c.user_id == user_id, _table.c.key == key)
+            .values(status_code=status_code, response_body=body)
+        )
+        await self.session.commit()
+
+    async def wait(self, user_id: str, key: str, timeout: float, interval: float = 0.02) -> Optional[Any]:
+        """
+        Lê a chave e, enquanto ela estiver em andamento, relê até a resposta
+        aparecer ou `timeout` segundos passarem. Retorna a última linha lida.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            row = await self.get(user_id, key)
+            # Encerra a leitura para que a próxima veja commits de outras conexões
+            await self.session.rollback()
+            if row is None or row.status_code is not None or time.monotonic() >= deadline:
+                return row
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, 0.5)
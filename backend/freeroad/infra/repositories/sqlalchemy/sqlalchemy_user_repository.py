@@ -1,6 +1,7 @@
 from typing import Optional, List, cast
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import update
 from uuid import uuid4
 
 from freeroad.domain.repositories.user_repository import UserRepository
@@ -120,6 +121,19 @@ class SQLAlchemyUserRepository(UserRepository):
         
         return user_model.to_entity() if user_model else None
     
+    async def update_password(self, user_id: str, password: Password) -> None:
+        """
+        Substitui o hash da senha de um usuário.
+
+        Args:
+            user_id (str): O ID do usuário.
+            password (Password): A nova senha (já com hash).
+        """
+        await self.session.execute(
+            update(UserModel).where(UserModel.id == user_id).values(password=str(password.value))
+        )
+        await self.session.commit()
+
     async def get_all(self) -> List[User]:
         """
         Retorna todos os usuários.
@@ -1,104 +1,418 @@
-from typing import List, Optional
-from sqlalchemy.orm import joinedload
+import heapq
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, cast as typing_cast
 from sqlalchemy.future import select
+from sqlalchemy import (
+    BigInteger, CursorResult, DateTime, String, and_, case, column, delete, func, insert, literal, literal_column, true, tuple_, update, values,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import uuid4
 
 from freeroad.domain.entities.week import Week
-from freeroad.domain.repositories.week_repository import WeekRepository
-from freeroad.infra.models.week_model import WeekModel
+from freeroad.domain.repositories.week_repository import FinalKmResult, InvalidFinalKmError, WeekRepository, WeekKey
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+from freeroad.domain.value_objects.fuel_series import SERIES_PERIODS, FuelSeriesPoint
+from freeroad.domain.value_objects.week_change import WeekChange
+from freeroad.infra.models.week_model import (
+    CUSTO_SCALE, EFICIENCIA_SCALE, KM_SCALE, LITROS_SCALE, WeekModel, to_units,
+)
+from freeroad.infra.models.user_fuel_stats_model import UserFuelStatsModel
+from freeroad.infra.models.week_tombstone_model import WeekTombstoneModel
+from freeroad.infra.repositories.sqlalchemy.user_fuel_stats import (
+    apply_fuel_stats,
+    fuel_stats_delta_upsert,
+    rebuild_fuel_stats,
+    stats_to_analytics,
+    week_contribution,
+)
+
+# Linhas por execução em create_many. Cada lote vai como um único INSERT
+# compilado uma vez e executado em modo executemany, que o SQLAlchemy 2 envia
+# como INSERT multi-row ("insertmanyvalues") ou pipeline do driver; compilar um
+# .values() com milhares de linhas custaria mais que a própria inserção.
+BULK_INSERT_CHUNK = 5000
+
+
+def _final_km_values(km_m, source) -> dict:
+    """
+    SET do UPDATE de add_final_km: grava `km_m` (em metros) e recalcula a
+    eficiência a partir das colunas de `source`, mantendo a anterior quando
+    não houve deslocamento.
+
+    Metros por mililitro são km/l, então a eficiência em centésimos é
+    round(100 * distância_m / ml), calculada só com inteiros:
+    (200 * distância + ml) div (2 * ml) arredonda metade para cima, como o
+    round() de Numeric.
+    """
+    distancia = km_m - source.c.km_atual_m
+    return dict(
+        km_final_m=km_m,
+        eficiencia_centesimos=case(
+            (km_m > source.c.km_atual_m, (200 * distancia + source.c.litros_ml) // (2 * source.c.litros_ml)),
+            else_=source.c.eficiencia_centesimos,
+        ),
+        updated_at=datetime.now(),
+    )
+
+
+def _final_km_error(row, final_km: float) -> InvalidFinalKmError:
+    """
+    Erro de um registro que o UPDATE condicional não alterou: o de
+    InvalidFinalKmError.check, com os valores da linha em km e litros. A
+    condição do UPDATE (em metros e mililitros) e a checagem deveriam
+    concordar; se divergirem no arredondamento, o erro é o genérico.
+    """
+    error = InvalidFinalKmError.check(final_km, row.km_atual_m / KM_SCALE, row.litros_ml / LITROS_SCALE)
+    return error or InvalidFinalKmError("final_km", f"Quilometragem final ({final_km}) não pode ser aplicada ao registro")
+
+
+def _updated_week(row) -> Week:
+    """Registro atualizado, a partir das colunas new_* do SELECT de add_final_km(_many)."""
+    return WeekModel.row_to_entity(SimpleNamespace(**{c.name: row._mapping[f"new_{c.name}"] for c in WeekModel.__table__.c}))
 
 
 class SQLAlchemyWeekRepository(WeekRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_all(self) -> List[Week]:
+    def _page(self, query, limit: Optional[int], after: Optional[WeekKey]):
+        """Aplica a ordenação estável e o filtro keyset em (created_at, id)."""
+        if after is not None:
+            query = query.where(tuple_(WeekModel.created_at, WeekModel.id) < tuple_(*after))
+        query = query.order_by(WeekModel.created_at.desc(), WeekModel.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    async def get_all(self, limit: Optional[int] = None, after: Optional[WeekKey] = None) -> List[Week]:
         result = await self.session.execute(
-            select(WeekModel).options(joinedload(WeekModel.user))
+            self._page(select(WeekModel.__table__), limit, after)
         )
-        return [week.to_entity() for week in result.scalars().all()]
+        return [WeekModel.row_to_entity(row) for row in result]
 
     async def get_by_id(self, week_id: str) -> Optional[Week]:
         result = await self.session.execute(
-            select(WeekModel).options(joinedload(WeekModel.user)).where(WeekModel.id == week_id)
+            select(WeekModel.__table__).where(WeekModel.id == week_id)
         )
-        week = result.scalar_one_or_none()
-        return week.to_entity() if week else None
+        row = result.one_or_none()
+        return WeekModel.row_to_entity(row) if row else None
 
-    async def get_by_user_id(self, user_id: str) -> List[Week]:
+    async def get_by_user_id(
+        self, user_id: str, limit: Optional[int] = None, after: Optional[WeekKey] = None
+    ) -> List[Week]:
         result = await self.session.execute(
-            select(WeekModel).options(joinedload(WeekModel.user)).where(WeekModel.user_id == user_id)
+            self._page(select(WeekModel.__table__).where(WeekModel.user_id == user_id), limit, after)
         )
-        return [week.to_entity() for week in result.scalars().all()]
+        return [WeekModel.row_to_entity(row) for row in result]
 
-    async def create(self, week: Week) -> Week:
-        week_model = WeekModel.from_entity(week)
-        self.session.add(week_model)
-        await self.session.commit()
-        await self.session.refresh(week_model)
-        return week_model.to_entity()
+    async def stream_by_user_id(self, user_id: str, batch_size: int = 1000) -> AsyncIterator[List[Week]]:
+        """
+        Lê os registros por um cursor no servidor (session.stream + yield_per):
+        o driver busca `batch_size` linhas por vez e só o lote atual fica em
+        memória. A ordem (created_at, id) crescente usa o mesmo índice da listagem.
+        """
+        query = (
+            select(WeekModel.__table__)
+            .where(WeekModel.user_id == user_id)
+            .order_by(WeekModel.created_at, WeekModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        try:
+            async for rows in result.partitions():
+                yield [WeekModel.row_to_entity(row) for row in rows]
+        finally:
+            await result.close()
 
-    async def update(self, week: Week) -> Optional[Week]:
-        result = await self.session.execute(
-            select(WeekModel).where(WeekModel.id == week.id)
+    async def get_changes(
+        self, user_id: str, after: Optional[WeekKey] = None, limit: Optional[int] = None
+    ) -> List[WeekChange]:
+        """
+        Duas leituras keyset em ordem crescente, uma em weeks pelo índice
+        (user_id, updated_at, id) e outra em week_tombstones pelo índice
+        (user_id, deleted_at, id), intercaladas por (changed_at, id). Cada uma
+        traz no máximo `limit` linhas: o custo acompanha a quantidade de
+        alterações desde o cursor, não o tamanho do histórico.
+        """
+        weeks = WeekModel.__table__
+        tombstones = WeekTombstoneModel.__table__
+        weeks_query = (
+            select(weeks)
+            .where(weeks.c.user_id == user_id)
+            .order_by(weeks.c.updated_at, weeks.c.id)
         )
-        week_model = result.scalar_one_or_none()
-        if not week_model:
-            return None
+        tombstones_query = (
+            select(tombstones.c.id, tombstones.c.deleted_at)
+            .where(tombstones.c.user_id == user_id)
+            .order_by(tombstones.c.deleted_at, tombstones.c.id)
+        )
+        if after is not None:
+            weeks_query = weeks_query.where(tuple_(weeks.c.updated_at, weeks.c.id) > tuple_(*after))
+            tombstones_query = tombstones_query.where(tuple_(tombstones.c.deleted_at, tombstones.c.id) > tuple_(*after))
+        if limit is not None:
+            weeks_query = weeks_query.limit(limit)
+            tombstones_query = tombstones_query.limit(limit)
 
-        week_model.title = week.title
-        week_model.km_atual = float(week.kmAtual) 
-        week_model.km_final = float(week.kmFinal) 
-        week_model.custo = float(week.custo) 
-        week_model.eficiencia = float(week.eficiencia) 
-        week_model.litros_abastecidos = float(week.litrosAbastecidos) 
+        updated = [WeekChange.updated(WeekModel.row_to_entity(row)) for row in await self.session.execute(weeks_query)]
+        deleted = [WeekChange(row.id, row.deleted_at) for row in await self.session.execute(tombstones_query)]
+        changes = list(heapq.merge(updated, deleted, key=lambda change: change.key))
+        return changes[:limit] if limit is not None else changes
 
+    async def purge_tombstones(self, before: datetime) -> int:
+        """Apaga as remoções registradas antes de `before`; retorna quantas."""
+        table = WeekTombstoneModel.__table__
+        result = typing_cast(
+            CursorResult[Any], await self.session.execute(delete(table).where(table.c.deleted_at < before))
+        )
         await self.session.commit()
-        await self.session.refresh(week_model)
-        return week_model.to_entity()
+        return result.rowcount
+
+    async def get_analytics(self, user_id: str) -> FuelAnalytics:
+        """Lê os indicadores da rollup user_fuel_stats (busca pela chave primária)."""
+        stats = await self.session.get(UserFuelStatsModel, user_id, populate_existing=True)
+        return stats_to_analytics(stats)
+
+    async def get_series(
+        self,
+        user_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[FuelSeriesPoint]:
+        """
+        Agrupa os registros do usuário por período no próprio banco. O filtro
+        por user_id e created_at usa o índice (user_id, created_at, id).
+        As somas saem nas unidades inteiras e são convertidas aqui.
+        """
+        if period not in SERIES_PERIODS:
+            raise ValueError(f"Período inválido: {period}")
+
+        # Início do período (date_trunc; a semana começa na segunda). O período
+        # entra como literal, já validado, para que a expressão do SELECT e a
+        # do GROUP BY sejam idênticas.
+        bucket = func.date_trunc(literal_column(f"'{period}'"), WeekModel.created_at)
+        closed = WeekModel.km_final_m > WeekModel.km_atual_m
+        computed = and_(WeekModel.eficiencia_centesimos.is_not(None), WeekModel.eficiencia_centesimos != 0)
+        query = (
+            select(
+                bucket.label("periodo"),
+                func.count().label("registros"),
+                func.avg(case((computed, WeekModel.eficiencia_centesimos))).label("media_eficiencia"),
+                func.sum(WeekModel.custo_centavos).label("total_custo"),
+                func.sum(case((closed, WeekModel.km_final_m - WeekModel.km_atual_m), else_=0)).label("total_distancia"),
+                func.sum(WeekModel.litros_ml).label("total_litros"),
+            )
+            .where(WeekModel.user_id == user_id)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        if start is not None:
+            query = query.where(WeekModel.created_at >= start)
+        if end is not None:
+            query = query.where(WeekModel.created_at < end)
+
+        result = await self.session.execute(query)
+        return [
+            FuelSeriesPoint(
+                periodo=row.periodo,
+                registros=row.registros,
+                media_eficiencia=row.media_eficiencia / EFICIENCIA_SCALE if row.media_eficiencia is not None else None,
+                total_custo=row.total_custo / CUSTO_SCALE,
+                total_distancia=row.total_distancia / KM_SCALE,
+                total_litros=row.total_litros / LITROS_SCALE,
+            )
+            for row in result
+        ]
 
-    async def delete(self, week_id: str) -> None:
+    async def get_version(self, user_id: str) -> int:
+        """Lê a versão na linha da rollup (consulta pela chave primária)."""
         result = await self.session.execute(
-            select(WeekModel).where(WeekModel.id == week_id)
+            select(UserFuelStatsModel.versao).where(UserFuelStatsModel.user_id == user_id)
         )
-        week_model = result.scalar_one_or_none()
-        if week_model:
-            await self.session.delete(week_model)
+        return result.scalar_one_or_none() or 0
+
+    async def rebuild_stats(self, user_id: Optional[str] = None) -> int:
+        """Recalcula a rollup a partir de weeks (todos os usuários ou apenas um)."""
+        return await rebuild_fuel_stats(self.session, user_id)
+
+    async def create(self, week: Week) -> Week:
+        """
+        INSERT ... RETURNING: a linha gravada volta no próprio comando, sem
+        refresh, e a rollup é atualizada na mesma instrução (CTE).
+        """
+        table = WeekModel.__table__
+        inserted = insert(table).values(**WeekModel.entity_to_row(week)).returning(*table.c).cte("inserted")
+        query = select(inserted).add_cte(fuel_stats_delta_upsert(new=inserted).cte("stats"))
+        row = (await self.session.execute(query)).one()
+        await self.session.commit()
+        return WeekModel.row_to_entity(row)
+
+    async def create_many(self, weeks: List[Week]) -> int:
+        """
+        Insere os registros em lotes de BULK_INSERT_CHUNK linhas, atualiza a
+        rollup com um upsert por usuário e faz um único commit.
+        Se qualquer linha falhar, nada é gravado.
+        """
+        if not weeks:
+            return 0
+
+        rows = [WeekModel.entity_to_row(week) for week in weeks]
+        contributions: Dict[str, List[Dict[str, int]]] = {}
+        for row in rows:
+            contributions.setdefault(row["user_id"], []).append(week_contribution(
+                row["km_atual_m"], row["km_final_m"], row["custo_centavos"], row["eficiencia_centesimos"], row["litros_ml"]
+            ))
+
+        statement = insert(WeekModel.__table__)
+        try:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK):
+                await self.session.execute(statement, rows[start:start + BULK_INSERT_CHUNK])
+            for user_id, user_contributions in contributions.items():
+                await apply_fuel_stats(self.session, user_id, *user_contributions)
             await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return len(rows)
+
+    async def update(self, week: Week) -> Optional[Week]:
+        """
+        Um único comando, como em add_final_km: trava o registro (FOR UPDATE),
+        aplica o UPDATE ... RETURNING e soma na rollup a linha nova menos a
+        travada. Atualizações simultâneas do mesmo registro ficam em série e
+        cada uma desconta exatamente a contribuição que substituiu.
+        """
+        table = WeekModel.__table__
+        row = WeekModel.entity_to_row(week)
+        target = select(table).where(table.c.id == week.id).with_for_update().cte("target")
+        updated = (
+            update(table)
+            .where(table.c.id == target.c.id)
+            .values(
+                title=row["title"],
+                km_atual_m=row["km_atual_m"],
+                km_final_m=row["km_final_m"],
+                custo_centavos=row["custo_centavos"],
+                eficiencia_centesimos=row["eficiencia_centesimos"],
+                litros_ml=row["litros_ml"],
+                updated_at=datetime.now(),
+            )
+            .returning(*table.c)
+            .cte("updated")
+        )
+        query = select(updated).add_cte(fuel_stats_delta_upsert(updated, target).cte("stats"))
+        current = (await self.session.execute(query)).one_or_none()
+        await self.session.commit()
+        return WeekModel.row_to_entity(current) if current is not None else None
+
+    async def delete(self, week_id: str) -> Optional[Week]:
+        """
+        DELETE ... RETURNING: a linha removida alimenta a rollup e o registro
+        da remoção em week_tombstones no mesmo comando, sem SELECT prévio.
+        """
+        table = WeekModel.__table__
+        delete_week = delete(table).where(table.c.id == week_id).returning(*table.c)
+        deleted = delete_week.cte("deleted")
+        tombstone = postgresql.insert(WeekTombstoneModel.__table__).from_select(
+            ["id", "user_id", "deleted_at"],
+            select(deleted.c.id, deleted.c.user_id, literal(datetime.now(), DateTime)),
+        )
+        tombstone = tombstone.on_conflict_do_update(
+            index_elements=["id"], set_=dict(user_id=tombstone.excluded.user_id, deleted_at=tombstone.excluded.deleted_at)
+        )
+        query = (
+            select(deleted)
+            .add_cte(fuel_stats_delta_upsert(old=deleted).cte("stats"))
+            .add_cte(tombstone.cte("tombstone"))
+        )
+        row = (await self.session.execute(query)).one_or_none()
+        await self.session.commit()
+        return WeekModel.row_to_entity(row) if row is not None else None
 
     async def add_final_km(self, week_id: str, final_km: float) -> Optional[Week]:
-        result = await self.session.execute(
-            select(WeekModel).where(WeekModel.id == week_id)
+        """
+        Um único comando: trava o registro (FOR UPDATE), aplica o UPDATE
+        condicional calculando a eficiência no banco, soma a diferença na rollup
+        e retorna os valores antigos e novos. Sem linha -> None; linha sem
+        atualização -> InvalidFinalKmError.
+        """
+        table = WeekModel.__table__
+        km = literal(to_units(final_km, KM_SCALE), BigInteger)
+        target = select(table).where(table.c.id == week_id).with_for_update().cte("target")
+        updated = (
+            update(table)
+            .where(table.c.id == target.c.id, km >= target.c.km_atual_m, target.c.litros_ml > 0)
+            .values(**_final_km_values(km, target))
+            .returning(*table.c)
+            .cte("updated")
         )
-        week_model = result.scalar_one_or_none()
-        if not week_model:
-            return None
+        query = (
+            select(target.c.km_atual_m, target.c.litros_ml, *[c.label(f"new_{c.name}") for c in updated.c])
+            .select_from(target.outerjoin(updated, true()))
+            .add_cte(fuel_stats_delta_upsert(updated, target).cte("stats"))
+        )
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None or row.new_id is None:
+            await self.session.rollback()
+            return self._final_km_miss(row, final_km)
+        await self.session.commit()
+        return _updated_week(row)
 
-        # Atualiza a quilometragem final
-        week_model.km_final = float(final_km)  # Garantir que é float
-        
-        # Calcula a eficiência de combustível (km/l)
-        try:
-            # Converter para float para garantir operações consistentes
-            km_atual_float = float(week_model.km_atual)
-            final_km_float = float(week_model.km_final)
-            litros_float = float(week_model.litros_abastecidos)
-            
-            km_percorrido = final_km_float - km_atual_float
-            
-            if km_percorrido > 0 and litros_float > 0:
-                # Calcula km/l - quilômetros percorridos dividido por litros abastecidos
-                eficiencia = km_percorrido / litros_float
-                week_model.eficiencia = round(eficiencia, 2)  # Arredonda para 2 casas decimais
-                print(f"Eficiência calculada: {eficiencia:.2f} km/l (km_percorrido={km_percorrido}, litros={litros_float})")
-            else:
-                print(f"Não foi possível calcular eficiência: km_percorrido={km_percorrido}, litros={litros_float}")
-                
-        except Exception as e:
-            print(f"Erro ao calcular eficiência: {str(e)}")
-            # Não propagar o erro, apenas logar
-        
+    async def add_final_km_many(
+        self, final_kms: Dict[str, float]
+    ) -> Dict[str, FinalKmResult]:
+        """
+        Um único comando: os pares (id, final_km) entram como VALUES, os
+        registros são travados em ordem de id, um UPDATE ... FROM aplica as
+        quilometragens válidas com a eficiência calculada no banco e a rollup
+        recebe a diferença somada por usuário.
+        """
+        if not final_kms:
+            return {}
+
+        table = WeekModel.__table__
+        pairs = (
+            values(column("id", String), column("final_km_m", BigInteger), name="pairs")
+            .data([(week_id, to_units(final_km, KM_SCALE)) for week_id, final_km in final_kms.items()])
+        )
+        target = (
+            select(table, pairs.c.final_km_m.label("new_km"))
+            .join(pairs, table.c.id == pairs.c.id)
+            .order_by(table.c.id)
+            .with_for_update(of=table)
+            .cte("target")
+        )
+        updated = (
+            update(table)
+            .where(table.c.id == target.c.id, target.c.new_km >= target.c.km_atual_m, target.c.litros_ml > 0)
+            .values(**_final_km_values(target.c.new_km, target))
+            .returning(*table.c)
+            .cte("updated")
+        )
+        query = (
+            select(target.c.id, target.c.km_atual_m, target.c.litros_ml, *[c.label(f"new_{c.name}") for c in updated.c])
+            .select_from(target.outerjoin(updated, updated.c.id == target.c.id))
+            .add_cte(fuel_stats_delta_upsert(updated, target).cte("stats"))
+        )
+        rows = {row.id: row for row in (await self.session.execute(query)).all()}
         await self.session.commit()
-        await self.session.refresh(week_model)
-        return week_model.to_entity()
+
+        results: Dict[str, FinalKmResult] = {}
+        for week_id, final_km in final_kms.items():
+            row = rows.get(week_id)
+            if row is None:
+                results[week_id] = FinalKmResult(week_id)
+            elif row.new_id is None:
+                results[week_id] = FinalKmResult(week_id, error=_final_km_error(row, final_km))
+            else:
+                results[week_id] = FinalKmResult(week_id, week=_updated_week(row))
+        return results
+
+    @staticmethod
+    def _final_km_miss(row, final_km: float) -> None:
+        """Registro inexistente -> None; existente mas não atualizado -> InvalidFinalKmError."""
+        if row is None:
+            return None
+        raise _final_km_error(row, final_km)
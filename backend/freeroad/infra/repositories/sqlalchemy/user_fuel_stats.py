@@ -0,0 +1,194 @@
+from decimal import Decimal
+from typing import Any, Dict, Optional, cast as typing_cast
+
+from sqlalchemy import ColumnElement, CursorResult, Numeric, and_, case, cast, func, literal, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+from freeroad.infra.models.user_fuel_stats_model import UserFuelStatsModel
+from freeroad.infra.models.week_model import CUSTO_SCALE, EFICIENCIA_SCALE, KM_SCALE, LITROS_SCALE, WeekModel
+
+# Colunas somáveis da rollup (todas exceto a chave e o timestamp)
+STATS_COLUMNS = (
+    "registros",
+    "total_custo_centavos",
+    "total_litros_ml",
+    "total_distancia_m",
+    "eficiencia_registros",
+    "eficiencia_soma_centesimos",
+    "eficiencia_soma_quadrados",
+)
+
+def week_contribution(km_atual_m, km_final_m, custo_centavos, eficiencia_centesimos, litros_ml, sign: int = 1) -> Dict[str, int]:
+    """
+    Contribuição de um registro (valores das colunas inteiras de weeks) para a
+    rollup do usuário. Use sign=-1 para remover a contribuição antiga (delete
+    ou antes de uma atualização).
+    """
+    closed = km_final_m > km_atual_m
+    eficiencia = eficiencia_centesimos or 0
+    computed = eficiencia != 0
+    return {
+        "registros": sign,
+        "total_custo_centavos": sign * custo_centavos,
+        "total_litros_ml": sign * litros_ml,
+        "total_distancia_m": sign * (km_final_m - km_atual_m) if closed else 0,
+        "eficiencia_registros": sign if computed else 0,
+        "eficiencia_soma_centesimos": sign * eficiencia,
+        "eficiencia_soma_quadrados": sign * eficiencia * eficiencia,
+    }
+
+
+def model_contribution(week_model: WeekModel, sign: int = 1) -> Dict[str, int]:
+    return week_contribution(
+        week_model.km_atual_m,
+        week_model.km_final_m,
+        week_model.custo_centavos,
+        week_model.eficiencia_centesimos,
+        week_model.litros_ml,
+        sign,
+    )
+
+
+async def apply_fuel_stats(session: AsyncSession, user_id: str, *contributions: Dict[str, int]) -> None:
+    """
+    Soma as contribuições na linha do usuário com um único upsert atômico
+    (INSERT ... ON CONFLICT DO UPDATE SET col = col + excluded.col) e
+    incrementa a versão, mesmo quando os totais não mudam (ex.: só o título).
+    Não faz commit: deve rodar na mesma transação da escrita em weeks.
+    """
+    delta = {column: sum(c[column] for c in contributions) for column in STATS_COLUMNS}
+
+    table = UserFuelStatsModel.__table__
+    statement = postgresql.insert(table).values(user_id=user_id, versao=1, updated_at=func.now(), **delta)
+    statement = statement.on_conflict_do_update(index_elements=[table.c.user_id], set_=_accumulate(statement))
+    await session.execute(statement)
+
+
+def _accumulate(statement: postgresql.Insert) -> Dict[str, ColumnElement]:
+    """SET do ON CONFLICT: soma os totais recebidos e incrementa a versão."""
+    table = UserFuelStatsModel.__table__
+    return {
+        **{column: table.c[column] + statement.excluded[column] for column in STATS_COLUMNS},
+        "versao": table.c.versao + 1,
+        "updated_at": statement.excluded.updated_at,
+    }
+
+
+def contribution_columns(source) -> Dict[str, ColumnElement]:
+    """
+    Contribuição de cada linha para a rollup, como expressões SQL sobre
+    `source` (a tabela weeks ou uma CTE/alias com as mesmas colunas).
+    Mesmas regras de week_contribution. O quadrado é calculado em Numeric,
+    pois pode passar do limite de bigint em eficiências muito altas.
+    """
+    closed = source.c.km_final_m > source.c.km_atual_m
+    computed = and_(source.c.eficiencia_centesimos.is_not(None), source.c.eficiencia_centesimos != 0)
+    eficiencia = cast(source.c.eficiencia_centesimos, Numeric(38, 0))
+    return {
+        "registros": literal(1),
+        "total_custo_centavos": source.c.custo_centavos,
+        "total_litros_ml": source.c.litros_ml,
+        "total_distancia_m": case((closed, source.c.km_final_m - source.c.km_atual_m), else_=0),
+        "eficiencia_registros": case((computed, 1), else_=0),
+        "eficiencia_soma_centesimos": case((computed, source.c.eficiencia_centesimos), else_=0),
+        "eficiencia_soma_quadrados": case((computed, eficiencia * eficiencia), else_=0),
+    }
+
+
+def _aggregate_select():
+    """SELECT que recalcula a rollup a partir de weeks, agrupado por usuário."""
+    weeks = WeekModel.__table__
+    columns = contribution_columns(weeks)
+    return select(
+        weeks.c.user_id,
+        *[func.coalesce(func.sum(columns[column]), 0) for column in STATS_COLUMNS],
+        literal(1),
+        func.now(),
+    ).group_by(weeks.c.user_id)
+
+
+def fuel_stats_delta_upsert(new=None, old=None):
+    """
+    Upsert (Postgres) que soma na rollup a contribuição das linhas `new` menos
+    a das linhas `old` (ligadas por id quando as duas existem). Pensado para
+    ser usado como CTE junto do INSERT/UPDATE/DELETE ... RETURNING que gerou
+    essas linhas, no mesmo comando. As linhas são somadas por usuário, pois o
+    ON CONFLICT não pode atualizar a mesma linha da rollup duas vezes.
+    """
+    table = UserFuelStatsModel.__table__
+    if new is not None and old is not None:
+        new_columns, old_columns = contribution_columns(new), contribution_columns(old)
+        delta = [new_columns[column] - old_columns[column] for column in STATS_COLUMNS]
+        source, user_id = new.join(old, new.c.id == old.c.id), new.c.user_id
+    elif new is not None:
+        columns = contribution_columns(new)
+        delta = [columns[column] for column in STATS_COLUMNS]
+        source, user_id = new, new.c.user_id
+    else:
+        columns = contribution_columns(old)
+        delta = [-columns[column] for column in STATS_COLUMNS]
+        source, user_id = old, old.c.user_id
+
+    rows = (
+        select(user_id, *[func.sum(column) for column in delta], literal(1), func.now())
+        .select_from(source)
+        .group_by(user_id)
+    )
+    statement = postgresql.insert(table).from_select(["user_id", *STATS_COLUMNS, "versao", "updated_at"], rows)
+    return statement.on_conflict_do_update(index_elements=[table.c.user_id], set_=_accumulate(statement))
+
+
+async def rebuild_fuel_stats(session: AsyncSession, user_id: Optional[str] = None) -> int:
+    """
+    Recalcula a rollup a partir de weeks (backfill ou correção), para todos os
+    usuários ou apenas um. Retorna a quantidade de linhas gravadas.
+
+    As linhas existentes são zeradas e sobrescritas em vez de apagadas, para
+    que a versão continue crescendo: uma versão reaproveitada faria clientes
+    com ETag antigo receberem 304 para dados diferentes.
+    """
+    table = UserFuelStatsModel.__table__
+    aggregate = _aggregate_select()
+    reset = update(table).values(**{column: 0 for column in STATS_COLUMNS}, versao=table.c.versao + 1, updated_at=func.now())
+    if user_id is not None:
+        aggregate = aggregate.where(WeekModel.user_id == user_id)
+        reset = reset.where(table.c.user_id == user_id)
+
+    await session.execute(reset)
+    statement = postgresql.insert(table).from_select(["user_id", *STATS_COLUMNS, "versao", "updated_at"], aggregate)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={column: statement.excluded[column] for column in (*STATS_COLUMNS, "updated_at")},
+    )
+    result = typing_cast(CursorResult[Any], await session.execute(statement))
+    await session.commit()
+    return result.rowcount
+
+
+def stats_to_analytics(stats: Optional[UserFuelStatsModel]) -> FuelAnalytics:
+    """
+    Converte a linha da rollup nos indicadores (média e variância populacional),
+    voltando das unidades inteiras para km, litros e reais.
+    """
+    if stats is None or not stats.registros:
+        return FuelAnalytics(media_eficiencia=None, total_custo=0, total_distancia=0, total_litros=0)
+
+    media: Optional[float] = None
+    variancia: Optional[float] = None
+    if stats.eficiencia_registros:
+        # Em Decimal: a soma dos quadrados passa da precisão de um float
+        n = stats.eficiencia_registros
+        soma = Decimal(stats.eficiencia_soma_centesimos) / n
+        quadrados = max(Decimal(0), Decimal(stats.eficiencia_soma_quadrados) / n - soma * soma)
+        media = float(soma / EFICIENCIA_SCALE)
+        variancia = float(quadrados / (EFICIENCIA_SCALE * EFICIENCIA_SCALE))
+
+    return FuelAnalytics(
+        media_eficiencia=media,
+        total_custo=stats.total_custo_centavos / CUSTO_SCALE,
+        total_distancia=stats.total_distancia_m / KM_SCALE,
+        total_litros=stats.total_litros_ml / LITROS_SCALE,
+        variancia_eficiencia=variancia,
+    )
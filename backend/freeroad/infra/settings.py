@@ -41,3 +41,65 @@ DATABASE_URL = raw_database_url
 if DATABASE_URL is None or DATABASE_URL == "":
     print("AVISO: Usando configuração local do banco.", file=sys.stderr)
     DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+
+# Configurações de autenticação (JWT)
+SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkeychangeisso")  # em produção, definir no .env
+ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", str(60 * 24)))  # 1 dia
+
+# Cache de usuários autenticados (consulta ao banco em /users/me e afins)
+PRINCIPAL_CACHE_MAXSIZE = int(os.getenv("PRINCIPAL_CACHE_MAXSIZE", "1024"))
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "300"))
+
+# Controle de admissão do login (protege a CPU contra rajadas de bcrypt)
+LOGIN_EMAIL_BURST = float(os.getenv("LOGIN_EMAIL_BURST", "5"))
+LOGIN_EMAIL_PER_MINUTE = float(os.getenv("LOGIN_EMAIL_PER_MINUTE", "5"))
+LOGIN_CLIENT_BURST = float(os.getenv("LOGIN_CLIENT_BURST", "20"))
+LOGIN_CLIENT_PER_MINUTE = float(os.getenv("LOGIN_CLIENT_PER_MINUTE", "60"))
+LOGIN_MAX_CONCURRENT_VERIFICATIONS = int(os.getenv("LOGIN_MAX_CONCURRENT_VERIFICATIONS", "8"))
+
+# Custo do bcrypt (log2 das iterações). Hashes com custo diferente são
+# refeitos automaticamente no próximo login bem-sucedido.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Limite de registros por requisição em POST /weeks/bulk
+WEEK_BULK_MAX_ITEMS = int(os.getenv("WEEK_BULK_MAX_ITEMS", "50000"))
+
+# Registros por INSERT/commit na importação de CSV (POST /weeks/import/csv)
+WEEK_IMPORT_CHUNK_SIZE = int(os.getenv("WEEK_IMPORT_CHUNK_SIZE", "1000"))
+
+# Linhas buscadas por vez do cursor no servidor em GET /weeks/export
+WEEK_EXPORT_BATCH_SIZE = int(os.getenv("WEEK_EXPORT_BATCH_SIZE", "1000"))
+
+# Limite de pares (week_id, final_km) por requisição em PUT /weeks/final_km.
+# Cada par vira dois parâmetros do único UPDATE; o asyncpg aceita até 32767.
+WEEK_FINAL_KM_BATCH_MAX_ITEMS = int(os.getenv("WEEK_FINAL_KM_BATCH_MAX_ITEMS", "1000"))
+
+# Cache read-through de GET /weeks/, /weeks/{id} e /weeks/user/{id}:
+# "" (desligado), "memory" (por processo) ou "memcached" (compartilhado).
+# Com vários workers use memcached: o backend em memória só é invalidado
+# pelas escritas recebidas pelo próprio worker.
+WEEK_CACHE_BACKEND = os.getenv("WEEK_CACHE_BACKEND", "").strip().lower()
+WEEK_CACHE_TTL_SECONDS = float(os.getenv("WEEK_CACHE_TTL_SECONDS", "30"))
+WEEK_CACHE_MAXSIZE = int(os.getenv("WEEK_CACHE_MAXSIZE", "4096"))
+WEEK_CACHE_MEMCACHED_HOST = os.getenv("WEEK_CACHE_MEMCACHED_HOST", "localhost")
+WEEK_CACHE_MEMCACHED_PORT = int(os.getenv("WEEK_CACHE_MEMCACHED_PORT", "11211"))
+
+# Compressão das respostas (brotli ou gzip, negociada pelo Accept-Encoding).
+# Corpos menores que o mínimo vão sem compressão: o ganho não paga a CPU.
+# Brotli 4 comprime mais que gzip 6 gastando menos CPU em JSON.
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+RESPONSE_COMPRESSION_GZIP_LEVEL = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", "6"))
+RESPONSE_COMPRESSION_BROTLI_QUALITY = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Idempotency-Key em POST /weeks/: por quanto tempo o resultado é reenviado
+# nas repetições, e quanto uma repetição concorrente espera a original.
+IDEMPOTENCY_KEY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))
+
+# Feed de alterações (GET /weeks/changes). Alterações dos últimos
+# WEEK_CHANGES_SETTLE_SECONDS são reenviadas na sincronização seguinte, pois
+# podem estar em transações ainda abertas. Remoções ficam registradas por
+# WEEK_TOMBSTONE_RETENTION_DAYS; cursores mais antigos recebem 410.
+WEEK_CHANGES_SETTLE_SECONDS = float(os.getenv("WEEK_CHANGES_SETTLE_SECONDS", "10"))
+WEEK_TOMBSTONE_RETENTION_DAYS = float(os.getenv("WEEK_TOMBSTONE_RETENTION_DAYS", "30"))
@@ -0,0 +1,211 @@
+import asyncio
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from freeroad.domain.entities.week import Week
+from freeroad.infra.cache import TTLCache
+
+
+class WeekCacheBackend(ABC):
+    """
+    Armazenamento usado pelo CachedWeekRepository. Guarda entradas
+    (momento da gravação, valor) e contadores inteiros de geração. Todas as
+    entradas expiram após o TTL do backend.
+
+    Falhas do backend nunca devem chegar às rotas: uma leitura com erro é
+    tratada como ausência e uma escrita com erro é ignorada.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None: ...
+
+    @abstractmethod
+    async def add(self, key: str, value: Any) -> bool:
+        """Grava apenas se a chave não existe; retorna se gravou."""
+
+    @abstractmethod
+    async def incr(self, key: str) -> Optional[int]:
+        """Incrementa um contador existente; None se a chave não existe."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]: ...
+
+
+class MemoryWeekCache(WeekCacheBackend):
+    """
+    Backend em processo (LRU + TTL). Os objetos são guardados sem cópia nem
+    serialização; as rotas não alteram os registros lidos.
+
+    Cada processo tem o seu: com vários workers, uma escrita invalida apenas o
+    cache do worker que a recebeu e os demais podem servir dados com até TTL
+    segundos de atraso. Nesse caso use o backend memcached.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 30.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    async def add(self, key: str, value: Any) -> bool:
+        if self._cache.get(key) is not None:
+            return False
+        self._cache.set(key, value)
+        return True
+
+    async def incr(self, key: str) -> Optional[int]:
+        value = self._cache.get(key)
+        if value is None:
+            return None
+        self._cache.set(key, value + 1)
+        return value + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", **self._cache.stats()}
+
+
+def _encode_week(week: Week) -> Dict[str, Any]:
+    data = {name: getattr(week, name) for name in Week.__slots__}
+    data["created_at"] = week.created_at.isoformat()
+    data["updated_at"] = week.updated_at.isoformat()
+    return data
+
+
+def _decode_week(data: Dict[str, Any]) -> Week:
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return Week(**data)
+
+
+def encode_value(value: Any) -> bytes:
+    """Serializa um contador, uma entrada (momento, Week) ou (momento, [Week])."""
+    if isinstance(value, int):
+        return str(value).encode()
+    stored_at, weeks = value
+    if isinstance(weeks, Week):
+        return json.dumps({"t": stored_at, "week": _encode_week(weeks)}).encode()
+    return json.dumps({"t": stored_at, "weeks": [_encode_week(w) for w in weeks]}).encode()
+
+
+def decode_value(data: bytes) -> Any:
+    if data.isdigit():
+        return int(data)
+    entry = json.loads(data)
+    if "week" in entry:
+        return entry["t"], _decode_week(entry["week"])
+    return entry["t"], [_decode_week(w) for w in entry["weeks"]]
+
+
+class MemcachedWeekCache(WeekCacheBackend):
+    """
+    Backend compartilhado entre processos, pelo protocolo de texto do
+    memcached (get, set, add, incr) sobre uma conexão asyncio, sem dependências.
+
+    Os comandos de um processo passam em sequência pela mesma conexão. Erros de
+    rede ou timeout fecham a conexão (reaberta no próximo comando) e contam
+    como ausência; valores que o servidor recusa (ex.: acima de 1 MB) apenas
+    não são guardados.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 11211, ttl: float = 30.0, timeout: float = 0.5):
+        self.host = host
+        self.port = port
+        self.ttl = ttl
+        self.timeout = timeout
+        self._connection: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._lock = asyncio.Lock()
+        self.errors = 0
+        self.rejected = 0
+
+    @staticmethod
+    def _key(key: str) -> bytes:
+        """Chaves do memcached: até 250 bytes, sem espaços nem caracteres de controle."""
+        raw = key.encode()
+        if len(raw) > 200 or any(byte <= 32 or byte == 127 for byte in raw):
+            return b"h:" + hashlib.sha1(raw).hexdigest().encode()
+        return raw
+
+    async def _call(self, request: bytes, read_value: bool = False) -> Optional[Tuple[bytes, Optional[bytes]]]:
+        """Envia um comando e retorna (linha de resposta, valor lido) ou None em caso de erro."""
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(self._roundtrip(request, read_value), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                self.errors += 1
+                await self.close()
+                return None
+
+    async def _roundtrip(self, request: bytes, read_value: bool) -> Tuple[bytes, Optional[bytes]]:
+        if self._connection is None:
+            self._connection = await asyncio.open_connection(self.host, self.port)
+        reader, writer = self._connection
+        writer.write(request)
+        await writer.drain()
+
+        line = await reader.readuntil(b"\r\n")
+        if read_value and line.startswith(b"VALUE "):
+            size = int(line.split()[3])
+            value = (await reader.readexactly(size + 2))[:-2]
+            end = await reader.readuntil(b"\r\n")
+            if end != b"END\r\n":
+                raise ValueError(f"Resposta inesperada do memcached: {end!r}")
+            return line, value
+        return line, None
+
+    async def _store(self, command: bytes, key: str, value: Any) -> bool:
+        data = encode_value(value)
+        request = b"%s %s 0 %d %d\r\n%s\r\n" % (command, self._key(key), int(self.ttl), len(data), data)
+        response = await self._call(request)
+        if response is None:
+            return False
+        if response[0] == b"STORED\r\n":
+            return True
+        if response[0] != b"NOT_STORED\r\n":
+            self.rejected += 1
+        return False
+
+    async def get(self, key: str) -> Optional[Any]:
+        response = await self._call(b"get %s\r\n" % self._key(key), read_value=True)
+        if response is None or response[1] is None:
+            return None
+        try:
+            return decode_value(response[1])
+        except (ValueError, KeyError, TypeError):
+            self.errors += 1
+            return None
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._store(b"set", key, value)
+
+    async def add(self, key: str, value: Any) -> bool:
+        return await self._store(b"add", key, value)
+
+    async def incr(self, key: str) -> Optional[int]:
+        response = await self._call(b"incr %s 1\r\n" % self._key(key))
+        if response is None or not response[0][:-2].isdigit():
+            return None
+        return int(response[0])
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            _, writer = self._connection
+            self._connection = None
+            writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memcached",
+            "address": f"{self.host}:{self.port}",
+            "ttl": self.ttl,
+            "errors": self.errors,
+            "rejected": self.rejected,
+        }
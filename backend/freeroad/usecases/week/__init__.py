@@ -1,15 +1,27 @@
 from freeroad.usecases.week.add_final_km import AddFinalKmUseCase
+from freeroad.usecases.week.add_final_km_batch import AddFinalKmBatchUseCase
+from freeroad.usecases.week.calculate_average_efficiency import CalculateAverageEfficiencyUseCase
 from freeroad.usecases.week.create_week import CreateWeekUseCase
+from freeroad.usecases.week.create_weeks_bulk import CreateWeeksBulkUseCase
 from freeroad.usecases.week.delete_week import DeleteWeekUseCase
+from freeroad.usecases.week.export_weeks import ExportWeeksUseCase
 from freeroad.usecases.week.get_all import GetAllWeeksUseCase
 from freeroad.usecases.week.get_by_id import GetWeekByIdUseCase
 from freeroad.usecases.week.get_by_user_id import GetWeeksByUserIdUseCase
+from freeroad.usecases.week.get_changes import GetWeekChangesUseCase
+from freeroad.usecases.week.get_fuel_series import GetFuelSeriesUseCase
 
 __all__ = [
     'AddFinalKmUseCase',
+    'AddFinalKmBatchUseCase',
+    'CalculateAverageEfficiencyUseCase',
     'CreateWeekUseCase',
+    'CreateWeeksBulkUseCase',
     'DeleteWeekUseCase',
+    'ExportWeeksUseCase',
     'GetAllWeeksUseCase',
     'GetWeekByIdUseCase',
     'GetWeeksByUserIdUseCase',
+    'GetWeekChangesUseCase',
+    'GetFuelSeriesUseCase',
 ]
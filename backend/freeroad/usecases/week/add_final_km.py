@@ -18,5 +18,8 @@ class AddFinalKmUseCase:
             
         Returns:
             Week: O objeto Week atualizado, ou None se não encontrado
+
+        Raises:
+            InvalidFinalKmError: Se final_km for menor que kmAtual ou não houver litros abastecidos
         """
         return await self.repository.add_final_km(week_id, final_km)
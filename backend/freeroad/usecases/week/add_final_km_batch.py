@@ -0,0 +1,22 @@
+from typing import Dict
+
+from freeroad.domain.repositories.week_repository import FinalKmResult, WeekRepository
+
+
+class AddFinalKmBatchUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    async def execute(self, final_kms: Dict[str, float]) -> Dict[str, FinalKmResult]:
+        """
+        Adiciona a quilometragem final a vários registros de uma vez,
+        recalculando a eficiência de cada um.
+
+        Args:
+            final_kms: Quilometragem final por ID de registro
+
+        Returns:
+            Dict: Para cada ID, um FinalKmResult com o registro atualizado ou o
+            InvalidFinalKmError que impediu a atualização (ambos None se não encontrado)
+        """
+        return await self.repository.add_final_km_many(final_kms)
@@ -0,0 +1,19 @@
+from freeroad.domain.repositories.week_repository import WeekRepository
+from freeroad.domain.value_objects.fuel_analytics import FuelAnalytics
+
+
+class CalculateAverageEfficiencyUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    async def execute(self, user_id: str) -> FuelAnalytics:
+        """
+        Calcula a eficiência média e os totais de consumo de um usuário.
+        
+        Args:
+            user_id: ID do usuário
+            
+        Returns:
+            FuelAnalytics: Eficiência média, custo total, distância total e litros totais
+        """
+        return await self.repository.get_analytics(user_id)
@@ -0,0 +1,21 @@
+from typing import List
+
+from freeroad.domain.entities.week import Week
+from freeroad.domain.repositories.week_repository import WeekRepository
+
+
+class CreateWeeksBulkUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    async def execute(self, weeks: List[Week]) -> int:
+        """
+        Cria vários registros de abastecimento de uma só vez.
+
+        Args:
+            weeks: Registros já validados
+
+        Returns:
+            int: Quantidade de registros criados
+        """
+        return await self.repository.create_many(weeks)
@@ -0,0 +1,22 @@
+from typing import AsyncIterator, List
+
+from freeroad.domain.entities.week import Week
+from freeroad.domain.repositories.week_repository import WeekRepository
+
+
+class ExportWeeksUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    def execute(self, user_id: str, batch_size: int = 1000) -> AsyncIterator[List[Week]]:
+        """
+        Percorre todo o histórico de um usuário em lotes, para exportação.
+
+        Args:
+            user_id: ID do usuário
+            batch_size: Registros por lote
+
+        Returns:
+            AsyncIterator[List[Week]]: Lotes do mais antigo para o mais recente
+        """
+        return self.repository.stream_by_user_id(user_id, batch_size)
@@ -1,17 +1,21 @@
-from freeroad.domain.repositories.week_repository import WeekRepository
 from freeroad.domain.entities.week import Week
-from typing import List
+from freeroad.domain.repositories.week_repository import WeekRepository, WeekKey
+from typing import List, Optional
 
 
 class GetAllWeeksUseCase:
     def __init__(self, repository: WeekRepository):
         self.repository = repository
 
-    async def execute(self) -> List[Week]:
+    async def execute(self, limit: Optional[int] = None, after: Optional[WeekKey] = None) -> List[Week]:
         """
-        Obtém todos os registros de abastecimento.
+        Obtém todos os registros de abastecimento, do mais recente para o mais antigo.
         
+        Args:
+            limit: Quantidade máxima de registros (opcional)
+            after: Chave (created_at, id) do último registro da página anterior (opcional)
+            
         Returns:
-            List[Week]: Lista de todos os registros de abastecimento
+            List[Week]: Lista de registros de abastecimento
         """
-        return await self.repository.get_all()
+        return await self.repository.get_all(limit=limit, after=after)
@@ -1,20 +1,25 @@
-from freeroad.domain.repositories.week_repository import WeekRepository
 from freeroad.domain.entities.week import Week
-from typing import List
+from freeroad.domain.repositories.week_repository import WeekRepository, WeekKey
+from typing import List, Optional
 
 
 class GetWeeksByUserIdUseCase:
     def __init__(self, repository: WeekRepository):
         self.repository = repository
 
-    async def execute(self, user_id: str) -> List[Week]:
+    async def execute(
+        self, user_id: str, limit: Optional[int] = None, after: Optional[WeekKey] = None
+    ) -> List[Week]:
         """
-        Obtém todos os registros de abastecimento de um usuário específico.
+        Obtém os registros de abastecimento de um usuário específico,
+        do mais recente para o mais antigo.
         
         Args:
             user_id: ID do usuário
+            limit: Quantidade máxima de registros (opcional)
+            after: Chave (created_at, id) do último registro da página anterior (opcional)
             
         Returns:
             List[Week]: Lista de registros de abastecimento do usuário
         """
-        return await self.repository.get_by_user_id(user_id)
+        return await self.repository.get_by_user_id(user_id, limit=limit, after=after)
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from freeroad.domain.repositories.week_repository import WeekKey, WeekRepository
+from freeroad.domain.value_objects.week_change import WeekChange
+
+
+class GetWeekChangesUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    async def execute(
+        self, user_id: str, after: Optional[WeekKey] = None, limit: Optional[int] = None
+    ) -> List[WeekChange]:
+        """
+        Obtém as alterações nos registros de um usuário, para sincronização
+        incremental.
+
+        Args:
+            user_id: ID do usuário
+            after: Chave (changed_at, id) da última alteração já recebida (opcional)
+            limit: Quantidade máxima de alterações (opcional)
+
+        Returns:
+            List[WeekChange]: Registros criados ou alterados e remoções, do mais antigo ao mais recente
+        """
+        return await self.repository.get_changes(user_id, after=after, limit=limit)
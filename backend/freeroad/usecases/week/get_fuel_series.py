@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import List, Optional
+
+from freeroad.domain.repositories.week_repository import WeekRepository
+from freeroad.domain.value_objects.fuel_series import FuelSeriesPoint
+
+
+class GetFuelSeriesUseCase:
+    def __init__(self, repository: WeekRepository):
+        self.repository = repository
+
+    async def execute(
+        self,
+        user_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[FuelSeriesPoint]:
+        """
+        Retorna a série de consumo de um usuário agrupada por semana ou mês.
+
+        Args:
+            user_id: ID do usuário
+            period: "week" ou "month"
+            start: Início do intervalo (inclusivo), opcional
+            end: Fim do intervalo (exclusivo), opcional
+
+        Returns:
+            List[FuelSeriesPoint]: Um ponto por período com registros, do mais antigo ao mais recente
+        """
+        return await self.repository.get_series(user_id, period, start, end)
@@ -200,3 +200,142 @@ async def test_get_current_user_no_token(client: AsyncClient):
     
     assert response.status_code in [401, 403]  # Pode ser 401 (Unauthorized) ou 403 (Forbidden)
     assert "not authenticated" in response.json()["detail"].lower() or "forbidden" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_login_returns_signed_token(client: AsyncClient):
+    """Testa se o login emite um token assinado com as claims do usuário"""
+    from freeroad.api.auth import decode_access_token
+
+    email = "signed_token@example.com"
+    password = "SignedToken123!"
+
+    register_response = await client.post("/users/register", json={
+        "name": "Signed Token User",
+        "email": email,
+        "password": password,
+        "role": "user"
+    })
+    user_id = register_response.json()["user"]["id"]
+
+    response = await client.post("/users/login", json={
+        "email": email,
+        "password": password
+    })
+
+    token = response.json()["access_token"]
+    assert token != user_id
+
+    claims = decode_access_token(token)
+    assert claims is not None
+    assert claims["sub"] == user_id
+    assert claims["email"] == email
+    assert "exp" in claims
+
+
+@pytest.mark.asyncio
+async def test_raw_user_id_is_not_accepted_as_token(client: AsyncClient):
+    """Testa se o ID do usuário não é mais aceito como token de acesso"""
+    register_response = await client.post("/users/register", json={
+        "name": "Raw Id User",
+        "email": "raw_id@example.com",
+        "password": "RawIdPass123!",
+        "role": "user"
+    })
+    user_id = register_response.json()["user"]["id"]
+
+    response = await client.get("/users/me", headers={"Authorization": f"Bearer {user_id}"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_rejected(client: AsyncClient):
+    """Testa se um token expirado é rejeitado"""
+    from datetime import timedelta
+    from freeroad.api.auth import create_access_token
+
+    token = create_access_token({"sub": "any-user"}, expires_delta=timedelta(seconds=-1))
+
+    response = await client.get("/weeks/", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_is_served_from_cache(client: AsyncClient):
+    """Testa se requisições repetidas a /users/me usam o cache de usuários"""
+    from freeroad.api.deps import principal_cache
+
+    email = "cached_user@example.com"
+    password = "CachedUser123!"
+
+    await client.post("/users/register", json={
+        "name": "Cached User",
+        "email": email,
+        "password": password,
+        "role": "user"
+    })
+    login_response = await client.post("/users/login", json={
+        "email": email,
+        "password": password
+    })
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    first = await client.get("/users/me", headers=headers)
+    hits_before = principal_cache.hits
+    second = await client.get("/users/me", headers=headers)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert principal_cache.hits == hits_before + 1
+
+
+@pytest.mark.asyncio
+async def test_login_is_rate_limited_per_email(client: AsyncClient):
+    """Testa se tentativas repetidas para o mesmo email recebem 429"""
+    from freeroad.api.deps import login_limiter
+
+    payload = {"email": "brute_force@example.com", "password": "WrongPassword123!"}
+    statuses = []
+    for _ in range(int(login_limiter.email_capacity) + 1):
+        response = await client.post("/users/login", json=payload)
+        statuses.append(response.status_code)
+
+    assert statuses[:-1] == [401] * int(login_limiter.email_capacity)
+    assert statuses[-1] == 429
+    assert "Retry-After" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_password_with_outdated_cost(client: AsyncClient, user_repository):
+    """Testa se o login refaz o hash da senha quando o custo do bcrypt muda"""
+    from freeroad.api.security import pwd_context, set_bcrypt_rounds
+    from freeroad.domain.value_objects.email_vo import Email
+
+    email = "rehash@example.com"
+    password = "RehashPass123!"
+    original_rounds = pwd_context.to_dict()["bcrypt__rounds"]
+
+    try:
+        set_bcrypt_rounds(4)
+        await client.post("/users/register", json={
+            "name": "Rehash User",
+            "email": email,
+            "password": password,
+            "role": "user"
+        })
+        stored = await user_repository.get_by_email(Email(email))
+        assert stored.password.value.startswith("$2b$04$")
+
+        set_bcrypt_rounds(5)
+        response = await client.post("/users/login", json={"email": email, "password": password})
+        assert response.status_code == 200
+
+        user_repository.session.expire_all()
+        stored = await user_repository.get_by_email(Email(email))
+        assert stored.password.value.startswith("$2b$05$")
+        assert stored.password.verify(password)
+    finally:
+        set_bcrypt_rounds(original_rounds)
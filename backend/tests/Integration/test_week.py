@@ -293,6 +293,32 @@ async def test_add_final_km_with_negative_value(authenticated_client):
     assert response.status_code == 400
     assert "negativa" in str(response.json()).lower()
 
+
+@pytest.mark.asyncio
+async def test_add_final_km_with_non_finite_or_huge_value(authenticated_client):
+    """Testa que nan, inf e valores acima da coluna viram 400 em final_km, não 500"""
+    create_response = await authenticated_client.post("/weeks/", json={
+        "title": "Abastecimento para Km Final Inválido",
+        "kmAtual": 11000.0,
+        "custo": 250.0,
+        "litrosAbastecidos": 45.0
+    })
+    week_id = create_response.json()["id"]
+
+    # NaN e Infinity são aceitos pelo parser JSON do FastAPI, mas o httpx não os serializa
+    for final_km in ("NaN", "Infinity", "1e17"):
+        response = await authenticated_client.put(
+            f"/weeks/{week_id}/final_km",
+            content=f'{{"final_km": {final_km}}}',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["details"]["field"] == "final_km"
+
+    week = (await authenticated_client.get(f"/weeks/{week_id}")).json()
+    assert week["kmFinal"] == 0.0
+
 @pytest.mark.asyncio
 async def test_delete_nonexistent_week(authenticated_client):
     """Testa a remoção de um registro inexistente"""
@@ -397,3 +423,479 @@ async def test_large_batch_of_weeks(authenticated_client, test_user):
     response_ids = [week["id"] for week in response.json()]
     for week_id in created_ids:
         assert week_id in response_ids
+
+
+@pytest.mark.asyncio
+async def test_get_weeks_by_user_id_keyset_pagination(authenticated_client, test_user):
+    """Testa a paginação por cursor em GET /weeks/user/{user_id}"""
+    created_ids = []
+    for i in range(5):
+        response = await authenticated_client.post("/weeks/", json={
+            "title": f"Abastecimento Paginado {i+1}",
+            "kmAtual": 20000.0 + i,
+            "custo": 100.0,
+            "litrosAbastecidos": 20.0
+        })
+        created_ids.append(response.json()["id"])
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client.get(f"/weeks/user/{test_user.id}", params=params)
+        assert response.status_code == 200
+        assert len(response.json()) <= 2
+        seen.extend(week["id"] for week in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 5
+    # Do mais recente para o mais antigo
+    assert seen == list(reversed(created_ids))
+
+
+@pytest.mark.asyncio
+async def test_get_all_weeks_invalid_cursor(authenticated_client):
+    """Testa se um cursor inválido retorna 400"""
+    response = await authenticated_client.get("/weeks/", params={"cursor": "nao-e-um-cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_week_analytics(authenticated_client):
+    """Testa os indicadores de consumo do usuário autenticado"""
+    create_response = await authenticated_client.post("/weeks/", json={
+        "title": "Abastecimento Analytics",
+        "kmAtual": 1000.0,
+        "custo": 200.0,
+        "litrosAbastecidos": 40.0
+    })
+    week_id = create_response.json()["id"]
+    await authenticated_client.put(f"/weeks/{week_id}/final_km", json={"final_km": 1500.0})
+
+    response = await authenticated_client.get("/weeks/analytics")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["media_eficiencia"] == 12.5
+    assert data["total_custo"] == 200.0
+    assert data["total_distancia"] == 500.0
+    assert data["total_litros"] == 40.0
+
+
+@pytest.mark.asyncio
+async def test_get_week_series(authenticated_client):
+    """Testa a série mensal e a validação do período"""
+    create_response = await authenticated_client.post("/weeks/", json={
+        "title": "Abastecimento Série",
+        "kmAtual": 1000.0,
+        "custo": 200.0,
+        "litrosAbastecidos": 40.0
+    })
+    week_id = create_response.json()["id"]
+    await authenticated_client.put(f"/weeks/{week_id}/final_km", json={"final_km": 1500.0})
+
+    response = await authenticated_client.get("/weeks/series", params={"period": "month"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["periodo"].endswith("-01T00:00:00")
+    assert data[0]["registros"] == 1
+    assert data[0]["media_eficiencia"] == 12.5
+    assert data[0]["total_distancia"] == 500.0
+
+    invalid = await authenticated_client.get("/weeks/series", params={"period": "year"})
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_weeks_bulk(authenticated_client):
+    """Testa a criação em lote com itens válidos e inválidos"""
+    items = [
+        {"title": "Lote 1", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 20.0},
+        {"title": "Lote 2", "kmAtual": 2000.0, "custo": 150.0, "litrosAbastecidos": 0},
+        {"title": "Lote 3", "kmAtual": "abc", "custo": 150.0, "litrosAbastecidos": 30.0},
+        {"title": "Lote 4", "kmAtual": 3000.0, "kmFinal": 3400.0, "eficiencia": 10.0, "custo": 200.0, "litrosAbastecidos": 40.0},
+    ]
+
+    response = await authenticated_client.post("/weeks/bulk", json=items)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 2
+    assert len(data["ids"]) == 2
+    assert [(e["index"], e["field"]) for e in data["errors"]] == [(1, "litrosAbastecidos"), (2, "kmAtual")]
+
+    created = await authenticated_client.get(f"/weeks/{data['ids'][1]}")
+    assert created.json()["kmFinal"] == 3400.0
+
+    analytics = (await authenticated_client.get("/weeks/analytics")).json()
+    assert analytics["total_custo"] == 300.0
+    assert analytics["total_distancia"] == 400.0
+
+
+@pytest.mark.asyncio
+async def test_create_weeks_bulk_without_valid_items(authenticated_client):
+    """Testa que um lote sem itens válidos retorna 400 com os erros"""
+    response = await authenticated_client.post("/weeks/bulk", json=[{"title": "Sem dados"}])
+
+    assert response.status_code == 400
+    assert response.json()["details"]["errors"][0]["index"] == 0
+
+
+@pytest.mark.asyncio
+async def test_create_weeks_bulk_rejects_values_out_of_column_range(authenticated_client):
+    """Testa que valores que não cabem nas colunas inteiras viram erro do item, sem derrubar o lote"""
+    items = [
+        {"title": "Fora 1", "kmAtual": 1e17, "custo": 100.0, "litrosAbastecidos": 20.0},
+        {"title": "Fora 2", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 1e10},
+        {"title": "Fora 3", "kmAtual": 1000.0, "custo": 1e11, "litrosAbastecidos": 20.0},
+        {"title": "Caminhão-tanque", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 3000000.0},
+    ]
+
+    response = await authenticated_client.post("/weeks/bulk", json=items)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 1
+    assert [(e["index"], e["field"]) for e in data["errors"]] == [(0, "kmAtual"), (1, "litrosAbastecidos"), (2, "custo")]
+
+    created = await authenticated_client.get(f"/weeks/{data['ids'][0]}")
+    assert created.json()["litrosAbastecidos"] == 3000000.0
+
+
+@pytest.mark.asyncio
+async def test_add_final_km_batch(authenticated_client):
+    """Testa a atualização de quilometragem final em lote com resultado por item"""
+    items = [
+        {"title": f"Lote Km {i}", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 40.0}
+        for i in range(2)
+    ]
+    ids = (await authenticated_client.post("/weeks/bulk", json=items)).json()["ids"]
+
+    response = await authenticated_client.put("/weeks/final_km", json=[
+        {"week_id": ids[0], "final_km": 1500.0},
+        {"week_id": ids[1], "final_km": 900.0},
+        {"week_id": str(uuid.uuid4()), "final_km": 1200.0},
+        {"week_id": ids[0], "final_km": 1600.0},
+        {"week_id": ids[1], "final_km": -1.0},
+    ])
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["updated"] == 1
+    assert [(r["status"], r["field"]) for r in data["results"]] == [
+        ("updated", None), ("invalid", "final_km"), ("not_found", None), ("invalid", "week_id"), ("invalid", "final_km"),
+    ]
+    assert data["results"][0]["week"]["eficiencia"] == 12.5
+
+    analytics = (await authenticated_client.get("/weeks/analytics")).json()
+    assert analytics["total_distancia"] == 500.0
+
+
+@pytest.mark.asyncio
+async def test_add_final_km_batch_rejects_non_finite_items(authenticated_client):
+    """Testa que um final_km NaN no lote vira resultado invalid do item, sem 500 nem afetar os demais"""
+    items = [
+        {"title": f"Lote NaN {i}", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 40.0}
+        for i in range(3)
+    ]
+    ids = (await authenticated_client.post("/weeks/bulk", json=items)).json()["ids"]
+
+    # NaN e Infinity são aceitos pelo parser JSON do FastAPI, mas o httpx não os serializa
+    body = (
+        f'[{{"week_id": "{ids[0]}", "final_km": 1500.0}}, {{"week_id": "{ids[1]}", "final_km": NaN}},'
+        f' {{"week_id": "{ids[2]}", "final_km": 1e17}}]'
+    )
+    response = await authenticated_client.put(
+        "/weeks/final_km", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["updated"] == 1
+    assert [(r["status"], r["field"]) for r in data["results"]] == [
+        ("updated", None), ("invalid", "final_km"), ("invalid", "final_km"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_weeks_by_user_id_etag(authenticated_client, test_user):
+    """Testa o ETag da listagem: 304 enquanto nada muda, 200 com novo ETag após uma escrita"""
+    create_response = await authenticated_client.post("/weeks/", json={
+        "title": "Abastecimento ETag",
+        "kmAtual": 1000.0,
+        "custo": 200.0,
+        "litrosAbastecidos": 40.0
+    })
+    week_id = create_response.json()["id"]
+
+    first = await authenticated_client.get(f"/weeks/user/{test_user.id}")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+
+    cached = await authenticated_client.get(f"/weeks/user/{test_user.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    await authenticated_client.put(f"/weeks/{week_id}/final_km", json={"final_km": 1500.0})
+
+    changed = await authenticated_client.get(f"/weeks/user/{test_user.id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()[0]["kmFinal"] == 1500.0
+
+    analytics = await authenticated_client.get("/weeks/analytics", headers={"If-None-Match": changed.headers["etag"]})
+    assert analytics.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_week_cache_invalidated_by_writes(authenticated_client, test_user, monkeypatch):
+    """Testa as rotas com o cache em memória ligado: leituras em cache e escritas visíveis"""
+    from freeroad.api import deps
+    from freeroad.infra.repositories.cached_week_repository import WeekCacheStats
+    from freeroad.infra.week_cache import MemoryWeekCache
+
+    monkeypatch.setattr(deps, "week_cache", MemoryWeekCache(maxsize=100, ttl=60))
+    monkeypatch.setattr(deps, "week_cache_stats", WeekCacheStats())
+    item = {"title": "Cache", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 20.0}
+
+    week_id = (await authenticated_client.post("/weeks/", json=item)).json()["id"]
+    assert len((await authenticated_client.get(f"/weeks/user/{test_user.id}")).json()) == 1
+    assert len((await authenticated_client.get(f"/weeks/user/{test_user.id}")).json()) == 1
+
+    await authenticated_client.post("/weeks/", json=item)
+    assert len((await authenticated_client.get(f"/weeks/user/{test_user.id}")).json()) == 2
+
+    await authenticated_client.get(f"/weeks/{week_id}")
+    await authenticated_client.put(f"/weeks/{week_id}/final_km", json={"final_km": 1400.0})
+    assert (await authenticated_client.get(f"/weeks/{week_id}")).json()["kmFinal"] == 1400.0
+
+    stats = (await authenticated_client.get("/debug/week-cache")).json()
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"]) == (1, 4)
+
+
+@pytest.mark.asyncio
+async def test_import_weeks_csv(authenticated_client, monkeypatch):
+    """Testa a importação de CSV com progresso por bloco e erros por linha"""
+    import json
+    from freeroad.api.routes import week_route
+
+    monkeypatch.setattr(week_route, "WEEK_IMPORT_CHUNK_SIZE", 2)
+    csv_body = (
+        "title,kmAtual,kmFinal,custo,litrosAbastecidos,created_at\n"
+        "Recibo 1,1000,1400,100,40,2025-01-10T08:00:00\n"
+        "Recibo 2,2000,,50,0,\n"
+        "Recibo 3,3000,,60,20,ontem\n"
+        "Recibo 4,4000,,70,20,\n"
+        "Recibo 5,5000,,80,20,\n"
+    )
+
+    response = await authenticated_client.post(
+        "/weeks/import/csv", content=csv_body.encode(), headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [(e["event"], e.get("line")) for e in events if e["event"] == "error"] == [("error", 3), ("error", 4)]
+    assert [e["created"] for e in events if e["event"] == "progress"] == [2]
+    assert events[-1] == {"event": "summary", "processed": 5, "created": 3, "errors": 2, "aborted": False}
+
+    series = (await authenticated_client.get("/weeks/series", params={"period": "month", "end": "2025-02-01T00:00:00"})).json()
+    assert [(p["periodo"], p["total_distancia"]) for p in series] == [("2025-01-01T00:00:00", 400.0)]
+    assert (await authenticated_client.get("/weeks/analytics")).json()["total_custo"] == 250.0
+
+
+@pytest.mark.asyncio
+async def test_import_weeks_csv_missing_columns(authenticated_client):
+    """Testa que um cabeçalho sem colunas obrigatórias interrompe a importação"""
+    import json
+
+    response = await authenticated_client.post("/weeks/import/csv", content=b"title,custo\nA,10\n")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0]["event"] == "error"
+    assert events[-1]["aborted"] is True
+    assert events[-1]["created"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_weeks(authenticated_client, monkeypatch, export_format):
+    """Testa a exportação em streaming (vários lotes) nos dois formatos"""
+    import csv
+    import io
+    import json
+    from freeroad.api.routes import week_route
+
+    monkeypatch.setattr(week_route, "WEEK_EXPORT_BATCH_SIZE", 2)
+    items = [
+        {"title": f"Export {i}", "kmAtual": 1000.0 + i, "custo": 100.0, "litrosAbastecidos": 20.0}
+        for i in range(5)
+    ]
+    ids = (await authenticated_client.post("/weeks/bulk", json=items)).json()["ids"]
+
+    response = await authenticated_client.get("/weeks/export", params={"format": export_format})
+
+    assert response.status_code == 200
+    assert 'weeks-' in response.headers["content-disposition"]
+    if export_format == "ndjson":
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+    else:
+        assert response.headers["content-type"].startswith("text/csv")
+        records = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert sorted(r["id"] for r in records) == sorted(ids)
+    assert float(records[0]["kmAtual"]) == 1000.0
+    assert records[0]["created_at"] <= records[-1]["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_weeks_responses_compression(authenticated_client, test_user):
+    """Testa a compressão negociada das listagens e a exclusão da exportação em streaming"""
+    items = [
+        {"title": f"Compressão {i}", "kmAtual": 1000.0 + i, "custo": 100.0, "litrosAbastecidos": 20.0}
+        for i in range(30)
+    ]
+    await authenticated_client.post("/weeks/bulk", json=items)
+
+    for encoding in ("br", "gzip"):
+        response = await authenticated_client.get(f"/weeks/user/{test_user.id}", headers={"Accept-Encoding": encoding})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["etag"].startswith('W/"')
+        assert len(response.json()) == 30
+
+    plain = await authenticated_client.get(f"/weeks/user/{test_user.id}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == response.json()
+
+    export = await authenticated_client.get("/weeks/export", headers={"Accept-Encoding": "gzip"})
+    assert export.status_code == 200
+    assert "content-encoding" not in export.headers
+    assert len(export.text.splitlines()) == 30
+
+
+@pytest.mark.asyncio
+async def test_create_week_idempotency_key(authenticated_client, test_user):
+    """Testa que repetições com a mesma Idempotency-Key reenviam a resposta sem criar outro registro"""
+    payload = {"title": "Idempotente", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 20.0}
+    headers = {"Idempotency-Key": "retry-1"}
+
+    first = await authenticated_client.post("/weeks/", json=payload, headers=headers)
+    retry = await authenticated_client.post("/weeks/", json=payload, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.content == first.content
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+
+    other = await authenticated_client.post("/weeks/", json={**payload, "custo": 120.0}, headers=headers)
+    assert other.status_code == 422
+
+    fresh = await authenticated_client.post("/weeks/", json=payload, headers={"Idempotency-Key": "retry-2"})
+    assert fresh.status_code == 201
+    assert fresh.json()["id"] != first.json()["id"]
+
+    weeks = (await authenticated_client.get(f"/weeks/user/{test_user.id}")).json()
+    assert sorted(w["id"] for w in weeks) == sorted([first.json()["id"], fresh.json()["id"]])
+
+
+@pytest.mark.asyncio
+async def test_create_week_idempotency_key_concurrent(authenticated_client, test_user):
+    """Testa que requisições simultâneas com a mesma chave criam um único registro"""
+    import asyncio
+
+    payload = {"title": "Concorrente", "kmAtual": 1000.0, "custo": 100.0, "litrosAbastecidos": 20.0}
+    responses = await asyncio.gather(*(
+        authenticated_client.post("/weeks/", json=payload, headers={"Idempotency-Key": "same"})
+        for _ in range(3)
+    ))
+
+    assert [r.status_code for r in responses] == [201, 201, 201]
+    assert len({r.content for r in responses}) == 1
+    assert len((await authenticated_client.get(f"/weeks/user/{test_user.id}")).json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_idempotency_repository_claim_and_expiry(db_session, test_user):
+    """Testa a reserva da chave, a resposta guardada e a reutilização após expirar"""
+    from freeroad.infra.repositories.sqlalchemy.sqlalchemy_idempotency_repository import SQLAlchemyIdempotencyRepository
+
+    repo = SQLAlchemyIdempotencyRepository(db_session)
+    assert await repo.claim(test_user.id, "k", "fp", "w1", ttl=60)
+    await db_session.commit()
+    assert not await repo.claim(test_user.id, "k", "fp", "w2", ttl=60)
+
+    pending = await repo.wait(test_user.id, "k", timeout=0.05)
+    assert (pending.week_id, pending.status_code) == ("w1", None)
+
+    await repo.complete(test_user.id, "k", 201, b'{"id":"w1"}')
+    done = await repo.wait(test_user.id, "k", timeout=1)
+    assert (done.status_code, done.response_body) == (201, b'{"id":"w1"}')
+
+    assert await repo.claim(test_user.id, "expired", "fp", "w3", ttl=-1)
+    await db_session.commit()
+    assert await repo.get(test_user.id, "expired") is None
+    assert await repo.claim(test_user.id, "expired", "fp", "w4", ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_get_week_changes(authenticated_client):
+    """Testa a sincronização incremental: primeira carga paginada, alterações, remoções e cursores recusados"""
+    from freeroad.api.pagination import encode_changes_cursor
+
+    async def sync(since=None):
+        changes = []
+        while True:
+            params = {"limit": 1, **({"since": since} if since else {})}
+            response = await authenticated_client.get("/weeks/changes", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            changes.extend(page["changes"])
+            since = page["cursor"]
+            if not page["has_more"]:
+                return changes, since
+
+    ids = []
+    for km in (1000.0, 2000.0):
+        response = await authenticated_client.post("/weeks/", json={
+            "title": "Sincronização", "kmAtual": km, "custo": 100.0, "litrosAbastecidos": 20.0
+        })
+        ids.append(response.json()["id"])
+
+    changes, cursor = await sync()
+    local = {c["id"]: c["week"] for c in changes}
+    assert all(not c["deleted"] for c in changes)
+    assert local[ids[0]]["kmAtual"] == 1000.0 and ids[1] in local
+
+    assert (await authenticated_client.put(f"/weeks/{ids[0]}/final_km", json={"final_km": 1400.0})).status_code == 200
+    assert (await authenticated_client.delete(f"/weeks/{ids[1]}")).status_code == 204
+
+    changes, _ = await sync(cursor)
+    for change in changes:
+        if change["deleted"]:
+            assert change["week"] is None
+            local.pop(change["id"], None)
+        else:
+            local[change["id"]] = change["week"]
+    assert local[ids[0]]["kmFinal"] == 1400.0
+    assert ids[1] not in local
+
+    assert (await authenticated_client.get("/weeks/changes", params={"since": "nao-e-cursor"})).status_code == 400
+    expired = encode_changes_cursor((datetime(2000, 1, 1), ""), None)
+    assert (await authenticated_client.get("/weeks/changes", params={"since": expired})).status_code == 410
@@ -0,0 +1,83 @@
+import gzip
+
+import brotli
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from freeroad.api.compression import CompressionMiddleware, negotiate_encoding
+
+PAYLOAD = [{"id": i, "title": f"Registro {i}", "custo": 100.0} for i in range(200)]
+
+
+async def stream(request):
+    async def chunks():
+        for _ in range(3):
+            yield b'{"id": 1, "title": "Registro"}\n' * 100
+
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+app = CompressionMiddleware(
+    Starlette(
+        routes=[
+            Route("/list", lambda request: JSONResponse(PAYLOAD)),
+            Route("/small", lambda request: JSONResponse({"ok": True})),
+            Route("/binary", lambda request: Response(b"\0" * 4096, media_type="application/octet-stream")),
+            Route("/stream", stream),
+        ]
+    ),
+    minimum_size=500,
+)
+
+
+async def raw_get(path: str, accept_encoding: str):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            # Bytes como trafegaram, sem a descompressão automática do httpx
+            return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding, decompress", [("br", brotli.decompress), ("gzip", gzip.decompress)])
+async def test_compresses_complete_responses(encoding, decompress):
+    response, body = await raw_get("/list", encoding)
+    plain, plain_body = await raw_get("/list", "identity")
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert decompress(body) == plain_body
+    assert len(body) < len(plain_body) / 4
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/small", "/binary", "/stream"])
+async def test_skips_small_binary_and_streaming_responses(path):
+    response, body = await raw_get(path, "br, gzip")
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    if path == "/stream":
+        assert body.count(b"\n") == 300
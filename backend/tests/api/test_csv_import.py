@@ -0,0 +1,68 @@
+import pytest
+from freeroad.api.csv_import import CsvImportError, iter_csv_records, map_header, record_to_item
+
+CSV = (
+    'title,kmAtual,custo,litrosAbastecidos,observacao\r\n'
+    '"Posto, centro",1000,150.5,30\r\n'
+    '\r\n'
+    '"Nota ""longa""\ncom quebra",2000,,40\n'
+    'Último,3000,120,25'
+).encode()
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 7, 4096])
+async def test_iter_csv_records_is_independent_of_chunk_size(size):
+    records = [record async for record in iter_csv_records(chunked(CSV, size))]
+
+    assert records == [
+        (1, ["title", "kmAtual", "custo", "litrosAbastecidos", "observacao"]),
+        (2, ["Posto, centro", "1000", "150.5", "30"]),
+        (4, ['Nota "longa"\ncom quebra', "2000", "", "40"]),
+        (6, ["Último", "3000", "120", "25"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_records_rejects_unclosed_quote():
+    with pytest.raises(CsvImportError) as error:
+        [record async for record in iter_csv_records(chunked(b'title\n"aberto\n', 4))]
+    assert error.value.line == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 4096])
+async def test_iter_csv_records_keeps_blank_lines_in_quotes_and_line_numbers(size):
+    data = 'title,kmAtual\n\n"Com\n\nlinha em branco",1000\n\nDepois,2000\n'.encode()
+
+    records = [record async for record in iter_csv_records(chunked(data, size))]
+
+    assert records == [
+        (1, ["title", "kmAtual"]),
+        (3, ["Com\n\nlinha em branco", "1000"]),
+        (7, ["Depois", "2000"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_records_rejects_long_line_without_newline(monkeypatch):
+    monkeypatch.setattr("freeroad.api.csv_import.MAX_RECORD_CHARS", 16)
+
+    with pytest.raises(CsvImportError) as error:
+        [record async for record in iter_csv_records(chunked(b"title\n" + b"x" * 64, 8))]
+    assert error.value.line == 2
+
+
+def test_map_header_and_record_to_item():
+    fields = map_header(["Title", "km_atual", "custo", "litros_abastecidos", "observacao"])
+
+    assert fields == ["title", "kmAtual", "custo", "litrosAbastecidos", None]
+    assert record_to_item(fields, ["A", " 10 ", "", "5", "x"]) == {"title": "A", "kmAtual": "10", "litrosAbastecidos": "5"}
+
+    with pytest.raises(CsvImportError):
+        map_header(["title", "custo"])
@@ -0,0 +1,18 @@
+from freeroad.api.etag import etag_matches, version_etag
+
+
+def test_version_etag_is_weak_and_changes_with_version():
+    assert version_etag("u1", 3) == 'W/"u1.3"'
+    assert version_etag("u1", 3) != version_etag("u1", 4)
+
+
+def test_etag_matches_weak_comparison():
+    etag = version_etag("u1", 3)
+
+    assert etag_matches('W/"u1.3"', etag)
+    assert etag_matches('"u1.3"', etag)
+    assert etag_matches('W/"u1.2", W/"u1.3"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"u1.2"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
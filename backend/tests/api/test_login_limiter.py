@@ -0,0 +1,83 @@
+import pytest
+from freeroad.api.login_limiter import LoginLimiter, LoginRateLimited
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_limiter(clock, **kwargs):
+    params = dict(
+        email_capacity=2,
+        email_rate=1.0,
+        client_capacity=3,
+        client_rate=1.0,
+        max_concurrent=1,
+        clock=clock,
+    )
+    params.update(kwargs)
+    return LoginLimiter(**params)
+
+
+def test_email_bucket_rejects_after_burst():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    limiter.check("user@example.com", "1.1.1.1")
+    limiter.check("USER@example.com", "2.2.2.2")
+
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.check("user@example.com", "3.3.3.3")
+
+    assert exc.value.reason == "email"
+    assert exc.value.retry_after == pytest.approx(1.0)
+    assert limiter.stats()["rejected_email"] == 1
+
+
+def test_client_bucket_rejects_after_burst():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    for i in range(3):
+        limiter.check(f"user{i}@example.com", "1.1.1.1")
+
+    with pytest.raises(LoginRateLimited) as exc:
+        limiter.check("other@example.com", "1.1.1.1")
+
+    assert exc.value.reason == "client"
+    assert limiter.stats()["rejected_client"] == 1
+
+
+def test_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    limiter.check("user@example.com", "1.1.1.1")
+    limiter.check("user@example.com", "1.1.1.1")
+    with pytest.raises(LoginRateLimited):
+        limiter.check("user@example.com", "1.1.1.1")
+
+    clock.now = 1.0
+    limiter.check("user@example.com", "1.1.1.1")
+
+
+def test_verification_slot_caps_concurrency():
+    limiter = make_limiter(FakeClock())
+
+    with limiter.verification_slot():
+        with pytest.raises(LoginRateLimited) as exc:
+            with limiter.verification_slot():
+                pass
+        assert exc.value.reason == "concurrency"
+
+    with limiter.verification_slot():
+        pass
+
+    stats = limiter.stats()
+    assert stats["admitted"] == 2
+    assert stats["rejected_concurrency"] == 1
+    assert stats["in_flight"] == 0
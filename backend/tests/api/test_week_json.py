@@ -0,0 +1,31 @@
+import json
+from datetime import datetime
+from typing import List
+
+from pydantic import TypeAdapter
+
+from freeroad.api.schemas.week_schema import WeekResponse
+from freeroad.api.week_json import WeekListResponse
+from freeroad.domain.entities.week import Week
+
+
+def make_weeks() -> List[Week]:
+    now = datetime(2025, 1, 1, 12, 30)
+    return [
+        # Como vem do repositório SQL (floats) e como é criado pela API (strings)
+        Week("a", "u1", "Recibo", 1000.0, 1400.5, 250.9, 12.35, 32.4, now, now),
+        Week("b", "u1", "Posto ção", "2000", "0.0", "99.99", "0", "40", now, now),
+        Week("c", "u2", "Sem km", 3000.0, None, 10.0, None, 5.0, now, now),
+    ]
+
+
+def test_week_list_response_matches_response_model():
+    weeks = make_weeks()
+    expected = TypeAdapter(List[WeekResponse]).dump_json(
+        TypeAdapter(List[WeekResponse]).validate_python(weeks, from_attributes=True)
+    )
+
+    body = WeekListResponse(weeks).body
+
+    assert json.loads(body) == json.loads(expected)
+    assert list(json.loads(body)[0]) == list(WeekResponse.model_fields)
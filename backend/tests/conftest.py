@@ -80,6 +80,9 @@ async def setup_engine():
 
     yield engine, async_session
 
+    # Fecha as conexões do pool: uma engine por teste, senão a suíte esgota max_connections
+    await engine.dispose()
+
     # Teardown: drop tables
     # async with engine.begin() as conn:
     #     await conn.run_sync(Base.metadata.drop_all)
@@ -103,6 +106,8 @@ async def client(setup_engine):
             yield session
 
     app.dependency_overrides[deps.get_db] = override_get_db
+    deps.principal_cache.clear()
+    deps.login_limiter.reset()
 
     async with LifespanManager(app):
         transport = ASGITransport(app=app)
@@ -31,8 +31,29 @@ def test_create_week():
     assert week.id == "456"
     assert week.user_id == "123"
     assert week.title == "teste week"
-    assert week.kmAtual == "1500"
-    assert week.kmFinal == "1700"
-    assert week.custo == "120"
-    assert week.eficiencia == ""
-    assert week.litrosAbastecidos == "9"
+    # Os campos numéricos são convertidos para float na construção
+    assert week.kmAtual == 1500.0
+    assert week.kmFinal == 1700.0
+    assert week.custo == 120.0
+    assert week.eficiencia == 0.0
+    assert week.litrosAbastecidos == 9.0
+
+
+def test_week_numeric_fields_are_floats():
+    from decimal import Decimal
+
+    week = Week("1", "u1", "banco", Decimal("1000.50"), Decimal("1400.00"), Decimal("250.90"), None, Decimal("32.400"))
+
+    assert [type(v) for v in (week.kmAtual, week.kmFinal, week.custo, week.eficiencia, week.litrosAbastecidos)] == [float] * 5
+    assert (week.kmAtual, week.eficiencia) == (1000.5, 0.0)
+    assert week.kmFinal - week.kmAtual == 399.5
+
+
+def test_entities_use_slots():
+    week = Week("1", "u1", "teste", 1, 0, 1, 0, 1)
+    user = User(id="1", name="Teste", email=Email.trusted("a@b.com"), password=Password("x", hashed=True), role="user")
+
+    for entity in (week, user):
+        assert not hasattr(entity, "__dict__")
+        with pytest.raises(AttributeError):
+            entity.campo_inexistente = 1
@@ -13,6 +13,12 @@ def test_invalid_email():
         Email("invalid-email")
 
 
+def test_trusted_email_nao_revalida():
+    email = Email.trusted("user@example.com")
+    assert email == Email("user@example.com")
+    assert email.value == "user@example.com"
+
+
 @pytest.mark.parametrize(
     "senha_invalida",
     [
@@ -48,4 +54,19 @@ def test_password_invalida_nao_verifica():
 def test_str_password_exibe_hash():
     senha = "Senha@123!"
     password = Password(senha)
-    assert str(password) == password._hashed
\ No newline at end of file
+    assert str(password) == password._hashed
+
+# Teste do caminho assíncrono (hash e verificação fora do event loop)
+@pytest.mark.asyncio
+async def test_password_create_async_gera_hash_verificavel():
+    senha = "Senha@123!"
+    password = await Password.create(senha)
+    assert password.value != senha
+    assert await password.verify_async(senha)
+    assert not await password.verify_async("Errada456@")
+
+
+@pytest.mark.asyncio
+async def test_password_create_async_valida_senha():
+    with pytest.raises(PasswordValidationError):
+        await Password.create("curta")
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from freeroad.domain.entities.week import Week
+from freeroad.infra.repositories.cached_week_repository import CachedWeekRepository
+from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
+from freeroad.infra.week_cache import MemcachedWeekCache, MemoryWeekCache
+
+
+class FakeMemcached:
+    """Servidor local com o subconjunto do protocolo do memcached usado pelo backend."""
+
+    def __init__(self):
+        self.data = {}
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                command, key, *args = line.decode().split()
+                if command == "get":
+                    if key in self.data:
+                        value = self.data[key]
+                        writer.write(b"VALUE %s 0 %d\r\n%s\r\n" % (key.encode(), len(value), value))
+                    writer.write(b"END\r\n")
+                elif command in ("set", "add"):
+                    value = (await reader.readexactly(int(args[2]) + 2))[:-2]
+                    if command == "add" and key in self.data:
+                        writer.write(b"NOT_STORED\r\n")
+                    else:
+                        self.data[key] = value
+                        writer.write(b"STORED\r\n")
+                elif command == "incr":
+                    if key in self.data:
+                        self.data[key] = str(int(self.data[key]) + int(args[0])).encode()
+                        writer.write(self.data[key] + b"\r\n")
+                    else:
+                        writer.write(b"NOT_FOUND\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest_asyncio.fixture(params=["memory", "memcached"])
+async def backend(request):
+    if request.param == "memory":
+        yield MemoryWeekCache(maxsize=100, ttl=60)
+        return
+    server = FakeMemcached()
+    port = await server.start()
+    cache = MemcachedWeekCache("127.0.0.1", port, ttl=60)
+    yield cache
+    await cache.close()
+    await server.stop()
+
+
+def make_week(week_id: str, user_id: str = "u1") -> Week:
+    created_at = datetime(2025, 1, 1) + timedelta(minutes=int(week_id[1:]))
+    return Week(
+        id=week_id,
+        user_id=user_id,
+        title=f"Registro {week_id}",
+        kmAtual="1000",
+        kmFinal="0",
+        custo="100",
+        eficiencia="0",
+        litrosAbastecidos="20",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_cache(backend):
+    inner = InMemoryWeekRepository()
+    clock = FakeClock()
+    repo = CachedWeekRepository(inner, backend, clock=clock)
+    await repo.create(make_week("w1"))
+    await repo.create(make_week("w2", user_id="u2"))
+
+    first = await repo.get_by_user_id("u1")
+    clock.now += 5
+    second = await repo.get_by_user_id("u1")
+    assert [w.id for w in second] == [w.id for w in first] == ["w1"]
+    assert second[0].created_at == first[0].created_at
+    assert (await repo.get_by_id("w2")).user_id == "u2"
+    assert len(await repo.get_all(limit=10)) == 2
+
+    stats = repo.stats.snapshot()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert stats["max_hit_age_seconds"] == 5
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_affected_queries(backend):
+    inner = InMemoryWeekRepository()
+    repo = CachedWeekRepository(inner, backend)
+    await repo.create(make_week("w1"))
+    await repo.get_by_id("w1")
+    await repo.get_by_user_id("u1")
+    await repo.get_by_user_id("u2")
+
+    await repo.add_final_km("w1", 1400.0)
+    assert float((await repo.get_by_id("w1")).eficiencia) == 20.0
+    await repo.create(make_week("w2"))
+    assert [w.id for w in await repo.get_by_user_id("u1")] == ["w2", "w1"]
+    await repo.get_by_user_id("u2")
+    assert repo.stats.hits == 1  # só a listagem de u2 não foi afetada
+
+    await repo.delete("w1")
+    assert await repo.get_by_id("w1") is None
+    assert [w.id for w in await repo.get_by_user_id("u1")] == ["w2"]
+
+
+@pytest.mark.asyncio
+async def test_unreachable_memcached_falls_back_to_repository():
+    server = FakeMemcached()
+    port = await server.start()
+    await server.stop()
+    backend = MemcachedWeekCache("127.0.0.1", port, ttl=60)
+    repo = CachedWeekRepository(InMemoryWeekRepository(), backend)
+
+    await repo.create(make_week("w1"))
+
+    assert [w.id for w in await repo.get_by_user_id("u1")] == ["w1"]
+    assert backend.stats()["errors"] > 0
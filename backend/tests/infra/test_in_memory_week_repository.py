@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime, timedelta
+from freeroad.domain.entities.week import Week
+from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
+
+
+def make_week(week_id: str, user_id: str, created_at: datetime) -> Week:
+    return Week(
+        id=week_id,
+        user_id=user_id,
+        title=f"Registro {week_id}",
+        kmAtual="1000",
+        kmFinal="0",
+        custo="100",
+        eficiencia="0",
+        litrosAbastecidos="20",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_by_user_id_keyset_pagination():
+    repo = InMemoryWeekRepository()
+    base = datetime(2025, 1, 1)
+    # "b" e "c" têm o mesmo created_at: o id desempata
+    for week_id, offset in [("a", 0), ("b", 1), ("c", 1), ("d", 2)]:
+        await repo.create(make_week(week_id, "user-1", base + timedelta(days=offset)))
+    await repo.create(make_week("outro", "user-2", base))
+
+    first = await repo.get_by_user_id("user-1", limit=2)
+    assert [w.id for w in first] == ["d", "c"]
+
+    last = first[-1]
+    second = await repo.get_by_user_id("user-1", limit=2, after=(last.created_at, last.id))
+    assert [w.id for w in second] == ["b", "a"]
+
+    assert await repo.get_by_user_id("user-1", after=(base, "a")) == []
+
+
+@pytest.mark.asyncio
+async def test_get_all_is_ordered_newest_first():
+    repo = InMemoryWeekRepository()
+    base = datetime(2025, 1, 1)
+    await repo.create(make_week("antigo", "user-1", base))
+    await repo.create(make_week("novo", "user-2", base + timedelta(hours=1)))
+
+    assert [w.id for w in await repo.get_all()] == ["novo", "antigo"]
+
+
+@pytest.mark.asyncio
+async def test_get_series_buckets_like_date_trunc():
+    repo = InMemoryWeekRepository()
+    # Domingo 2025-03-02 pertence à semana de segunda 2025-02-24; segunda 03-03 abre outra.
+    for week_id, created_at in [
+        ("dom", datetime(2025, 3, 2, 23, 59)),
+        ("seg", datetime(2025, 3, 3, 0, 0)),
+        ("fev", datetime(2025, 2, 24, 8, 0)),
+        ("antigo", datetime(1969, 12, 31, 12, 0)),
+    ]:
+        await repo.create(make_week(week_id, "user-1", created_at))
+
+    weekly = await repo.get_series("user-1", "week")
+    assert [(p.periodo, p.registros) for p in weekly] == [
+        (datetime(1969, 12, 29), 1),
+        (datetime(2025, 2, 24), 2),
+        (datetime(2025, 3, 3), 1),
+    ]
+
+    monthly = await repo.get_series("user-1", "month", start=datetime(2025, 1, 1))
+    assert [(p.periodo, p.registros, p.total_custo) for p in monthly] == [
+        (datetime(2025, 2, 1), 1, 100.0),
+        (datetime(2025, 3, 1), 2, 200.0),
+    ]
+
+    with pytest.raises(ValueError):
+        await repo.get_series("user-1", "year")
+
+
+@pytest.mark.asyncio
+async def test_add_final_km_validates_like_sql_repository():
+    from freeroad.domain.repositories.week_repository import InvalidFinalKmError
+
+    repo = InMemoryWeekRepository()
+    await repo.create(make_week("a", "user-1", datetime(2025, 1, 1)))
+
+    with pytest.raises(InvalidFinalKmError):
+        await repo.add_final_km("a", 999.0)
+
+    # Sem deslocamento a eficiência anterior é mantida
+    week = await repo.add_final_km("a", 1000.0)
+    assert week.eficiencia == 0.0
+    week = await repo.add_final_km("a", 1400.0)
+    assert week.eficiencia == 20.0
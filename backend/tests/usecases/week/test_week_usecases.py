@@ -95,6 +95,48 @@ async def test_get_week_by_id(week_repository, test_user):
     assert result.title == created_week.title
 
 
+@pytest.mark.asyncio
+async def test_get_week_by_id_hydrates_numeric_fields(week_repository, test_user):
+    """Testa se a leitura do banco entrega valores numéricos e timestamps preservados"""
+    week = create_test_week(test_user.id)
+    await week_repository.create(week)
+
+    result = await week_repository.get_by_id(week.id)
+
+    assert isinstance(result.kmAtual, float)
+    assert result.kmAtual == 1000.0
+    assert result.custo == 150.0
+    assert result.litrosAbastecidos == 30.5
+    assert result.eficiencia == 0.0
+    assert result.created_at is not None
+    assert result.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_integer_columns_round_trip_exactly(week_repository, test_user):
+    """Testa a conversão para metros, mililitros e centavos: ida e volta exatas, metade para cima"""
+    week = create_test_week(test_user.id)
+    week.kmAtual, week.custo, week.litrosAbastecidos = 123456.789, 12.345, 0.029
+    await week_repository.create(week)
+
+    result = await week_repository.get_by_id(week.id)
+
+    assert (result.kmAtual, result.custo, result.litrosAbastecidos) == (123456.789, 12.35, 0.029)
+
+
+@pytest.mark.asyncio
+async def test_add_final_km_stores_high_efficiency(week_repository, test_user):
+    """Testa eficiências acima de 999.99 km/l, que não cabiam na antiga coluna Numeric(5, 2)"""
+    week = create_test_week(test_user.id)
+    week.litrosAbastecidos = 0.3
+    await week_repository.create(week)
+
+    result = await week_repository.add_final_km(week.id, 1500.0)
+
+    assert result.eficiencia == 1666.67
+    assert (await week_repository.get_analytics(test_user.id)).media_eficiencia == 1666.67
+
+
 @pytest.mark.asyncio
 async def test_get_week_by_id_not_found(week_repository):
     """Testa o caso de uso para obter um registro de abastecimento com ID inexistente"""
@@ -173,8 +215,8 @@ async def test_add_final_km(week_repository, test_user):
     """Testa o caso de uso para adicionar quilometragem final e calcular eficiência"""
     # Cria um registro com km inicial 1000 e 30.5 litros
     week = create_test_week(test_user.id)
-    week.kmAtual = "1000"
-    week.litrosAbastecidos = "30.5"
+    week.kmAtual = 1000.0
+    week.litrosAbastecidos = 30.5
     
     created_week = await week_repository.create(week)
     
@@ -207,5 +249,310 @@ async def test_add_final_km_not_found(week_repository):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_add_final_km_rejects_lower_km(week_repository, test_user):
+    """Testa que km final menor que o inicial é recusado sem alterar o registro nem a rollup"""
+    from freeroad.domain.repositories.week_repository import InvalidFinalKmError
+
+    created_week = await week_repository.create(create_test_week(test_user.id))
+    before = await week_repository.get_analytics(test_user.id)
+
+    with pytest.raises(InvalidFinalKmError) as error:
+        await AddFinalKmUseCase(week_repository).execute(created_week.id, 900.0)
+
+    assert error.value.field == "final_km"
+    assert float((await week_repository.get_by_id(created_week.id)).kmFinal) == 0.0
+    assert await week_repository.get_analytics(test_user.id) == before
+
+
+@pytest.mark.asyncio
+async def test_calculate_average_efficiency_matches_in_memory(week_repository, test_user):
+    """Testa se a agregação em SQL e a vetorizada em memória dão o mesmo resultado"""
+    from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
+    from freeroad.usecases.week.calculate_average_efficiency import CalculateAverageEfficiencyUseCase
+
+    memory_repository = InMemoryWeekRepository()
+    samples = [
+        # (kmAtual, kmFinal, custo, litros)
+        ("1000", "1400.5", "250.90", "32.4"),
+        ("2000", "2333.33", "199.99", "27.123"),
+        ("3000", "0", "120.10", "15.5"),  # ainda sem km final
+        ("4000", "4000", "80.00", "10"),  # sem deslocamento
+    ]
+    for km_atual, km_final, custo, litros in samples:
+        week = create_test_week(test_user.id)
+        week.kmAtual, week.custo, week.litrosAbastecidos = float(km_atual), float(custo), float(litros)
+        for repository in (week_repository, memory_repository):
+            copy = create_test_week(test_user.id)
+            copy.id = week.id
+            copy.kmAtual, copy.custo, copy.litrosAbastecidos = float(km_atual), float(custo), float(litros)
+            await repository.create(copy)
+            if km_final != "0":
+                await repository.add_final_km(week.id, float(km_final))
+
+    sql_result = await CalculateAverageEfficiencyUseCase(week_repository).execute(test_user.id)
+    memory_result = await CalculateAverageEfficiencyUseCase(memory_repository).execute(test_user.id)
+
+    assert sql_result == memory_result
+    assert sql_result.total_custo == 650.99
+    assert sql_result.total_litros == 85.023
+    assert sql_result.total_distancia == 733.83
+    assert sql_result.media_eficiencia == pytest.approx((12.36 + 12.29) / 2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_calculate_average_efficiency_without_weeks(week_repository):
+    """Testa os indicadores de um usuário sem registros"""
+    from freeroad.usecases.week.calculate_average_efficiency import CalculateAverageEfficiencyUseCase
+
+    result = await CalculateAverageEfficiencyUseCase(week_repository).execute("usuario-sem-registros")
+
+    assert result.media_eficiencia is None
+    assert result.total_custo == 0
+    assert result.total_distancia == 0
+    assert result.total_litros == 0
+
+
+@pytest.mark.asyncio
+async def test_fuel_stats_rollup_follows_writes(week_repository, test_user):
+    """Testa se a rollup user_fuel_stats acompanha create, add_final_km e delete"""
+    weeks = []
+    for km_atual, litros in [("1000", "40"), ("2000", "25"), ("3000", "50")]:
+        week = create_test_week(test_user.id)
+        week.kmAtual, week.litrosAbastecidos = float(km_atual), float(litros)
+        weeks.append(await week_repository.create(week))
+
+    await week_repository.add_final_km(weeks[0].id, 1500.0)  # 12.5 km/l
+    await week_repository.add_final_km(weeks[1].id, 2250.0)  # 10.0 km/l
+    await week_repository.add_final_km(weeks[1].id, 2300.0)  # corrige para 12.0 km/l
+    await week_repository.add_final_km(weeks[2].id, 3700.0)  # 14.0 km/l
+    await week_repository.delete(weeks[2].id)
+
+    incremental = await week_repository.get_analytics(test_user.id)
+
+    assert incremental.total_custo == 300.0
+    assert incremental.total_litros == 65.0
+    assert incremental.total_distancia == 800.0
+    assert incremental.media_eficiencia == 12.25
+    assert incremental.variancia_eficiencia == pytest.approx(0.0625)
+
+    await week_repository.rebuild_stats()
+    assert await week_repository.get_analytics(test_user.id) == incremental
+
+
+@pytest.mark.asyncio
+async def test_add_final_km_many_updates_rollup(week_repository, test_user):
+    """Testa a atualização em lote: resultado por registro e rollup igual à recalculada"""
+    from freeroad.domain.repositories.week_repository import InvalidFinalKmError
+    from freeroad.usecases.week.add_final_km_batch import AddFinalKmBatchUseCase
+
+    weeks = []
+    for km_atual, litros in [("1000", "40"), ("2000", "25"), ("3000", "50")]:
+        week = create_test_week(test_user.id)
+        week.kmAtual, week.litrosAbastecidos = float(km_atual), float(litros)
+        weeks.append(await week_repository.create(week))
+
+    results = await AddFinalKmBatchUseCase(week_repository).execute({
+        weeks[0].id: 1500.0,  # 12.5 km/l
+        weeks[1].id: 1900.0,  # menor que kmAtual
+        "id-inexistente": 1000.0,
+        weeks[2].id: 3700.0,  # 14.0 km/l
+    })
+
+    assert float(results[weeks[0].id].week.eficiencia) == 12.5
+    assert float(results[weeks[2].id].week.eficiencia) == 14.0
+    assert isinstance(results[weeks[1].id].error, InvalidFinalKmError)
+    assert results[weeks[1].id].week is None
+    assert results["id-inexistente"] == ("id-inexistente", None, None)
+    assert float((await week_repository.get_by_id(weeks[1].id)).kmFinal) == 0.0
+
+    incremental = await week_repository.get_analytics(test_user.id)
+    assert incremental.total_distancia == 1200.0
+    assert incremental.media_eficiencia == 13.25
+
+    await week_repository.rebuild_stats()
+    assert await week_repository.get_analytics(test_user.id) == incremental
+
+
+@pytest.mark.asyncio
+async def test_version_grows_on_every_write(week_repository, test_user):
+    """Testa se a versão do usuário cresce a cada escrita e nunca volta (nem após rebuild)"""
+    from freeroad.domain.repositories.week_repository import InvalidFinalKmError
+
+    versions = [await week_repository.get_version(test_user.id)]
+    week = await week_repository.create(create_test_week(test_user.id))
+    versions.append(await week_repository.get_version(test_user.id))
+    await week_repository.add_final_km(week.id, 1500.0)
+    versions.append(await week_repository.get_version(test_user.id))
+
+    with pytest.raises(InvalidFinalKmError):
+        await week_repository.add_final_km(week.id, 10.0)
+    assert await week_repository.get_version(test_user.id) == versions[-1]
+
+    await week_repository.delete(week.id)
+    versions.append(await week_repository.get_version(test_user.id))
+    await week_repository.rebuild_stats()
+    versions.append(await week_repository.get_version(test_user.id))
+
+    assert versions[0] == 0
+    assert versions == sorted(set(versions))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("period", ["week", "month"])
+async def test_fuel_series_matches_in_memory(week_repository, test_user, period):
+    """Testa se a série agrupada no banco é igual à calculada com NumPy"""
+    from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
+    from freeroad.usecases.week.get_fuel_series import GetFuelSeriesUseCase
+
+    memory_repository = InMemoryWeekRepository()
+    dates = [datetime(2024, 12, 29, 22), datetime(2024, 12, 30, 7), datetime(2025, 1, 31, 23), datetime(2025, 2, 3)]
+    for i, created_at in enumerate(dates):
+        week = create_test_week(test_user.id)
+        week.created_at = week.updated_at = created_at
+        week.custo = 100 + i * 10.25
+        if i % 2 == 0:
+            week.kmFinal = float(1000 + 300 + i * 20)
+            week.eficiencia = round((300 + i * 20) / 30.5, 2)
+        await week_repository.create(week)
+        await memory_repository.create(week)
+
+    sql_series = await GetFuelSeriesUseCase(week_repository).execute(test_user.id, period)
+    memory_series = await GetFuelSeriesUseCase(memory_repository).execute(test_user.id, period)
+
+    assert len(sql_series) == (4 if period == "week" else 3)
+    assert sql_series == memory_series
+    assert sum(p.registros for p in sql_series) == 4
+
+    ranged = await week_repository.get_series(test_user.id, period, start=datetime(2025, 1, 1), end=datetime(2025, 2, 3))
+    assert ranged == await memory_repository.get_series(test_user.id, period, start=datetime(2025, 1, 1), end=datetime(2025, 2, 3))
+    assert sum(p.registros for p in ranged) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_weeks_bulk_in_chunks(week_repository, test_user, monkeypatch):
+    """Testa a inserção em lote dividida em vários INSERTs e a rollup resultante"""
+    from freeroad.infra.repositories.sqlalchemy import sqlalchemy_week_repository
+    from freeroad.usecases.week.create_weeks_bulk import CreateWeeksBulkUseCase
+
+    monkeypatch.setattr(sqlalchemy_week_repository, "BULK_INSERT_CHUNK", 2)
+    weeks = [create_test_week(test_user.id) for _ in range(5)]
+
+    created = await CreateWeeksBulkUseCase(week_repository).execute(weeks)
+
+    assert created == 5
+    assert len(await week_repository.get_by_user_id(test_user.id)) == 5
+    incremental = await week_repository.get_analytics(test_user.id)
+    assert incremental.total_custo == 750.0
+    assert incremental.total_litros == 152.5
+    await week_repository.rebuild_stats(test_user.id)
+    assert await week_repository.get_analytics(test_user.id) == incremental
+
+
+@pytest.mark.asyncio
+async def test_export_weeks_streams_batches(week_repository, test_user):
+    """Testa a leitura em lotes por cursor, do mais antigo para o mais recente"""
+    from freeroad.usecases.week.export_weeks import ExportWeeksUseCase
+
+    weeks = []
+    for day in range(5):
+        week = create_test_week(test_user.id)
+        week.created_at = week.updated_at = datetime(2025, 1, 1 + day)
+        weeks.append(week)
+    await week_repository.create_many(list(reversed(weeks)))
+
+    batches = [batch async for batch in ExportWeeksUseCase(week_repository).execute(test_user.id, batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [w.id for batch in batches for w in batch] == [w.id for w in weeks]
+    assert isinstance(batches[0][0].kmAtual, float)
+
+
+@pytest.mark.asyncio
+async def test_week_changes_feed_pages_with_tombstones(week_repository, test_user):
+    """Testa o feed de alterações: criações, atualizações e remoções em ordem, paginado por keyset"""
+    from freeroad.infra.repositories.in_memory_week_repository import InMemoryWeekRepository
+    from freeroad.usecases.week.get_changes import GetWeekChangesUseCase
+
+    memory_repository = InMemoryWeekRepository()
+    weeks = []
+    for day in range(3):
+        week = create_test_week(test_user.id)
+        week.created_at = week.updated_at = datetime(2025, 1, 1 + day)
+        weeks.append(week)
+        await week_repository.create(week)
+        await memory_repository.create(week)
+    for repository in (week_repository, memory_repository):
+        await repository.delete(weeks[1].id)
+    for repository in (week_repository, memory_repository):
+        await repository.add_final_km(weeks[0].id, 1300.0)
+
+    usecase = GetWeekChangesUseCase(week_repository)
+    changes = await usecase.execute(test_user.id)
+    assert [(c.id, c.deleted) for c in changes] == [(weeks[2].id, False), (weeks[1].id, True), (weeks[0].id, False)]
+    assert changes[2].week.kmFinal == 1300.0
+    assert [c.key for c in changes] == sorted(c.key for c in changes)
+
+    memory_changes = await GetWeekChangesUseCase(memory_repository).execute(test_user.id)
+    assert [(c.id, c.deleted) for c in memory_changes] == [(c.id, c.deleted) for c in changes]
+
+    paged, after = [], None
+    while page := await usecase.execute(test_user.id, after=after, limit=1):
+        paged.extend(page)
+        after = page[-1].key
+    assert [c.key for c in paged] == [c.key for c in changes]
+    assert [c.key for c in await usecase.execute(test_user.id, after=changes[0].key)] == [c.key for c in changes[1:]]
+
+
+@pytest.mark.asyncio
+async def test_purge_week_tombstones(week_repository, test_user):
+    """Testa a remoção dos registros de remoção mais antigos que o limite"""
+    week = create_test_week(test_user.id)
+    await week_repository.create(week)
+    await week_repository.delete(week.id)
+
+    assert await week_repository.purge_tombstones(datetime(2000, 1, 1)) == 0
+    assert len(await week_repository.get_changes(test_user.id)) == 1
+    assert await week_repository.purge_tombstones(datetime.now()) == 1
+    assert await week_repository.get_changes(test_user.id) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_keep_rollup_consistent(setup_engine, week_repository, test_user):
+    """Testa que atualizações simultâneas do mesmo registro não desalinham a rollup"""
+    import asyncio
+    from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
+
+    engine, async_session = setup_engine
+    week = create_test_week(test_user.id)
+    await week_repository.create(week)
+
+    async def update(custo: float):
+        async with async_session() as session:
+            changed = create_test_week(test_user.id)
+            changed.id = week.id
+            changed.custo = custo
+            return await SQLAlchemyWeekRepository(session).update(changed)
+
+    try:
+        results = await asyncio.gather(*(update(100.0 + i) for i in range(4)))
+    finally:
+        await engine.dispose()
+
+    assert all(result is not None for result in results)
+    incremental = await week_repository.get_analytics(test_user.id)
+    await week_repository.rebuild_stats(test_user.id)
+    assert await week_repository.get_analytics(test_user.id) == incremental
+    assert incremental.total_custo == (await week_repository.get_by_id(week.id)).custo
+
 
+def test_final_km_miss_without_rule_violation_raises():
+    """Testa que um UPDATE sem efeito vira InvalidFinalKmError mesmo quando as regras em Python passam"""
+    from types import SimpleNamespace
+    from freeroad.domain.repositories.week_repository import InvalidFinalKmError
+    from freeroad.infra.repositories.sqlalchemy.sqlalchemy_week_repository import SQLAlchemyWeekRepository
 
+    assert SQLAlchemyWeekRepository._final_km_miss(None, 1500.0) is None
+    with pytest.raises(InvalidFinalKmError) as error:
+        SQLAlchemyWeekRepository._final_km_miss(SimpleNamespace(km_atual_m=1_000_000, litros_ml=30_500), 1500.0)
+    assert error.value.field == "final_km"